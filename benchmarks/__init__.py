@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+# Standalone measurement scripts — run with `python -m benchmarks.<name>` from the repo root.
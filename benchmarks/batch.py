@@ -0,0 +1,71 @@
+# benchmarks/batch.py
+# Parity check + benchmark for vectorized batch scoring against per-row score().
+#   python -m benchmarks.batch [--cases 400] [--repeat 3]
+#
+# Scrapper.score_batch() must return exactly the rows of [score(item) for item in
+# items] — same best match, same confidence (including int vs float), same status.
+# Timings show where batching pays: result lists shared across rows (as after
+# SearchPlan fan-out) versus every row with its own results.
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+
+from modules.batch import MIN_REUSE, reuse
+from modules.scrapper import Scrapper
+from modules.similarity import available_backends
+
+from .fixtures import citation_pairs, wide_result_cases
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Parity + speed check for vectorized batch scoring.")
+    ap.add_argument("--cases", type=int, default=400)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    suites = {
+        "shared result lists": wide_result_cases(args.cases * 4, shared=True),
+        "wide result lists":   wide_result_cases(args.cases),
+        "citation pairs":      citation_pairs(args.cases * 4),
+    }
+    print(f"🧪 comparator() batches when results recur ×{MIN_REUSE} or more")
+
+    ok = True
+    for backend in available_backends():
+        scrapper = Scrapper(similarity_backend=backend)
+        print(f"\n🔬 {backend}")
+        for label, cases in suites.items():
+            candidates = sum(len(c['matches']) for c in cases)
+            with contextlib.redirect_stdout(io.StringIO()):
+                ref = [scrapper.score(c) for c in cases]
+                new = scrapper.score_batch(cases)
+                t_ref = timed(lambda: [scrapper.score(c) for c in cases], args.repeat)
+                t_new = timed(lambda: scrapper.score_batch(cases), args.repeat)
+
+            bad = sum(
+                1 for a, b in zip(ref, new)
+                if a != b or type(a['confidence_raw']) is not type(b['confidence_raw'])
+            ) + abs(len(ref) - len(new))
+            ok &= not bad
+            print(
+                f"   {'✅' if not bad else '❌'} {label:<20} {len(cases):>5} rows / {candidates:>6} candidates (reuse ×{reuse(cases):5.1f})  "
+                f"score() {t_ref*1000:8.1f} ms  score_batch() {t_new*1000:8.1f} ms  ×{t_ref / t_new:4.1f}  mismatches {bad}"
+            )
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+# benchmarks/columnar.py
+# Parity check + benchmark for Parquet / Feather / Arrow inputs and exports (modules/columnar.py).
+#   python -m benchmarks.columnar [--rows 20000] [--chunksize 997]
+#
+# The same sheet saved as CSV and as each columnar format must give the same Scanner
+# records, read whole (Validator.create_sheet(mapped=True)) and streamed
+# (Validator.read_chunks()); the probe must show every column; and Scrapper.export()'s
+# table must read back unchanged. Without pyarrow installed the check is skipped.
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from modules import columnar
+from modules.scanner import Scanner
+from modules.validators import Validator
+
+from .fixtures import case_sheet
+
+
+def arrow_sheet(rows: int):
+    """case_sheet() with its mixed case column as text, which Arrow needs (CSV writes it the same)."""
+    sheet = case_sheet(rows)
+    cases = sheet["Case Number"].astype(object)
+    return sheet.assign(**{"Case Number": cases.map(lambda v: v if v is None or isinstance(v, str) else str(v))})
+
+
+def numeric_cases(sheet):
+    """A numeric case column with blanks: float in every format."""
+    return sheet.assign(**{"Case Number": [None if i % 7 == 0 else 1000 + i for i in range(len(sheet))]})
+
+
+def records(path: Path, chunksize: int) -> tuple:
+    validate = Validator(str(path), "Case Number", "Citation")
+    with contextlib.redirect_stdout(io.StringIO()):
+        start  = time.perf_counter()
+        whole  = Scanner("Case Number", "Citation").file_extractor(validate.create_sheet(mapped=True))
+        t      = time.perf_counter() - start
+        stream = Scanner("Case Number", "Citation").stream_extractor(validate.read_chunks(chunksize))
+        probe  = validate.probe()
+    return whole, stream, probe, t
+
+
+def check(label: str, sheet, directory: Path, chunksize: int) -> bool:
+    writers = {
+        ".csv":     lambda p: sheet.to_csv(p, index=False),
+        ".parquet": lambda p: sheet.to_parquet(p, index=False, row_group_size=1_000),
+        ".feather": lambda p: sheet.to_feather(p, chunksize=1_500),
+        ".arrow":   lambda p: sheet.to_feather(p, chunksize=1_500),
+    }
+    base, ok = None, True
+    for suffix, write in writers.items():
+        path = directory / f"{label}{suffix}"
+        write(path)
+        whole, stream, probe, t = records(path, chunksize)
+        if base is None:
+            base, t_csv = whole, t
+        same = whole == base and stream == base and list(probe.columns) == list(sheet.columns)
+        ok   = ok and same
+        print(
+            f"   {label:<8} {suffix:<9} {len(whole):6} records  mapped read {t * 1000:7.1f} ms  ×{t_csv / t:5.1f}  "
+            f"{'✅ identical' if same else '❌ records / probe differ from CSV'}"
+        )
+    return ok
+
+
+def check_export(directory: Path) -> bool:
+    rows = [
+        {"excel_row": i + 2, "original_case": f"TAT/E{i}/2024", "case_name": f"PARTY {i} VS KRA",
+         "status": "VERIFIED MATCH" if i % 3 else "NOT FOUND", "confidence_raw": None if i % 5 == 0 else 80.5,
+         "best_match_kra_citation": "N/A", "best_match_kra_ref": "N/A", "best_match_kra_assignee": "N/A",
+         "matches_found": i % 4}
+        for i in range(500)
+    ]
+    frame, ok = columnar.results_frame(rows), True
+    for fmt, suffix in columnar.FORMATS.items():
+        path = directory / f"results{suffix}"
+        columnar.write(frame, path, fmt)
+        same = columnar.read(path).equals(frame)
+        ok   = ok and same
+        print(f"   export   {suffix:<9} {len(frame):6} rows  {'✅ reads back unchanged' if same else '❌ round trip differs'}")
+    return ok
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Parity + benchmark for columnar inputs and exports.")
+    ap.add_argument("--rows", type=int, default=20_000)
+    ap.add_argument("--chunksize", type=int, default=997)
+    args = ap.parse_args(argv)
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("⚠️ pyarrow is not installed; columnar parity check skipped")
+        return 0
+
+    sheet = arrow_sheet(args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        ok = check("text", sheet, Path(tmp), args.chunksize)
+        ok = check("numeric", numeric_cases(sheet), Path(tmp), args.chunksize) and ok
+        ok = check_export(Path(tmp)) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+# benchmarks/excel.py
+# Parity check + benchmark for XLSX reads: openpyxl vs calamine (modules/excel.py).
+#   python -m benchmarks.excel [--rows 100000] [--repeat 1] [--path sheet.xlsx]
+#
+# Both engines must give the same frame, for the whole sheet and for the mapped
+# columns Validator.create_sheet(mapped=True) asks for. Without python-calamine
+# installed only the openpyxl timings are printed.
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from modules import excel
+
+from .fixtures import case_sheet
+
+
+def timed(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start  = time.perf_counter()
+        result = fn()
+        best   = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(path: Path, repeat: int) -> bool:
+    mapped = lambda h: str(h).strip() in {"Case Number", "Citation"}
+    reads  = {"whole sheet": {}, "mapped columns": {"usecols": mapped}}
+    ok     = True
+
+    for label, kwargs in reads.items():
+        t_open, base = timed(lambda: excel.read_excel(path, engine="openpyxl", **kwargs), repeat)
+        line = f"⏱  {label:<15} {len(base)} rows  openpyxl {t_open:7.2f} s"
+        if excel.available():
+            t_cal, frame = timed(lambda: excel.read_excel(path, engine="calamine", **kwargs), repeat)
+            same = frame.equals(base) and list(frame.dtypes) == list(base.dtypes)
+            ok   = ok and same
+            line += f"  calamine {t_cal:7.2f} s  ×{t_open / t_cal:5.1f}  {'✅ identical' if same else '❌ frames differ'}"
+        print(line)
+
+    if not excel.available():
+        print("⚠️ python-calamine is not installed (pip install '.[fast]'); openpyxl only")
+    return ok
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Parity + benchmark for XLSX read engines.")
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--repeat", type=int, default=1)
+    ap.add_argument("--path", type=Path, help="an existing workbook to read instead of a generated one")
+    args = ap.parse_args(argv)
+
+    if args.path:
+        return 0 if run(args.path, args.repeat) else 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cases.xlsx"
+        print(f"Writing a {args.rows}-row workbook…")
+        case_sheet(args.rows).to_excel(path, index=False)
+        return 0 if run(path, args.repeat) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+# benchmarks/fetch.py
+# End-to-end load benchmark of the iLaw fetch layer against benchmarks.mock_ilaw.
+#   python -m benchmarks.fetch [--records 400] [--concurrency 16] [--latency 0.05]
+#                              [--error-rate 0.02] [--expire-every 150] [--engines extractor,parallel,stream]
+#
+# Each engine gets a fresh Scrapper, cache directory and session store, so every run
+# logs in for real and every search goes over the wire. Reported per engine:
+# wall time, records/s, request latency p50/p95/p99, HTTP statuses seen, re-logins,
+# and how many rows came back with a different match count than the server holds.
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from modules import RateController, SearchCache, Scrapper
+from modules.parsers import parse_results
+from modules.session import SessionStore
+
+from .mock_ilaw import MockILaw
+
+
+class RecordingRateController(RateController):
+    """RateController that also keeps every request latency and status for reporting."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latencies = []
+        self.statuses  = Counter()
+
+    def release(self, latency: float | None, status: int | None) -> None:
+        with self._lock:
+            if latency is not None:
+                self.latencies.append(latency)
+            self.statuses[status or "timeout"] += 1
+        super().release(latency, status)
+
+
+def percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def records(count: int, duplicates: float = 0.1) -> list:
+    """Scanner-shaped records; a share of them repeat an earlier keyword like real sheets do."""
+    step  = round(1 / duplicates) if duplicates else 0
+    items = []
+    for i in range(count):
+        n = i // 2 if step and i % step == step - 1 else i
+        items.append({
+            "excel_row":   i + 2,
+            "case_number": f"TAT/E{n:03d}/2024",
+            "citation":    f"BENCH PARTY {n} VS COMMISSIONER OF DOMESTIC TAXES",
+            "keyword":     f"E{n:03d} of 2024",
+        })
+    return items
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Engines — each takes (scrapper, items, concurrency) and returns result rows
+# ─────────────────────────────────────────────────────────────────────────────
+
+def run_extractor(scrapper, items, concurrency):
+    scrapper.data = items
+    return scrapper.extractor(concurrency=concurrency) or []
+
+
+def run_parallel(scrapper, items, concurrency):
+    from views.reconciliation import parallel_extract
+    return parallel_extract(scrapper, items, workers=concurrency)
+
+
+def run_stream(scrapper, items, concurrency):
+    return list(scrapper.stream(items, concurrency=concurrency))
+
+
+ENGINES = {
+    "extractor": run_extractor,
+    "parallel":  run_parallel,
+    "stream":    run_stream,
+}
+
+
+def bench_engine(name: str, mock: MockILaw, items: list, concurrency: int, rate: float | None, verbose: bool) -> dict | None:
+    with tempfile.TemporaryDirectory() as tmp:
+        throttle = RecordingRateController(max_window=concurrency, **({"rate": rate} if rate else {}))
+        scrapper = Scrapper(
+            auth_url=mock.auth_url,
+            url=mock.search_url,
+            username=mock.username,
+            password=mock.password,
+            cache=SearchCache(f"{tmp}/cache"),
+            throttle=throttle,
+            session_store=SessionStore(f"{tmp}/sessions"),
+        )
+
+        out = sys.stdout if verbose else io.StringIO()
+        with contextlib.redirect_stdout(out):
+            if not scrapper.authenticator():
+                print(f"❌ {name}: could not log in to the mock server")
+                return None
+            before = Counter(mock.stats)
+            start  = time.perf_counter()
+            try:
+                rows = ENGINES[name](scrapper, items, concurrency)
+            except ImportError as e:
+                print(f"   {name:<10} skipped ({e})", file=sys.__stdout__)
+                return None
+            elapsed = time.perf_counter() - start
+
+    expected = {i["excel_row"]: len(parse_results(mock.page_for(i["keyword"]))) for i in items}
+    got      = {r["excel_row"]: r.get("matches_found", 0) for r in rows}
+    return {
+        "engine":    name,
+        "rows":      len(rows),
+        "elapsed":   elapsed,
+        "latencies": throttle.latencies,
+        "statuses":  throttle.statuses,
+        "relogins":  scrapper.sessions.relogins,
+        "wrong":     sum(1 for row, n in expected.items() if row in got and got[row] != n),
+        "missing":   sum(1 for row in expected if row not in got),
+        "server":    Counter(mock.stats) - before,
+    }
+
+
+def report(result: dict, total: int) -> None:
+    lat = result["latencies"]
+    statuses = ", ".join(f"{k}×{v}" for k, v in sorted(result["statuses"].items(), key=lambda kv: str(kv[0])))
+    print(
+        f"   {result['engine']:<10} {result['elapsed']:7.2f} s  {total / result['elapsed']:8.1f} rec/s  "
+        f"p50 {percentile(lat, 50)*1000:6.1f}  p95 {percentile(lat, 95)*1000:6.1f}  p99 {percentile(lat, 99)*1000:6.1f} ms"
+    )
+    print(
+        f"   {'':<10} requests {len(lat)} [{statuses}]  re-logins {result['relogins']}  "
+        f"expiries {result['server']['expiries']}  wrong {result['wrong']}  missing {result['missing']}"
+    )
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Load-test the iLaw fetch layer against a local mock server.")
+    ap.add_argument("--records", type=int, default=400)
+    ap.add_argument("--concurrency", type=int, default=16)
+    ap.add_argument("--latency", type=float, default=0.05)
+    ap.add_argument("--jitter", type=float, default=0.02)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--expire-every", type=int, default=0)
+    ap.add_argument("--rate", type=float, default=None, help="starting req/s for the rate controller")
+    ap.add_argument("--engines", default=",".join(ENGINES))
+    ap.add_argument("--verbose", action="store_true", help="show Scrapper output")
+    args = ap.parse_args(argv)
+
+    items = records(args.records)
+    print(
+        f"🧪 {len(items)} records · concurrency {args.concurrency} · latency {args.latency}±{args.jitter}s · "
+        f"errors {args.error_rate:.0%} · expire every {args.expire_every or '—'} searches"
+    )
+
+    ok = True
+    with MockILaw(
+        latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate, expire_every=args.expire_every,
+    ) as mock:
+        for name in args.engines.split(","):
+            name = name.strip()
+            if name not in ENGINES:
+                print(f"   {name:<10} unknown engine (choose from {', '.join(ENGINES)})")
+                ok = False
+                continue
+            result = bench_engine(name, mock, items, args.concurrency, args.rate, args.verbose)
+            if result is None:
+                continue
+            report(result, len(items))
+            # Without injected errors every row must come back with the server's match count
+            if not args.error_rate and (result["wrong"] or result["missing"]):
+                ok = False
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+# benchmarks/fixtures.py
+# HTML fixtures for parser parity checks and benchmarks.
+
+import pickle
+import random
+from pathlib import Path
+
+PARTIES = [
+    "OSHWAL LLP", "VICTOR OKOTH ONUNGA", "STAR RENTALS LIMITED", "VITALAC INTERNATIONAL LIMITED",
+    "IPROCURE LIMITED", "PROMPT COMMODITIES LIMITED", "TWAWEZA KENYA APPAREL (EPZ) LTD",
+    "VARIOTECH ENTERPRISES LIMITED", "INVEST AND GROW SACCO LTD", "RECKITT BENCKISER SERVICES",
+]
+RESPONDENTS = [
+    "COMMISSIONER OF DOMESTIC TAXES", "COMMISSIONER OF CUSTOMS & BORDER CONTROL",
+    "KENYA REVENUE AUTHORITY", "COMMISIONER OF LEGAL SERVICES & BOARD COORDINATION",
+]
+COURTS = ["TAT", "HCCOMMITA", "HCCHRPET", "CACA", "HCITA"]
+
+
+PAGES = Path(__file__).parent / "pages"   # iLaw search pages saved by the pre-SearchCache cache
+
+
+def cached_pages(directory=PAGES) -> dict:
+    """Raw HTML pages stored in the legacy {timestamp, data} blobs, by file stem."""
+    pages = {}
+    for path in sorted(Path(directory).glob("*.cache")):
+        try:
+            with open(path, "rb") as fh:
+                blob = pickle.load(fh)
+        except Exception:
+            continue
+        if isinstance(blob, dict) and isinstance(blob.get("data"), str):
+            pages[path.stem] = blob["data"]
+    return pages
+
+
+def result_row(rng: random.Random, i: int) -> str:
+    party  = rng.choice(PARTIES)
+    resp   = rng.choice(RESPONDENTS)
+    court  = rng.choice(COURTS)
+    number = f"E{rng.randint(1, 999):03d}"
+    year   = rng.choice([2023, 2024, 2025, 2026])
+    cite   = f"{party} VS {resp} {court} {number} OF {year}"
+    short  = cite[:28] + "..."
+
+    style = i % 4
+    if style == 0:     # tooltip span carries the full citation
+        cell = f'<span class="tooltipTable" tooltiptitle="{cite.replace("&", "&amp;")}">{short.replace("&", "&amp;")}</span>'
+    elif style == 1:   # plain text split across inline tags and entities
+        cell = f'<a href="#">{party}</a> <b>VS</b>&nbsp;{resp.replace("&", "&amp;")} {court}/{number}/{year}'
+    elif style == 2:   # empty tooltip falls back to cell text
+        cell = f'<span class="tooltipTable other" tooltiptitle="">{cite.replace("&", "&amp;")}</span>'
+    else:              # non-ASCII noise that _clean_text strips
+        cell = f'\n  {party} – VS –  {resp.replace("&", "&amp;")}  <!-- note -->\n'
+
+    return (
+        f'<tr class="row-{i}"><td><input type="checkbox" value="{i}"></td>'
+        f'<td>{cell}</td>'
+        f'<td> {court}/{number}/{year} </td>'
+        f'<td><span>Jane</span> Doe {i}</td></tr>'
+    )
+
+
+def result_tables(count: int = 50, rows: int = 25, seed: int = 7) -> list:
+    """Synthetic search-response fragments shaped like the iLaw AJAX `html` payload."""
+    rng    = random.Random(seed)
+    tables = []
+    for t in range(count):
+        body = "".join(result_row(rng, t * rows + r) for r in range(rng.randint(0, rows)))
+        if t % 5 == 0:
+            tables.append(body)   # bare <tr> fragment, no <table>
+        else:
+            tables.append(
+                '<div class="table-responsive"><table class="table"><thead><tr><th></th>'
+                '<th>Citation</th><th>Reference</th><th>Assignee</th></tr></thead>'
+                f'<tbody>{body}<tr><td colspan="4">No more results</td></tr></tbody></table></div>'
+            )
+    return tables
+
+
+def malformed_tables() -> dict:
+    """Broken result markup, where html.parser and the HTML5 builders build different trees."""
+    row = '<td>1</td><td>ABC LTD VS KRA</td><td>TAT/E1/2024</td><td>JOHN</td>'
+    return {
+        "unclosed td":         '<table><tr><td>1<td>ABC LTD VS KRA<td>TAT/E1/2024<td>JOHN</tr></table>',
+        "unclosed tr":         f'<table><tr>{row}<tr>{row}</table>',
+        "bare tr then table":  f'<tr>{row}</tr><table><tr>{row}</tr></table>',
+        "td outside tr":       '<table><td>1</td><td>ABC LTD VS KRA</td><td>TAT/E1/2024</td></table>',
+        "stray close":         f'<table><tr>{row}</td></tr></table>',
+        "nested table":        '<table><tr><td>1</td><td><table><tr><td>x</td></tr></table>ABC LTD VS KRA</td>'
+                               '<td>TAT/E1/2024</td></tr></table>',
+    }
+
+
+# Real KRA citations as returned by iLaw (see reconciliation_results.csv):
+# (citation, party, respondent, court, number, year)
+KRA_CITATIONS = [
+    ("NBI T.A.T NO. E1229 OF 2024. ATTA KENYA LIMITED (P051093777J) VS COMMISSIONER CUSTOMS AND BORDER CONTROL.",
+     "ATTA KENYA LIMITED", "COMMISSIONER CUSTOMS AND BORDER CONTROL", "TAT", "E1229", 2024),
+    ("NBI T.A.T NO. 721 OF 2023 AIRTEL NETWORKS KENYA LIMITED VS COMMISSIONER DOMESTIC TAXES.",
+     "AIRTEL NETWORKS KENYA LIMITED", "COMMISSIONER DOMESTIC TAXES", "TAT", "721", 2023),
+]
+
+
+def _typo(rng: random.Random, text: str) -> str:
+    if len(text) < 4:
+        return text
+    i = rng.randrange(1, len(text) - 2)
+    op = rng.choice(("swap", "drop", "double"))
+    if op == "swap":
+        return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+    if op == "drop":
+        return text[:i] + text[i + 1:]
+    return text[:i] + text[i] + text[i:]
+
+
+def citation_pairs(count: int = 400, seed: int = 11) -> list:
+    """
+    Scoring cases shaped like Scrapper.score() input: one sheet row against the
+    iLaw matches for its keyword, with the usual ways sheet entries drift from iLaw
+    (abbreviations, typos, dropped respondents, reordered parties, wrong party).
+    """
+    rng   = random.Random(seed)
+    cases = []
+    for i in range(count):
+        if i < len(KRA_CITATIONS) * 7:
+            kra_citation, party, resp, court, number, year = KRA_CITATIONS[i % len(KRA_CITATIONS)]
+        else:
+            party  = rng.choice(PARTIES)
+            resp   = rng.choice(RESPONDENTS)
+            court  = rng.choice(COURTS)
+            number = f"E{rng.randint(1, 999):03d}"
+            year   = rng.choice([2023, 2024, 2025, 2026])
+            kra_citation = f"{party} VS {resp} {court} {number} OF {year}"
+
+        variant = i % 7
+        if variant == 0:
+            sheet = kra_citation
+        elif variant == 1:
+            sheet = f"{party} vs {resp}".lower()
+        elif variant == 2:
+            sheet = f"{party.replace('LIMITED', 'LTD')} V {resp.replace('COMMISSIONER', 'COMM.')}"
+        elif variant == 3:
+            sheet = f"{_typo(rng, party)} VS {_typo(rng, resp)}"
+        elif variant == 4:
+            sheet = party
+        elif variant == 5:
+            sheet = f"{resp} VS {party}"
+        else:
+            sheet = f"{rng.choice(PARTIES)} VS {resp}"
+
+        others = [
+            {"kra_citation": f"{rng.choice(PARTIES)} VS {rng.choice(RESPONDENTS)} {rng.choice(COURTS)} E{rng.randint(1, 999):03d} OF {year}",
+             "kra_ref": f"{court}/E{rng.randint(1, 999):03d}/{year}", "kra_assignee": "JANE DOE"}
+            for _ in range(rng.randint(0, 3))
+        ]
+        target = {"kra_citation": kra_citation, "kra_ref": f"{court}/{number}/{year}", "kra_assignee": "JOHN DOE"}
+        cases.append({
+            "excel_row":      i + 2,
+            "original_case":  f"{court}/{number if variant != 6 else 'E' + str(rng.randint(1000, 1999))}/{year}",
+            "case_name":      sheet,
+            "search_keyword": f"{number} of {year}",
+            "matches":        [target] + others if i % 2 else others + [target],
+        })
+    return cases
+
+
+def wide_result_cases(count: int = 200, seed: int = 3, shared: bool = False) -> list:
+    """
+    Rows whose keyword is short enough ("E1 of 2024") that iLaw answers with a long
+    list of near-miss results; a third of them also contain the real case.
+    shared=True gives rows with the same keyword the same result list, as SearchPlan's
+    fan-out does.
+    """
+    rng   = random.Random(seed)
+    cases = []
+    by_keyword = {}
+    for i in range(count):
+        n, year = rng.randint(1, 9), rng.choice([2023, 2024])
+        matches = [
+            {
+                "kra_citation": f"{rng.choice(PARTIES)} VS {rng.choice(RESPONDENTS)} {rng.choice(COURTS)} E{n}{rng.randint(0, 99)} OF {rng.choice([2023, 2024])}",
+                "kra_ref":      f"{rng.choice(COURTS)}/E{n}{rng.randint(0, 99)}/{year}",
+                "kra_assignee": "JANE DOE",
+            }
+            for _ in range(rng.randint(20, 150))
+        ]
+        if i % 3 == 0:
+            matches.insert(rng.randrange(len(matches)), {
+                "kra_citation": f"{PARTIES[i % len(PARTIES)]} VS {RESPONDENTS[0]} TAT E{n} OF {year}",
+                "kra_ref":      f"TAT/E{n}/{year}",
+                "kra_assignee": "JOHN DOE",
+            })
+        cases.append({
+            "excel_row":      i + 2,
+            "original_case":  f"TAT/E{n}/{year}" if i % 2 else f"HCCOMMITA/{n}/{year}",
+            "case_name":      f"{PARTIES[i % len(PARTIES)]} VS {RESPONDENTS[0]}",
+            "search_keyword": f"E{n} of {year}" if i % 4 else "",
+            "matches":        by_keyword.setdefault(f"E{n} of {year}", matches) if shared else matches,
+        })
+    return cases
+
+
+CASE_FORMS = (
+    "{court}/E{n:03d}/{year}", "{court}/E{n}/{year}", "E{n:03d} of {year}", "e{n}/{year}", "E{n} {year}",
+    "E{n:03d}", "{n}/{year}", "{n}-{year}", "{court} NO. E{n} OF {year}", "{court}/{n}/{year}",
+    "{court} E{n} ({year})", "MISC {n} OF {year}", "{court}/{n}", "  {court}/E{n}/{year}  ",
+    "E{n}/{year}/X", "{court}-E{n}-{year}", "E١٢/{year}", "{court}/E{n}/٢٠٢٤", "{court}", "",
+    "{year}/E٢٠{n}", "e١٢{n}.12){year}", "{court} E{n} OF ٢٠٢٤ ({year})",   # non-ASCII digits in the CaseRef fallback
+)
+
+
+def case_sheet(count: int = 10_000, seed: int = 5):
+    """
+    An uploaded sheet as pandas reads it: case numbers in every shape the keyword
+    builder handles (and some it can't), blank and numeric cells, ragged citations.
+    """
+    import pandas as pd
+
+    rng = random.Random(seed)
+    cases, citations = [], []
+    for i in range(count):
+        year = rng.choice([2019, 2023, 2024, 2026])
+        form = rng.choice(CASE_FORMS)
+        case = form.format(court=rng.choice(COURTS), n=rng.randint(1, 1999), year=year)
+        if i % 53 == 0:
+            case = None
+        elif i % 61 == 0:
+            case = float(rng.randint(100, 9999))
+
+        party = rng.choice(PARTIES)
+        citation = rng.choice((
+            f"{party} VS {rng.choice(RESPONDENTS)}",
+            f"  {party}\tv.  {rng.choice(RESPONDENTS)} \n",
+            f"{party} VS KRA [{year}] KEHC {rng.randint(1, 9999)} (KLR)",
+            f"{party} {rng.randint(1, 99)} OF {year}",
+            "",
+        ))
+        citations.append(None if i % 47 == 0 else citation)
+        cases.append(case)
+    return pd.DataFrame({"No.": range(count), "Case Number": cases, "Citation": citations})
@@ -0,0 +1,276 @@
+# benchmarks/mock_ilaw.py
+# Local stand-in for ilaw.kra.go.ke so the fetch layer can be load-tested offline.
+#   python -m benchmarks.mock_ilaw [--port 8765] [--latency 0.05] [--error-rate 0.02] [--expire-every 200]
+#
+# Implements just enough of the real site for Scrapper:
+#   GET  /ilaw/users/login                     login form (username / password / hidden _token)
+#   POST /ilaw/users/login                     sets ILAWSESSID and redirects to the search page
+#   GET  /ilaw/search/universal                "logged in" landing page
+#   POST /ilaw/search/universal/1?keyword=...  AJAX search → {"html": ...}
+# Search responses replay the pages in benchmarks/pages/ plus synthetic result tables, picked
+# deterministically per keyword so every run sees the same data.
+
+import argparse
+import hashlib
+import json
+import random
+import secrets
+import sys
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from modules.planner import canonical_keyword
+
+from .fixtures import cached_pages, result_tables
+
+LOGIN_PATH  = "/ilaw/users/login"
+SEARCH_PATH = "/ilaw/search/universal"
+COOKIE      = "ILAWSESSID"
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><title>iLaw | Sign in</title></head><body>
+<form method="post" action="{action}">
+  <input type="hidden" name="_token" value="{token}">
+  <input type="text" name="username" id="username" placeholder="Username">
+  <input type="password" name="password" id="password">
+  {error}
+  <button type="submit">Sign in</button>
+</form>
+</body></html>"""
+
+HOME_PAGE = """<!DOCTYPE html>
+<html><head><title>iLaw</title></head><body>
+<nav><a href="/ilaw/users/logout">Logout</a></nav>
+<h1>Search Cases</h1>
+</body></html>"""
+
+
+class MockILaw:
+    """
+    Threaded HTTP server with fault injection:
+      latency / jitter   seconds added to every search (uniform ±jitter)
+      error_rate         fraction of searches answered with 503 / 429
+      expire_every       every N searches all live sessions are dropped (0 = never)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        username: str = "bench",
+        password: str = "bench",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        expire_every: int = 0,
+        seed: int = 7,
+        pages: list | None = None,
+    ):
+        self.username     = username
+        self.password     = password
+        self.latency      = latency
+        self.jitter       = jitter
+        self.error_rate   = error_rate
+        self.expire_every = expire_every
+        self.pages        = pages if pages is not None else list(cached_pages().values()) + result_tables()
+        self.token        = secrets.token_hex(8)
+        self.stats        = Counter()
+
+        self._rng      = random.Random(seed)
+        self._sessions = set()
+        self._lock     = threading.Lock()
+        self._server   = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread   = None
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Lifecycle
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def auth_url(self) -> str:
+        return f"{self.base_url}{LOGIN_PATH}"
+
+    @property
+    def search_url(self) -> str:
+        return f"{self.base_url}{SEARCH_PATH}/1?keyword="
+
+    def start(self) -> "MockILaw":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-ilaw", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Behaviour
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def page_for(self, keyword) -> str:
+        """The HTML a search for `keyword` always returns."""
+        if not self.pages:
+            return ""
+        digest = hashlib.md5(canonical_keyword(keyword).encode()).hexdigest()
+        return self.pages[int(digest, 16) % len(self.pages)]
+
+    def expire_sessions(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+            self.stats["expiries"] += 1
+
+    def _login(self, form: dict) -> str | None:
+        ok = (
+            form.get("_token") == self.token
+            and form.get("username") == self.username
+            and form.get("password") == self.password
+        )
+        sid = secrets.token_hex(16) if ok else None
+        with self._lock:
+            self.stats["logins" if ok else "failed_logins"] += 1
+            if sid:
+                self._sessions.add(sid)
+        return sid
+
+    def _search(self, sid: str | None) -> int:
+        """Applies latency and fault injection to one search; returns the status to answer with."""
+        with self._lock:
+            self.stats["searches"] += 1
+            n     = self.stats["searches"]
+            valid = sid in self._sessions
+            roll  = self._rng.random()
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+            if self.expire_every and n % self.expire_every == 0:
+                self._sessions.clear()
+                self.stats["expiries"] += 1
+
+        if delay:
+            time.sleep(delay)
+        if not valid:
+            status = 302
+        elif roll < self.error_rate:
+            status = 429 if roll < self.error_rate / 2 else 503
+        else:
+            status = 200
+        with self._lock:
+            self.stats[f"http_{status}"] += 1
+        return status
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _cookie(self) -> str | None:
+                for part in (self.headers.get("Cookie") or "").split(";"):
+                    name, _, value = part.strip().partition("=")
+                    if name == COOKIE:
+                        return value
+                return None
+
+            def _send(self, status: int, body: str = "", content_type: str = "text/html", headers: dict | None = None):
+                data = body.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _redirect(self, location: str, headers: dict | None = None):
+                self._send(302, "", headers={"Location": location, **(headers or {})})
+
+            def _login_page(self, error: str = ""):
+                self._send(200, LOGIN_PAGE.format(action=LOGIN_PATH, token=mock.token, error=error))
+
+            def do_GET(self):
+                path = urllib.parse.urlparse(self.path).path
+                if path == LOGIN_PATH:
+                    self._login_page()
+                elif path.startswith(SEARCH_PATH) and self._cookie() in mock._sessions:
+                    self._send(200, HOME_PAGE)
+                elif path.startswith(SEARCH_PATH):
+                    self._redirect(LOGIN_PATH)
+                else:
+                    self._send(200, "<html><body>KRA iLaw</body></html>")
+
+            def do_POST(self):
+                parsed = urllib.parse.urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                form   = dict(urllib.parse.parse_qsl(self.rfile.read(length).decode()))
+
+                if parsed.path == LOGIN_PATH:
+                    sid = mock._login(form)
+                    if sid is None:
+                        self._login_page('<p class="error">Invalid username or password</p>')
+                    else:
+                        self._redirect(SEARCH_PATH, {"Set-Cookie": f"{COOKIE}={sid}; Path=/; HttpOnly"})
+                    return
+
+                if parsed.path.startswith(f"{SEARCH_PATH}/"):
+                    status = mock._search(self._cookie())
+                    if status == 302:
+                        self._redirect(LOGIN_PATH)
+                    elif status != 200:
+                        self._send(status, "<html><body>Service unavailable</body></html>")
+                    else:
+                        keyword = urllib.parse.parse_qs(parsed.query).get("keyword", [""])[0]
+                        self._send(200, json.dumps({"html": mock.page_for(keyword)}), "application/json")
+                    return
+
+                self._send(404, "Not found")
+
+        return Handler
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Serve a local mock of KRA iLaw.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--username", default="bench")
+    ap.add_argument("--password", default="bench")
+    ap.add_argument("--latency", type=float, default=0.05)
+    ap.add_argument("--jitter", type=float, default=0.02)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--expire-every", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    mock = MockILaw(
+        host=args.host, port=args.port, username=args.username, password=args.password,
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, expire_every=args.expire_every,
+    )
+    print(f"🧪 Mock iLaw on {mock.base_url}  ({len(mock.pages)} pages)")
+    print(f"   auth_url={mock.auth_url}")
+    print(f"   url={mock.search_url}")
+    try:
+        mock._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        mock._server.server_close()
+        print("\n" + ", ".join(f"{k}={v}" for k, v in sorted(mock.stats.items())))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
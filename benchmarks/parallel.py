@@ -0,0 +1,70 @@
+# benchmarks/parallel.py
+# Parity check + scaling benchmark for process-pool scoring.
+#   python -m benchmarks.parallel [--rows 2000] [--workers 1,2,4,8]
+#
+# Scores the same wide-result batch in-process (workers=1) and across N processes,
+# through both Scrapper.comparator() and EnhancedReconciler.reconcile(); every
+# worker count must return exactly the in-process rows, in the same order.
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+from modules.parallel import PARALLEL_THRESHOLD, workload
+from modules.reconciler import EnhancedReconciler
+from modules.scrapper import Scrapper
+
+from .fixtures import wide_result_cases
+
+
+def sheet_rows(cases: list) -> list:
+    return [
+        {"excel_row": c["excel_row"], "case_number": c["original_case"], "citation": c["case_name"], "keyword": c["search_keyword"]}
+        for c in cases
+    ]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Parity + scaling check for process-pool scoring.")
+    ap.add_argument("--rows", type=int, default=2000)
+    ap.add_argument("--workers", default="1,2,4,8")
+    ap.add_argument("--backend", default="auto")
+    args = ap.parse_args(argv)
+
+    cases = wide_result_cases(args.rows)
+    sheet = sheet_rows(cases)
+    print(
+        f"🧪 {len(cases)} rows, {workload(cases)} candidates · threshold {PARALLEL_THRESHOLD} · "
+        f"{os.cpu_count()} CPUs visible"
+    )
+
+    scrapper   = Scrapper(similarity_backend=args.backend)
+    reconciler = EnhancedReconciler(similarity_backend=args.backend)
+    engines = {
+        "comparator()": lambda w: scrapper.comparator(cases, workers=w),
+        "reconcile()":  lambda w: reconciler.reconcile(sheet, cases, workers=w),
+    }
+
+    ok = True
+    for label, run in engines.items():
+        print(f"\n⚖️  {label}")
+        baseline = None
+        for w in (int(x) for x in args.workers.split(",")):
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                rows  = run(w)
+                elapsed = time.perf_counter() - start
+            if baseline is None:
+                baseline, base_time = rows, elapsed
+            same = rows == baseline
+            ok &= same
+            print(f"   {'✅' if same else '❌'} workers {w:<3} {elapsed:8.2f} s  ×{base_time / elapsed:4.1f}")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+# benchmarks/parsers.py
+# Parity check + micro-benchmark for the result-table parser backends.
+#   python -m benchmarks.parsers [--repeat N]
+
+import argparse
+import sys
+import time
+
+from modules.parsers import BACKENDS, available_backends, parse_results
+
+from .fixtures import cached_pages, malformed_tables, result_tables
+
+
+def check_parity(documents: dict) -> bool:
+    """Every installed backend must match the full-soup reference output exactly."""
+    ok = True
+    for name in available_backends():
+        if name == "soup":
+            continue
+        bad = [k for k, html in documents.items() if parse_results(html, name) != parse_results(html, "soup")]
+        if bad:
+            ok = False
+            print(f"❌ {name}: {len(bad)}/{len(documents)} documents differ (e.g. {bad[:3]})")
+        else:
+            print(f"✅ {name}: identical on {len(documents)} documents")
+    return ok
+
+
+def bench(documents: dict, repeat: int) -> None:
+    html = list(documents.values())
+    rows = sum(len(parse_results(h, "soup")) for h in html)
+    print(f"\n⏱  {len(html)} documents, {rows} result rows, x{repeat}")
+
+    for name in BACKENDS:
+        if name not in available_backends():
+            print(f"   {name:<11} not installed")
+            continue
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for h in html:
+                parse_results(h, name)
+        elapsed = (time.perf_counter() - start) / repeat
+        print(f"   {name:<11} {elapsed*1000:8.1f} ms/pass  {elapsed/len(html)*1e6:8.0f} µs/doc")
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args(argv)
+
+    documents = {f"pages/{k}": v for k, v in cached_pages().items()}
+    documents.update({f"synthetic/{i}": h for i, h in enumerate(result_tables())})
+    documents.update({f"malformed/{k}": h for k, h in malformed_tables().items()})
+
+    ok = check_parity(documents)
+    bench(documents, args.repeat)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+# benchmarks/reconciler.py
+# Scaling benchmark for EnhancedReconciler.reconcile(): keyed index vs. the old per-row scan.
+#   python -m benchmarks.reconciler [--sizes 1000,10000,100000] [--linear-max 10000]
+#
+# The old lookup walked kra_data for every sheet row (O(N²)); it is reproduced here
+# only as a baseline and skipped above --linear-max, where it would take minutes to hours.
+
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+
+from modules.reconciler import EnhancedReconciler
+
+from .fixtures import COURTS, PARTIES, RESPONDENTS
+
+
+def dataset(size: int, seed: int = 7) -> tuple:
+    """(sheet_data, kra_data) with one KRA result per row, shuffled, ~2% duplicate case numbers."""
+    rng   = random.Random(seed)
+    sheet = []
+    for i in range(size):
+        n      = i if rng.random() > 0.02 else max(0, i - 1)
+        court  = COURTS[n % len(COURTS)]
+        case   = f"{court}/E{n:03d}/2024"
+        party  = PARTIES[n % len(PARTIES)]
+        sheet.append({
+            "excel_row":   i + 2,
+            "case_number": case,
+            "citation":    f"{party} VS {RESPONDENTS[n % len(RESPONDENTS)]}",
+            "keyword":     f"E{n:03d} of 2024",
+        })
+
+    kra = [
+        {
+            "excel_row":     item["excel_row"],
+            "original_case": item["case_number"],
+            "matches": [{
+                "kra_citation": f"{item['citation']} {item['case_number'].replace('/', ' ')}",
+                "kra_ref":      item["case_number"],
+                "kra_assignee": "JANE DOE",
+            }],
+        }
+        for item in sheet
+    ]
+    rng.shuffle(kra)
+    return sheet, kra
+
+
+def linear_lookup(sheet_data: list, kra_data: list) -> list:
+    """The pre-index lookup, kept as the baseline."""
+    found = []
+    for sheet_item in sheet_data:
+        matches = []
+        for kra_item in kra_data:
+            if kra_item.get("original_case") == sheet_item.get("case_number", "Unknown"):
+                matches = kra_item.get("matches", [])
+                break
+        found.append(matches)
+    return found
+
+
+def indexed_lookup(sheet_data: list, kra_data: list) -> list:
+    index = EnhancedReconciler._index(kra_data)
+    found = []
+    for sheet_item in sheet_data:
+        kra_item = EnhancedReconciler._lookup(index, sheet_item.get("case_number", "Unknown"), sheet_item.get("excel_row"))
+        found.append(kra_item.get("matches", []) if kra_item else [])
+    return found
+
+
+def timed(fn, *args) -> tuple:
+    start = time.perf_counter()
+    out   = fn(*args)
+    return out, time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Scaling benchmark for EnhancedReconciler lookups.")
+    ap.add_argument("--sizes", default="1000,10000,100000")
+    ap.add_argument("--linear-max", type=int, default=10000)
+    ap.add_argument("--lookup-only", action="store_true", help="skip the full reconcile() timing")
+    args = ap.parse_args(argv)
+
+    ok = True
+    print(f"{'rows':>8}  {'linear lookup':>14}  {'index lookup':>13}  {'reconcile()':>12}  {'µs/row':>7}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        sheet, kra = dataset(size)
+
+        indexed, t_index = timed(indexed_lookup, sheet, kra)
+        if size <= args.linear_max:
+            linear, t_linear = timed(linear_lookup, sheet, kra)
+            # Rows with a unique case number must get the same matches; duplicated case
+            # numbers now resolve to the row's own entry instead of the first one found
+            counts = Counter(item["case_number"] for item in sheet)
+            if any(a != b for item, a, b in zip(sheet, linear, indexed) if counts[item["case_number"]] == 1):
+                print(f"❌ {size}: indexed lookup disagrees with the linear scan")
+                ok = False
+            linear_col = f"{t_linear:12.3f} s"
+        else:
+            linear_col = f"{'skipped':>14}"
+
+        if args.lookup_only:
+            full_col, per_row = f"{'—':>12}", t_index / size * 1e6
+        else:
+            _, t_full = timed(EnhancedReconciler().reconcile, sheet, kra)
+            full_col, per_row = f"{t_full:10.3f} s", t_full / size * 1e6
+
+        print(f"{size:>8}  {linear_col}  {t_index:11.4f} s  {full_col}  {per_row:7.1f}")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+# benchmarks/scanner.py
+# Parity check + benchmark for Scanner.file_extractor()'s columnar path.
+#   python -m benchmarks.scanner [--rows 10000] [--repeat 3]
+#
+# The columnar path must return exactly the records of the row-by-row path, and each
+# keyword must be exactly what build_ejuris_keyword() gives for that row's cells —
+# which in turn must match reference_keyword(), the original regex cascade, digits
+# (ASCII or not) exactly as written. Streaming a saved CSV / XLSX through
+# Validator.read_chunks() must give the same records as reading it whole.
+
+import argparse
+import contextlib
+import io
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from helpers import cell_text
+from modules.scanner import Scanner
+from modules.validators import Validator
+
+from .fixtures import case_sheet
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def check_parity(scanner: Scanner, sheet) -> bool:
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows    = scanner._extract_rows(sheet)
+        columns = scanner._extract_columns(sheet)
+        direct  = [scanner.build_ejuris_keyword(*cells(scanner, sheet.loc[r["excel_row"] - 2])) for r in rows]
+
+    bad      = [i for i, (a, b) in enumerate(zip(rows, columns)) if a != b]
+    keywords = [i for i, (r, k) in enumerate(zip(columns, direct)) if r["keyword"] != k]
+    if len(rows) != len(columns) or bad or keywords:
+        print(f"❌ {len(columns)}/{len(rows)} records, {len(bad)} differ (e.g. {[rows[i] for i in bad[:2]]}), "
+              f"{len(keywords)} keywords off build_ejuris_keyword()")
+        return False
+    print(f"✅ identical on {len(rows)} records ({len({r['keyword'] for r in rows})} distinct keywords)")
+    return True
+
+
+def reference_keyword(case_num: str, citation: str) -> str:
+    """build_ejuris_keyword() as it was before CaseRef: one regex per form, in order."""
+    s = case_num.strip()
+    for pattern in (r'^(E\d+)\s+of\s+(\d{4})$', r'/(E\d+)/(\d{4})', r'^(E\d+)[/\-_](\d{4})$', r'^(E\d+)\s+(\d{4})$'):
+        m = re.search(pattern, s, re.IGNORECASE)
+        if m:
+            return f"{m.group(1).upper()} of {m.group(2)}"
+
+    m = re.match(r'^(E\d+)$', s, re.IGNORECASE)
+    if m:
+        yr = re.search(r'\b(20\d{2}|19\d{2})\b', citation)
+        return f"{m.group(1).upper()} of {yr.group(0)}" if yr else m.group(1).upper()
+
+    m = re.match(r'^(\d+)[/\-_\s]+(\d{4})$', s)
+    if m:
+        return f"E{m.group(1)} of {m.group(2)}"
+
+    e_match  = re.search(r'E(\d+)', s, re.IGNORECASE)
+    yr_match = re.search(r'\b(20\d{2}|19\d{2})\b', s)
+    if e_match and yr_match:
+        return f"E{e_match.group(1)} of {yr_match.group(1)}"
+
+    nums   = re.findall(r'\d+', s)
+    years  = [n for n in nums if re.match(r'^(19|20)\d{2}$', n)]
+    non_yr = [n for n in nums if n not in years]
+    if non_yr and years:
+        return f"E{non_yr[-1]} of {years[-1]}"
+    return s if s else citation
+
+
+def check_reference(scanner: Scanner, sheet) -> bool:
+    pairs = [cells(scanner, row) for _, row in sheet.iterrows()]
+    with contextlib.redirect_stdout(io.StringIO()):
+        built = [scanner.build_ejuris_keyword(*pair) for pair in pairs]
+    off = [(pair, k, reference_keyword(*pair)) for pair, k in zip(pairs, built) if k != reference_keyword(*pair)]
+    if off:
+        print(f"❌ {len(off)}/{len(pairs)} keywords differ from the original cascade (e.g. {off[:2]})")
+        return False
+    print(f"✅ keywords match the original cascade on {len(pairs)} rows")
+    return True
+
+
+def check_streaming(sheet, directory: Path, chunksize: int = 997) -> bool:
+    """The whole-file read and the chunked read of the same saved sheet give the same records."""
+    ok = True
+    for name, write in (("cases.csv", lambda p: sheet.to_csv(p, index=False)), ("cases.xlsx", lambda p: sheet.to_excel(p, index=False))):
+        path = directory / name
+        write(path)
+        validate = Validator(str(path), "Case Number", "Citation")
+        with contextlib.redirect_stdout(io.StringIO()):
+            whole  = Scanner("Case Number", "Citation").file_extractor(validate.create_sheet(mapped=True))
+            stream = Scanner("Case Number", "Citation").stream_extractor(validate.read_chunks(chunksize))
+        bad = [(a, b) for a, b in zip(whole, stream) if a != b]
+        if len(whole) != len(stream) or bad:
+            print(f"❌ {path.suffix}: streamed {len(stream)}/{len(whole)} records, {len(bad)} differ (e.g. {bad[:2]})")
+            ok = False
+        else:
+            print(f"✅ {path.suffix}: streamed records identical on {len(whole)} records")
+    return ok
+
+
+def numeric_cases(sheet):
+    """The sheet with a numeric case column with blanks, which pandas reads as float."""
+    cases = [None if i % 7 == 0 else 1000 + i for i in range(len(sheet))]
+    return sheet.assign(**{"Case Number": cases})
+
+
+def cells(scanner: Scanner, row) -> tuple:
+    """A sheet row's stripped (case number, citation) cells."""
+    return tuple(cell_text(value) for value in (row.get(scanner.case_num_column, ""), row.get(scanner.citation_column, "")))
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Parity + benchmark for Scanner.file_extractor().")
+    ap.add_argument("--rows", type=int, default=10_000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    scanner = Scanner("Case Number", "Citation")
+    sheet   = case_sheet(args.rows)
+
+    ok = check_parity(scanner, sheet)
+    ok = check_parity(scanner, sheet.iloc[::-1].set_index(sheet.index + 500)) and ok   # offset, reversed index
+    ok = check_parity(Scanner("Case Number", "Missing"), sheet) and ok                   # absent column
+    ok = check_reference(scanner, sheet) and ok
+
+    with tempfile.TemporaryDirectory() as tmp:
+        small = sheet.head(3_000)
+        ok = check_streaming(small, Path(tmp)) and ok
+        ok = check_streaming(numeric_cases(small), Path(tmp)) and ok
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        t_rows    = timed(lambda: scanner._extract_rows(sheet), args.repeat)
+        t_columns = timed(lambda: scanner._extract_columns(sheet), args.repeat)
+    print(f"\n⏱  {len(sheet)} rows  iterrows {t_rows * 1000:8.1f} ms  columnar {t_columns * 1000:8.1f} ms  ×{t_rows / t_columns:5.1f}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
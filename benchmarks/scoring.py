@@ -0,0 +1,101 @@
+# benchmarks/scoring.py
+# Parity check + benchmark for the cascaded Scrapper.score() against exhaustive scoring.
+#   python -m benchmarks.scoring [--cases 200] [--repeat 3]
+#
+# The exhaustive baseline scores every candidate with all four signals, as score()
+# did before the cascade; both must pick the same best match with the same confidence.
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+
+from helpers import normalize
+from modules.scrapper import Scrapper
+from modules.similarity import available_backends
+
+from .fixtures import citation_pairs, wide_result_cases
+
+
+def exhaustive(scrapper: Scrapper, item: dict) -> tuple:
+    """(best_match, confidence) with every candidate fully scored — the pre-cascade loop."""
+    sheet_case     = str(item.get('original_case', '')).upper()
+    search_keyword = str(item.get('search_keyword', '')).upper()
+    sheet_norm     = normalize(str(item.get('case_name', '')).upper())
+    sheet_court    = normalize(sheet_case).court
+
+    best_ratio, best_match = 0.0, {}
+    for match in item.get('matches', []):
+        kra_citation = str(match.get('kra_citation', '')).upper()
+        kra_ref      = str(match.get('kra_ref', '')).upper()
+        kra_court    = normalize(kra_citation).court
+        if sheet_court != 'NA' and kra_court != 'NA' and sheet_court != kra_court:
+            continue
+        scores = scrapper._calculate_similarity_scores(
+            sheet_norm.tokens, sheet_norm.text, sheet_case, kra_citation, kra_ref, search_keyword
+        )
+        weighted = (
+            scores['token_ratio']   * 0.30 +
+            scores['string_ratio']  * 0.30 +
+            scores['ref_ratio']     * 0.25 +
+            scores['keyword_ratio'] * 0.15
+        )
+        final = max(weighted, scores['ref_ratio'], scores['keyword_ratio'])
+        if final > best_ratio:
+            best_ratio, best_match = final, match
+    return best_match, round(best_ratio, 2)
+
+
+def cascade(scrapper: Scrapper, item: dict) -> tuple:
+    row = scrapper.score(item)
+    return row['best_match_kra_ref'], row['confidence_raw']
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Parity + speed check for the cascaded scorer.")
+    ap.add_argument("--cases", type=int, default=200)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    suites = {
+        "wide result lists": wide_result_cases(args.cases),
+        "citation pairs":    citation_pairs(args.cases * 2),
+    }
+
+    ok = True
+    for backend in available_backends():
+        scrapper = Scrapper(similarity_backend=backend)
+        print(f"\n🔬 {backend}")
+        for label, cases in suites.items():
+            candidates = sum(len(c['matches']) for c in cases)
+            with contextlib.redirect_stdout(io.StringIO()):
+                ref = [exhaustive(scrapper, c) for c in cases]
+                new = [cascade(scrapper, c) for c in cases]
+                t_ref = timed(lambda: [exhaustive(scrapper, c) for c in cases], args.repeat)
+                t_new = timed(lambda: [cascade(scrapper, c) for c in cases], args.repeat)
+
+            bad = sum(
+                1 for (m, conf), (ref_id, new_conf) in zip(ref, new)
+                if conf != new_conf or (m.get('kra_ref', 'N/A') if m else 'N/A') != ref_id
+            )
+            ok &= not bad
+            print(
+                f"   {'✅' if not bad else '❌'} {label:<18} {len(cases):>4} rows / {candidates:>6} candidates  "
+                f"exhaustive {t_ref*1000:8.1f} ms  cascade {t_new*1000:8.1f} ms  ×{t_ref / t_new:4.1f}  mismatches {bad}"
+            )
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
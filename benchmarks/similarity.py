@@ -0,0 +1,127 @@
+# benchmarks/similarity.py
+# Regression check + speed comparison for the string-similarity backends.
+#   python -m benchmarks.similarity [--cases 400] [--repeat 3]
+#
+# Scores the same citation cases with difflib (the default, and reference) and every
+# other installed backend, through both Scrapper.score() and EnhancedReconciler.reconcile().
+# Reports how far scores and statuses move; fails if a backend ever scores below
+# difflib (an LCS ratio can't) or moves a row into or out of VERIFIED MATCH.
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from collections import Counter
+
+from helpers import normalize
+from modules.reconciler import EnhancedReconciler
+from modules.scrapper import Scrapper
+from modules.similarity import DEFAULT, available_backends, get_ratio
+
+from .fixtures import citation_pairs
+
+REFERENCE = DEFAULT
+
+
+def string_pairs(cases: list) -> list:
+    """Every (sheet, kra) string the scorers actually compare: cleaned texts and tokens."""
+    pairs = []
+    for case in cases:
+        sheet = normalize(case["case_name"])
+        for match in case["matches"]:
+            kra = normalize(match["kra_citation"])
+            pairs.append((sheet.text, kra.text))
+            pairs.extend((s, k) for s in sheet.tokens for k in kra.tokens)
+    return pairs
+
+
+def score_all(cases: list, backend: str) -> list:
+    scrapper = Scrapper(similarity_backend=backend)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return [scrapper.score(case) for case in cases]
+
+
+def reconcile_all(cases: list, backend: str) -> list:
+    sheet = [
+        {"excel_row": c["excel_row"], "case_number": c["original_case"], "citation": c["case_name"], "keyword": c["search_keyword"]}
+        for c in cases
+    ]
+    return EnhancedReconciler(similarity_backend=backend).reconcile(sheet, cases)
+
+
+def compare(label: str, ref: list, new: list, scale: float = 1.0) -> bool:
+    """New scores may only rise over the reference; how far they rise is reported."""
+    deltas = [(n - r) / scale for r, n in zip(ref, new)]
+    worst  = max(deltas, key=abs, default=0.0)
+    below  = sum(1 for d in deltas if d < -1e-9)
+    ok     = not below
+    print(
+        f"   {'✅' if ok else '❌'} {label:<30} max Δ {worst * scale:+7.3f}  mean |Δ| {sum(map(abs, deltas)) / max(1, len(deltas)) * scale:.4f}  "
+        f"changed {sum(1 for d in deltas if abs(d) > 1e-9)}/{len(deltas)}  below ref {below}"
+    )
+    return ok
+
+
+def flips(label: str, ref: list, new: list) -> bool:
+    """Status changes are reported; any into or out of VERIFIED MATCH fail the check."""
+    changed  = Counter((r["status"], n["status"]) for r, n in zip(ref, new) if r["status"] != n["status"])
+    verified = sum(c for (a, b), c in changed.items() if "VERIFIED MATCH" in (a, b))
+    detail   = ", ".join(f"{a} → {b} ×{c}" for (a, b), c in changed.items()) or "none"
+    print(f"   {'✅' if not verified else '❌'} {label + ' statuses':<30} {detail}")
+    return not verified
+
+
+def timed(fn, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Regression + speed check for similarity backends.")
+    ap.add_argument("--cases", type=int, default=400)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    cases = citation_pairs(args.cases)
+    pairs = string_pairs(cases)
+    print(f"🧪 {len(cases)} scoring cases, {len(pairs)} string pairs · reference {REFERENCE}")
+
+    ok = True
+    ref_ratio   = [get_ratio(REFERENCE)(a, b) for a, b in pairs]
+    ref_scores  = score_all(cases, REFERENCE)
+    ref_reconc  = reconcile_all(cases, REFERENCE)
+
+    for name in available_backends():
+        if name == REFERENCE:
+            continue
+        print(f"\n🔬 {name} vs {REFERENCE}")
+        ratio  = get_ratio(name)
+        scores = score_all(cases, name)
+        reconc = reconcile_all(cases, name)
+        ok &= compare("ratio()", ref_ratio, [ratio(a, b) for a, b in pairs])
+        ok &= compare("Scrapper.score() confidence",
+                      [r["confidence_raw"] for r in ref_scores], [r["confidence_raw"] for r in scores], scale=100)
+        ok &= compare("EnhancedReconciler confidence",
+                      [r["confidence_raw"] for r in ref_reconc], [r["confidence_raw"] for r in reconc], scale=100)
+        ok &= flips("Scrapper.score()", ref_scores, scores)
+        ok &= flips("EnhancedReconciler", ref_reconc, reconc)
+
+    print(f"\n⏱  best of {args.repeat}")
+    print(f"   {'backend':<10} {'ratio() x' + str(len(pairs)):>16} {'score() x' + str(len(cases)):>14} {'reconcile()':>12}")
+    for name in available_backends():
+        ratio = get_ratio(name)
+        t_ratio = timed(lambda: [ratio(a, b) for a, b in pairs], repeat=args.repeat)
+        t_score = timed(score_all, cases, name, repeat=args.repeat)
+        t_recon = timed(reconcile_all, cases, name, repeat=args.repeat)
+        print(f"   {name:<10} {t_ratio*1000:13.1f} ms {t_score*1000:11.1f} ms {t_recon*1000:9.1f} ms")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+# benchmarks/tfidf.py
+# Accuracy + throughput of the "tfidf" scoring strategy against the "ratio" scorer.
+#   python -m benchmarks.tfidf [--cases 400] [--repeat 3]
+#
+# Accuracy is measured two ways on the citation fixtures:
+#   - status agreement with the ratio scorer, row by row;
+#   - against the fixture's own truth: the real case (assignee JOHN DOE) should be the
+#     best match, and rows naming the wrong party should not come out VERIFIED.
+# In "names only" the case number and keyword are blanked, so the E-number overrides
+# can't decide and the party-name signals (token + string) pick the match alone.
+# The tfidf idf is fitted once per suite (Scrapper.fit_idf()), and scoring row by row
+# (as stream() does when results trickle in) must give exactly the batch's rows.
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from collections import Counter
+
+from modules.scrapper import Scrapper
+from modules.similarity import available_backends
+
+from .fixtures import citation_pairs, wide_result_cases
+
+TARGET = "JOHN DOE"   # kra_assignee of the real case in every fixture
+
+
+def truth(cases: list, rows: list) -> tuple:
+    """(rows whose best match is the real case, rows that hold it at all)."""
+    holding = picked = 0
+    for case, row in zip(cases, rows):
+        if any(m.get('kra_assignee') == TARGET for m in case['matches']):
+            holding += 1
+            picked  += row['best_match_kra_assignee'] == TARGET
+    return picked, holding
+
+
+def wrong_party_verified(cases: list, rows: list) -> int:
+    # citation_pairs(): variant 6 (i % 7 == 6, excel_row = i + 2) names another party
+    return sum(1 for c, r in zip(cases, rows) if (c['excel_row'] - 2) % 7 == 6 and r['status'] == "VERIFIED MATCH")
+
+
+def names_only(cases: list) -> list:
+    return [dict(c, original_case="", search_keyword="") for c in cases]
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Accuracy + throughput of TF-IDF scoring vs the ratio scorer.")
+    ap.add_argument("--cases", type=int, default=400)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    suites = {
+        "citation pairs":      citation_pairs(args.cases * 4),
+        "names only":          names_only(citation_pairs(args.cases * 4)),
+        "shared result lists": wide_result_cases(args.cases * 4, shared=True),
+        "wide result lists":   wide_result_cases(args.cases),
+    }
+    backend = available_backends()[0]
+    scorers = {
+        "ratio · score()":       (Scrapper(similarity_backend=backend), lambda s, cases: [s.score(c) for c in cases]),
+        "ratio · score_batch()": (Scrapper(similarity_backend=backend), lambda s, cases: s.score_batch(cases)),
+        "tfidf · score_batch()": (Scrapper(similarity_backend=backend, scoring="tfidf"), lambda s, cases: s.score_batch(cases)),
+        "tfidf · score()":       (Scrapper(similarity_backend=backend, scoring="tfidf"), lambda s, cases: [s.score(c) for c in cases]),
+    }
+    ok = True
+    print(f"🧪 string ratio backend: {backend}")
+
+    for label, cases in suites.items():
+        candidates = sum(len(c['matches']) for c in cases)
+        print(f"\n🔬 {label}: {len(cases)} rows / {candidates} candidates")
+        print(f"   {'scorer':<22} {'rows/s':>9} {'real case picked':>17} {'agree w/ ratio':>15}  statuses")
+
+        reference, tfidf = None, None
+        for name, (scrapper, run) in scorers.items():
+            if scrapper.scoring == "tfidf":
+                scrapper.fit_idf(c['case_name'] for c in cases)
+            with contextlib.redirect_stdout(io.StringIO()):
+                rows    = run(scrapper, cases)
+                elapsed = timed(lambda: run(scrapper, cases), args.repeat)
+            if reference is None:
+                reference = rows
+            if scrapper.scoring == "tfidf":
+                if tfidf is not None and rows != tfidf:
+                    ok = False
+                    print(f"   ❌ {name}: {sum(a != b for a, b in zip(tfidf, rows))} rows differ from score_batch()")
+                tfidf = rows
+
+            picked, holding = truth(cases, rows)
+            agree    = sum(a['status'] == b['status'] for a, b in zip(reference, rows))
+            statuses = Counter(r['status'] for r in rows)
+            extra    = f"  wrong party VERIFIED {wrong_party_verified(cases, rows)}" if label in ("citation pairs", "names only") else ""
+            print(
+                f"   {name:<22} {len(cases) / elapsed:9.0f} {picked:>8}/{holding:<8} {agree / len(rows):14.1%}  "
+                + ", ".join(f"{s} {n}" for s, n in sorted(statuses.items())) + extra
+            )
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,6 +21,7 @@ def sync_session_state():
             'chat_history': st.session_state.get('chat_history', []),
             'temp_file_path': st.session_state.get('temp_file_path'),
             'current_page': st.session_state.get('current_page', 'Dashboard'),
+            'scoring': st.session_state.get('scoring', 'ratio'),
         }
 
 def _init():
@@ -46,6 +47,7 @@ def _init():
         'reconciled_data': None,
         'ai_assistant': None,
         'workers': 8,
+        'scoring': 'ratio',
         'current_page': 'Dashboard',
     }
     for k, v in defaults.items():
@@ -3,6 +3,9 @@
 import pandas as pd
 import re
 
+from .caseref import CaseRef, parse_case
+from .normalize import NOISE_WORDS, Normalized, normalize
+
 # Column Checker
 def find_column(df, possible_names):
     """Finds column by checking multiple possible names"""
@@ -18,17 +21,27 @@ def find_column(df, possible_names):
                     return original_col
     return None
 
+# Cell Text
+_WHOLE_FLOAT = re.compile(r'([0-9]+)\.0+')
+
+def cell_text(value) -> str:
+    """
+    A sheet cell as stripped text, "" for blanks. Whole numbers drop a ".0" whether
+    stored as a float or written as text: pandas reads a numeric column with blanks
+    as float (1403 → 1403.0) and writes it to CSV as "1403.0", while a streamed read
+    sees the integer or the text, and every path must give "1403".
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    text = str(value).strip()
+    whole = _WHOLE_FLOAT.fullmatch(text)
+    return whole.group(1) if whole else text
+
 # Noise Keywords
 def get_noise_words():
-    return {
-        "VS", "VERSUS", "KENYA", "REVENUE", "AUTHORITY", "KRA",
-        "COMMISSIONER", "COMMISIONER", "LEGAL", "NAIROBI", "TAT",
-        "HCITA", "HCCOMMITA", "HCC", "NO", "OF", "LIMITED", "LTD",
-        "DOMESTIC", "TAXES", "MISC", "AND", "FOR", "CUSTOMS",
-        "INVESTIGATION", "BOARD", "SERVICES", "COORDINATION",
-        "UNDER", "RECEIVABLE", "IN", "RECEIVERSHIP", "BORDER CONTROL", "BORDER",
-        "LARGE AND SMALL", "LARGE & SMALL", "TAXPAYERS"
-    }
+    return set(NOISE_WORDS)
 
 # Citation Cleaner
 def clean_citation(text) -> set:
@@ -36,73 +49,18 @@ def clean_citation(text) -> set:
     Returns a SET of unique meaningful words (Order is lost).
     Good for: 'John Doe vs KRA' matching 'KRA vs John Doe'
     """
-    if text is None or pd.isna(text):
-        return set()
-    
-    # Convert to string if not already
-    text = str(text).upper()
-
-    # Removing Case Numbers & Years
-    text = re.sub(r'[A-Z]?\d+\s+OF\s+\d{4}', '', text)
-    text = re.sub(r'\d{4}', '', text)
-
-    # Removing special chars
-    text = re.sub(r'[^A-Z\s]', '', text)
-
-    words = set(text.split())
-    return words - get_noise_words()
+    return set(normalize(text).tokens)
 
 def clean_citation_text(text) -> str:
     """
     Returns a CLEAN STRING (Order preserved).
     Good for: 'ABCXYZ' matching 'ABC XYZ'
     """
-    if text is None or pd.isna(text):
-        return ""
-
-    # Convert to string if not already
-    text = str(text).upper()
-
-    # Removing Case Numbers & Years
-    text = re.sub(r'[A-Z]?\d+\s+OF\s+\d{4}', '', text)
-    text = re.sub(r'\d{4}', '', text)
-
-    # Removing special chars
-    text = re.sub(r'[^A-Z\s]', ' ', text) # Replace with space to prevent accidental mashing
-
-    # Removing noise words using regex to preserve sentence structure
-    noise = get_noise_words()
-    words = text.split()
-    cleaned_words = [w for w in words if w not in noise]
-
-    return " ".join(cleaned_words)
+    return normalize(text).text
 
 def get_court_type(text) -> str:
     """
     Heuristic to identify court type from a case string.
     Returns: 'TAT', 'HC', 'CA', 'SU', or 'NA'
     """
-    if text is None or pd.isna(text):
-        return "NA"
-    
-    # Convert to string if not already
-    text = str(text).upper()
-
-    # 1. Tax Appeals Tribunal
-    if any(x in text for x in ['TAT', 'TAX APPEAL', 'TATC', 'TATMISC']):
-        return 'TAT'
-
-    # 2. Supreme Court
-    if 'SUPREME' in text or 'SCORK' in text:
-        return 'SU'
-
-    # 3. Court of Appeal
-    if any(x in text for x in ['CACA', 'COURT OF APPEAL']):
-        return 'CA'
-
-    # 4. High Court (Catch-all for HC variants)
-    # HCCC, HCITA, HCCHRPET, HCCOMM, ELRC, JR, ETC.
-    if any(x in text for x in ['HC', 'HIGH COURT', "COMMITA", "HCITA", 'ELRC', 'JR ', 'MISC', 'HRPET', 'CTA']):
-        return 'HC'
-
-    return "NA"
\ No newline at end of file
+    return normalize(text).court
@@ -0,0 +1,129 @@
+# helpers/caseref.py
+# Structured case references, parsed once and compared as integers.
+#
+# Sheet case numbers ("HCCOMMITA/E017/2026"), search keywords ("E017 of 2026") and
+# KRA citations / refs all carry the same few facts — court prefix, E-number, year —
+# that used to be re-extracted with separate regexes at every comparison. One
+# compiled scanner walks the string once and the result is memoized.
+#
+# Numbers keep their digit count next to their value: "017" and "17" are the same
+# integer but not the same E-number, so (number, width) pairs compare exactly like
+# the digit strings they came from. \d also matches non-ASCII digits ("٢٠٢٤"); those
+# runs keep their text (minus leading "0"s) as the value instead of an int, so they
+# never equal an ASCII number and come back out of a keyword exactly as written.
+
+from functools import lru_cache
+
+import re
+
+# One pass: E-numbers (with whether a word boundary follows), then bare digit runs
+# (with the boundaries on either side, for year detection)
+_SCAN  = re.compile(r'E(?P<e>\d+)(?P<eb>\b)?|(?P<lb>\b)?(?P<d>\d+)(?P<rb>\b)?', re.IGNORECASE)
+_COURT = re.compile(r'\s*([A-Z]+)\s*/', re.IGNORECASE)
+
+CACHE_SIZE = 65536
+
+
+class CaseRef:
+    """
+    A parsed case reference.
+
+    court       letters before the first "/" ("HCCOMMITA"), or ""
+    e_flag      whether the string carries an E-number
+    number      first E-number as an int (None without one); width its digit count
+    year        first standalone 19xx / 20xx year as an int, or None
+                (values are str for non-ASCII digits, see the module comment)
+    last        last digit run anywhere, as (value, width), or None
+    runs        every E-number followed by a word boundary, as (value, width)
+    years       every 4-digit window of the string's digit runs, as ints
+    raw         the string as given
+    """
+
+    __slots__ = ("raw", "court", "e_flag", "number", "width", "year", "last", "runs", "years")
+
+    def __init__(self, raw, court, number, width, year, last, runs, years):
+        self.raw    = raw
+        self.court  = court
+        self.e_flag = number is not None
+        self.number = number
+        self.width  = width
+        self.year   = year
+        self.last   = last
+        self.runs   = runs
+        self.years  = years
+
+    @property
+    def e_number(self) -> tuple | None:
+        """(value, width) of the E-number, comparable across refs."""
+        return (self.number, self.width) if self.e_flag else None
+
+    @property
+    def e_digits(self) -> str:
+        """The E-number's digits exactly as written ("017")."""
+        return str(self.number).rjust(self.width, "0") if self.e_flag else ""
+
+    def has_e(self, number: int, width: int) -> bool:
+        """
+        Would the pattern E0*{digits}\\b find this E-number here? Some run has the
+        same value, written with at least as many digits (extra leading zeros).
+        """
+        return any(n == number and w >= width for n, w in self.runs)
+
+    def __repr__(self) -> str:
+        return (
+            f"CaseRef(court={self.court!r}, e={self.e_digits or None!r}, year={self.year}, "
+            f"last={self.last}, raw={self.raw!r})"
+        )
+
+
+def parse_case(text) -> CaseRef:
+    """CaseRef for any case number, keyword, citation or ref string, memoized."""
+    return _parse(text if isinstance(text, str) else ("" if text is None else str(text)))
+
+
+def _value(digits: str):
+    return int(digits) if digits.isascii() else digits.lstrip("0")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse(text: str) -> CaseRef:
+    number = width = year = last = None
+    runs, years = [], set()
+
+    for m in _SCAN.finditer(text):
+        digits = m.group('e')
+        if digits is not None:
+            if number is None:
+                number, width = _value(digits), len(digits)
+            if m.group('eb') is not None:
+                runs.append((_value(digits), len(digits)))
+        else:
+            digits = m.group('d')
+            if (
+                year is None and len(digits) == 4 and digits[:2] in ('19', '20')
+                and m.group('lb') is not None and m.group('rb') is not None
+            ):
+                year = _value(digits)
+
+        last = (_value(digits), len(digits))
+        years.update(_value(digits[i:i + 4]) for i in range(len(digits) - 3))
+
+    court = _COURT.match(text)
+    return CaseRef(
+        raw=text,
+        court=court.group(1).upper() if court else "",
+        number=number,
+        width=width,
+        year=year,
+        last=last,
+        runs=tuple(runs),
+        years=frozenset(years),
+    )
+
+
+def cache_info():
+    return _parse.cache_info()
+
+
+def clear_cache() -> None:
+    _parse.cache_clear()
@@ -0,0 +1,115 @@
+# helpers/normalize.py
+# Memoized citation normalization shared by Scrapper.score() and EnhancedReconciler.
+# The same KRA citation comes back for many sheet rows, so its token set, cleaned
+# text and court type are computed once and served from a bounded LRU cache.
+#
+# A cache miss is one strip of case numbers, then years (both skipped outright when
+# the string has no digits), one word split per output form, and at most four
+# court-marker searches — each court's markers compiled into one pattern.
+
+from functools import lru_cache
+from typing import NamedTuple
+
+import pandas as pd
+import re
+
+NOISE_WORDS = frozenset({
+    "VS", "VERSUS", "KENYA", "REVENUE", "AUTHORITY", "KRA",
+    "COMMISSIONER", "COMMISIONER", "LEGAL", "NAIROBI", "TAT",
+    "HCITA", "HCCOMMITA", "HCC", "NO", "OF", "LIMITED", "LTD",
+    "DOMESTIC", "TAXES", "MISC", "AND", "FOR", "CUSTOMS",
+    "INVESTIGATION", "BOARD", "SERVICES", "COORDINATION",
+    "UNDER", "RECEIVABLE", "IN", "RECEIVERSHIP", "BORDER CONTROL", "BORDER",
+    "LARGE AND SMALL", "LARGE & SMALL", "TAXPAYERS"
+})
+# The multi-word entries never equal a single word, so they filter nothing; they stay
+# for get_noise_words(). Stripping them as phrases would only drop CONTROL / SMALL,
+# which help when both sides carry them and cost the fuzzy token match when one side
+# misspells them.
+
+# Case numbers ("E017 OF 2024"), then any 4-digit run left once they are gone. Anchored
+# on the digits so the scan can skip to them; a case number's letter prefix is trimmed
+# in _strip()
+_CASE      = re.compile(r'\d+\s+OF\s+\d{4}')
+_YEAR      = re.compile(r'\d{4}')
+_DIGIT     = re.compile(r'\d')
+_NON_ALPHA = re.compile(r'[^A-Z\s]')
+_WORD      = re.compile(r'[A-Z]+')
+
+# Court markers, checked in this order (see get_court_type)
+_COURTS = (
+    ('TAT', ('TAT', 'TAX APPEAL', 'TATC', 'TATMISC')),
+    ('SU',  ('SUPREME', 'SCORK')),
+    ('CA',  ('CACA', 'COURT OF APPEAL')),
+    ('HC',  ('HC', 'HIGH COURT', "COMMITA", "HCITA", 'ELRC', 'JR ', 'MISC', 'HRPET', 'CTA')),
+)
+_COURT_MARKERS = tuple((court, re.compile('|'.join(map(re.escape, markers)))) for court, markers in _COURTS)
+
+CACHE_SIZE = 65536
+
+
+class Normalized(NamedTuple):
+    tokens: frozenset   # clean_citation()
+    text:   str         # clean_citation_text()
+    court:  str         # get_court_type()
+
+
+EMPTY = Normalized(frozenset(), "", "NA")
+
+
+def normalize(text) -> Normalized:
+    """All three normalized forms of a citation / case string, memoized."""
+    if isinstance(text, str):
+        return _normalize(text.upper())
+    if text is None or pd.isna(text):
+        return EMPTY
+    return _normalize(str(text).upper())
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize(text: str) -> Normalized:
+    # Removing Case Numbers & Years
+    stripped = _strip(text) if _DIGIT.search(text) else text
+
+    # clean_citation drops special chars outright; clean_citation_text treats them
+    # as a word break so neighbouring words don't get mashed together
+    if _NON_ALPHA.search(stripped):
+        chunks = _NON_ALPHA.sub('', stripped).split()
+        words  = _WORD.findall(stripped)
+    else:
+        chunks = words = stripped.split()
+
+    return Normalized(
+        tokens=frozenset(chunks) - NOISE_WORDS,
+        text=" ".join(w for w in words if w not in NOISE_WORDS),
+        court=_court_type(text),
+    )
+
+
+def _strip(text: str) -> str:
+    pieces, last = [], 0
+    for m in _CASE.finditer(text):
+        start = m.start()
+        # [A-Z]?\d+ OF \d{4}: a letter right before a case number goes with it
+        if start > last and 'A' <= text[start - 1] <= 'Z':
+            start -= 1
+        pieces.append(text[last:start])
+        last = m.end()
+    pieces.append(text[last:])
+    # Years go after the join: removing a case number can butt digits into a new run
+    return _YEAR.sub('', "".join(pieces))
+
+
+def _court_type(text: str) -> str:
+    for court, markers in _COURT_MARKERS:
+        if markers.search(text):
+            return court
+    return "NA"
+
+
+def cache_info():
+    return _normalize.cache_info()
+
+
+def clear_cache() -> None:
+    _normalize.cache_clear()
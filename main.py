@@ -1,4 +1,7 @@
-from modules import Scanner, Scrapper, Validator
+from modules import RunJournal, Scanner, Scrapper, Validator
+from modules import columnar
+from modules.batch import STRATEGIES
+from modules.validators import STREAM_BYTES
 
 from utils import errhandler
 
@@ -9,6 +12,92 @@ USER = user()
 def pipeline():
     print("\n###\nWelcome to our Data Reconciliation Pipeline\n")
 
+    # --- Resume ---
+    # An interrupted run picks up where it stopped; only unsearched rows hit iLaw
+
+    journal = None
+    unfinished = RunJournal.list_runs()
+    if unfinished:
+        print("⏸️ Interrupted runs:")
+        for run in unfinished[:5]:
+            meta = run['meta']
+            print(f"   {run['run_id']}  {run['done']}/{meta.get('total', '?')} searched  ({meta.get('file_path', '')})")
+
+        run_id = input("Enter a run id to resume it, or press Enter for a new run: ").strip()
+        if run_id:
+            journal = RunJournal.open(run_id)
+
+    if journal:
+        file_path = journal.meta.get('file_path', '')
+        file_data = journal.items
+    else:
+        file_path, file_data = ingest()
+        if not file_data:
+            return
+        journal = RunJournal.create(file_data, file_path=file_path)
+
+    scoring = input("Scoring strategy — ratio or tfidf (Enter for ratio): ").strip().lower() or "ratio"
+    if scoring not in STRATEGIES:
+        print(f"⚠️ Unknown scoring strategy '{scoring}'; using ratio")
+        scoring = "ratio"
+
+    print("\n-----------------\n")
+
+    # --- Scraping Phase ---
+    scrapper = Scrapper(
+        username=USER['username'],
+        password=USER['password'],
+        data=file_data,
+        scoring=scoring
+    )
+
+    if not scrapper.authenticator():
+        return
+
+    # --- Reconciliation Phase ---
+    # Rows are scored as soon as their search lands, while the rest are still in flight
+
+    reconciled_data = []
+    for row in scrapper.stream(file_data, journal=journal):
+        if not reconciled_data:
+            print("✨ First result:", row, "\n")
+        reconciled_data.append(row)
+
+    if scrapper.failed_searches:
+        print(f"⚠️ Resume run {journal.run_id} to retry the {scrapper.failed_searches} failed searches\n")
+
+    if not reconciled_data:
+        print("❌ No data reconciliation achieved")
+
+        return
+
+    reconciled_data.sort(key=lambda r: r.get('excel_row') or 0)
+    scrapper.print_summary(reconciled_data)
+
+    print("Highlights:\n")
+    for item in reconciled_data[:3]:
+        print("✨ Row:", item, "\n")
+
+    print("\n-----------------\n")
+
+    # --- Reporting ---
+
+    # Parquet / Feather registers have no workbook to annotate: results go out as a table
+    if columnar.is_columnar(file_path):
+        if not scrapper.export(data=reconciled_data, file_path=file_path):
+            print("❌ The reconciliation results could not be exported")
+        return
+
+    if not scrapper.report(
+        data=reconciled_data,
+        file_path=file_path
+    ):
+        print("❌ A reconciliation report could not be drafted for your review")
+
+        return
+
+def ingest():
+    """Prompts for a workbook, validates it and returns (file_path, Scanner records)."""
     # Input
     file_path = input("Enter the file path to reconcile: ").strip()
 
@@ -29,16 +118,13 @@ def pipeline():
     )
 
     if not validate.file_exists():
-        return
+        return file_path, []
 
-    sheet = validate.create_sheet()
-    if sheet is None:
-        return
-
-    # NOTE: check_annotations updates validate.case_num_column if it auto-detects a different name
-    if not validate.check_annotations(sheet=sheet):
+    # NOTE: check_annotations updates validate.case_num_column if it auto-detects a different name.
+    # It only reads the header row; the sheet itself is parsed once the columns are settled
+    if not validate.check_annotations():
         print("❌ Column validation failed.")
-        return
+        return file_path, []
 
     print("\n-----------------\n")
 
@@ -48,10 +134,19 @@ def pipeline():
         citation_column=validate.citation_column
     )
 
-    count = scanner.count_records(sheet=sheet)
-    print(f"✅ Found {count} records.")
+    # Just the two mapped columns: streamed in chunks for large exports, parsed in one go otherwise
+    if validate.file_path.stat().st_size >= STREAM_BYTES:
+        print(f"🌊 Streaming '{validate.case_num_column}' and '{validate.citation_column}' in chunks...")
+        file_data = scanner.stream_extractor(validate.read_chunks())
+    else:
+        sheet = validate.create_sheet(mapped=True)
+        if sheet is None:
+            return file_path, []
+
+        count = scanner.count_records(sheet=sheet)
+        print(f"✅ Found {count} records.")
 
-    file_data = scanner.file_extractor(sheet=sheet)
+        file_data = scanner.file_extractor(sheet=sheet)
 
     if file_data:
         print(f"✅ Successfully extracted {len(file_data)} items.\nHighlights\n")
@@ -61,55 +156,7 @@ def pipeline():
     else:
         print("❌ No data extracted.")
 
-    print("\n-----------------\n")
-
-    # --- Scraping Phase ---
-    scrapper = Scrapper(
-        username=USER['username'],
-        password=USER['password'],
-        data=file_data
-    )
-
-    if not scrapper.authenticator():
-        return
-
-    extracted = scrapper.extractor()
-
-    if not extracted:
-        print("❌ No data scrapped from the system.")
-
-        return
-
-    print(f"✅ Successfully scrapped {len(extracted)} items from the system.\nHighlights:\n")
-    for item in extracted[:1]:
-        print("✨ Row:", item, "\n")
-
-    print("\n-----------------\n")
-
-    # --- Reconciliation Phase ---
-
-    reconciled_data = scrapper.comparator(extracted_data=extracted)
-
-    if not reconciled_data:
-        print("❌ No data reconciliation achieved")
-
-        return
-
-    print("Highlights:\n")
-    for item in reconciled_data[:3]:
-        print("✨ Row:", item, "\n")
-
-    print("\n-----------------\n")
-
-    # --- Reporting ---
-
-    if not scrapper.report(
-        data=reconciled_data,
-        file_path=file_path
-    ):
-        print("❌ A reconciliation report could not be drafted for your review")
-
-        return
+    return file_path, file_data
 
 if __name__ == "__main__":
     pipeline()
\ No newline at end of file
@@ -1,11 +1,24 @@
 # modules/__init__.py
 
+from .cache import SearchCache
+from .features import FeatureStore
+from .journal import RunJournal
+from .planner import SearchPlan, canonical_keyword
 from .scanner import Scanner
 from .scrapper import Scrapper
+from .session import SessionManager
+from .throttle import RateController
 from .validators import Validator
 
 __all__ = [
+    "FeatureStore",
+    "RateController",
+    "RunJournal",
     "Scanner",
+    "SearchCache",
     "Scrapper",
-    "Validator"
+    "SearchPlan",
+    "SessionManager",
+    "Validator",
+    "canonical_keyword"
 ]
\ No newline at end of file
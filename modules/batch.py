@@ -0,0 +1,313 @@
+# modules/batch.py
+# Vectorized batch scoring: every (row, candidate) pair of a batch at once.
+#
+# Scrapper.score() walks one row's candidates with Python sets and scalars. Here each
+# distinct KRA result is parsed once, and the batch is flattened into candidate arrays:
+#   - candidate features come from the scrapper's FeatureStore (see modules.features);
+#     strings (tokens, E-numbers, years, courts) are interned to integer ids in one
+#     shared vocabulary, so sheet rows and candidates become sparse sets of ids;
+#   - token intersections and keyword year hits are membership tests of (row, id)
+#     keys, summed per candidate — Jaccard unions follow from the set sizes;
+#   - ref/keyword scores, the weighted token/string/ref/keyword
+#     combination and the per-row best are array math;
+#   - the string ratio is computed for each row's most promising candidate first, and
+#     then only for candidates whose ceiling still reaches that row's floor.
+# It pays off when results recur across rows (SearchPlan fans one search out to every
+# row with that keyword); with mostly distinct results score()'s early exit wins.
+# Results are row-for-row identical to score(): same floats, same first-best on ties.
+
+import numpy as np
+
+from helpers import normalize
+from .similarity import DEFAULT, get_ratio, resolve_backend
+from .tfidf import Idf, NgramIndex
+
+# Scoring strategies for the string signal: "ratio" is the similarity backend's ratio
+# (see modules.similarity), "tfidf" the char 3-gram TF-IDF cosine (see modules.tfidf)
+STRATEGIES = ("ratio", "tfidf")
+
+# Weights of Scrapper.score()
+W_TOKEN, W_STRING, W_REF, W_KEYWORD = 0.30, 0.30, 0.25, 0.15
+
+# Candidates per distinct (citation, ref) below which per-row score() is faster: each
+# distinct result is parsed once up front, while score() can stop at the first 100
+MIN_REUSE = 4
+
+SHEET_NONE, KRA_NONE = -1, -2   # missing values never match each other
+RUN_LENGTH = 64                 # E-number runs are packed as id * RUN_LENGTH + digit count
+
+
+class _Ragged:
+    """Variable-length id lists stored flat, one (start, size) per entry."""
+
+    def __init__(self):
+        self.start, self.size, self.values = [], [], []
+
+    def add(self, ids: list) -> None:
+        self.start.append(len(self.values))
+        self.size.append(len(ids))
+        self.values.extend(ids)
+
+    def expand(self, entries: np.ndarray) -> tuple:
+        """(owner, id, sizes): every id of every entry, owner being its position in `entries`."""
+        start  = np.asarray(self.start, dtype=np.int64)
+        values = np.asarray(self.values, dtype=np.int64)
+        sizes  = np.asarray(self.size, dtype=np.int64)[entries]
+        owner  = np.repeat(np.arange(len(entries)), sizes)
+        offset = np.arange(len(owner)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        return owner, values[start[entries][owner] + offset], sizes
+
+
+def reuse(items: list) -> float:
+    """Candidates per distinct (citation, ref) result across the batch."""
+    seen, total = set(), 0
+    for item in items:
+        matches = item.get('matches') or []
+        total  += len(matches)
+        seen.update((m.get('kra_citation'), m.get('kra_ref')) for m in matches)
+    return total / len(seen) if seen else 0.0
+
+
+def worth_batching(items: list) -> bool:
+    return reuse(items) >= MIN_REUSE
+
+
+def _string_ratios(backend: str, sheet_texts: list, kra_texts: list) -> np.ndarray:
+    """Pairwise 0..1 ratios of two equal-length lists."""
+    if not sheet_texts:
+        return np.zeros(0)
+    if resolve_backend(backend) == "rapidfuzz":
+        from rapidfuzz import process
+        from rapidfuzz.distance import Indel
+        return process.cpdist(sheet_texts, kra_texts, scorer=Indel.normalized_similarity, dtype=np.float64)
+    ratio = get_ratio(backend)
+    return np.fromiter((ratio(a, b) for a, b in zip(sheet_texts, kra_texts)), dtype=np.float64, count=len(sheet_texts))
+
+
+class _Batch:
+    """The flattened batch: per-row sheet features, per-candidate ids into distinct results."""
+
+    def __init__(self, items: list, scrapper):
+        self.ids = {}
+        intern   = self.ids.setdefault
+
+        # Sheet rows: court, E-number, year, last number, keyword on?, keyword E-number, keyword year
+        # (CaseRef fields interned; see helpers.caseref)
+        self.sheet_texts = []
+        sheet_tokens     = _Ragged()
+        sheet_features   = []
+
+        # Distinct KRA citations (text, court, tokens) and distinct (citation, ref) results
+        cites, self.cite_texts, cite_courts, cite_tokens = {}, [], [], _Ragged()
+        results, result_cite, result_features = {}, [], []
+        result_runs, result_years = _Ragged(), _Ragged()
+
+        cand_row, cand_index, cand_result = [], [], []
+        na = intern('NA', len(self.ids))
+
+        for r, item in enumerate(items):
+            sheet_case     = str(item.get('original_case', '')).upper()
+            search_keyword = str(item.get('search_keyword', '')).upper()
+            sheet_norm     = normalize(str(item.get('case_name', '')).upper())
+            sheet_court    = intern(normalize(sheet_case).court, len(self.ids))
+
+            self.sheet_texts.append(sheet_norm.text)
+            sheet_tokens.add([intern(t, len(self.ids)) for t in sheet_norm.tokens])
+            sheet, keyword = scrapper._sheet_reference(sheet_case, search_keyword)
+            sheet_features.append((
+                sheet_court,
+                self.intern(sheet.e_number),
+                self.intern(sheet.year),
+                self.intern(sheet.last),
+                keyword is not None,
+                self._run(keyword.number, keyword.width) if keyword else SHEET_NONE,
+                self.intern(keyword.year) if keyword else SHEET_NONE,
+            ))
+
+            for m, match in enumerate(item.get('matches') or []):
+                features = scrapper.features.get(match)
+                c = cites.get(features.citation)
+                if c is None:
+                    c = cites[features.citation] = len(self.cite_texts)
+                    self.cite_texts.append(features.text)
+                    cite_courts.append(intern(features.court, len(self.ids)))
+                    cite_tokens.add([intern(t, len(self.ids)) for t in features.tokens])
+
+                # Skip cross-court matches (only when both courts are identifiable)
+                kra_court = cite_courts[c]
+                if sheet_court != na and kra_court != na and sheet_court != kra_court:
+                    continue
+
+                key = (features.citation, features.ref)
+                k   = results.get(key)
+                if k is None:
+                    k = results[key] = len(result_cite)
+                    kra, kra_ref = features.reference
+                    result_cite.append(c)
+                    result_features.append((
+                        self.intern(kra.e_number, KRA_NONE),
+                        self.intern(kra.year, KRA_NONE),
+                        self.intern(kra_ref.last, KRA_NONE),
+                    ))
+                    result_runs.add([self._run(n, w) for n, w in kra.runs])
+                    result_years.add([intern(y, len(self.ids)) for y in kra.years])
+
+                cand_row.append(r)
+                cand_index.append(m)
+                cand_result.append(k)
+
+        self.rows        = len(items)
+        self.cand_row    = np.asarray(cand_row, dtype=np.int64)
+        self.cand_index  = np.asarray(cand_index, dtype=np.int64)
+        self.cand_result = np.asarray(cand_result, dtype=np.int64)
+        self.cand_cite   = np.asarray(result_cite, dtype=np.int64)[self.cand_result] if cand_result else self.cand_result
+        self.sheet       = np.asarray(sheet_features, dtype=np.int64).reshape(-1, 7)
+        self.result      = np.asarray(result_features, dtype=np.int64).reshape(-1, 3)
+        self.sheet_tokens, self.cite_tokens = sheet_tokens, cite_tokens
+        self.result_runs, self.result_years = result_runs, result_years
+
+    def intern(self, value, none: int = SHEET_NONE) -> int:
+        return none if value is None else self.ids.setdefault(value, len(self.ids))
+
+    def _run(self, number: int, width: int) -> int:
+        # E0*n\b matches a run of the same value written with at least as many digits
+        # (see CaseRef.has_e)
+        return self.intern(number) * RUN_LENGTH + min(width, RUN_LENGTH - 1)
+
+    @property
+    def stride(self) -> int:
+        return max(1, len(self.ids))
+
+    def hits(self, ragged: _Ragged, entries: np.ndarray, row_keys: np.ndarray) -> tuple:
+        """
+        Per candidate: how many ids of its entry its own row also holds (row_keys are
+        row * stride + id), and the entry's size.
+        """
+        owner, values, sizes = ragged.expand(entries)
+        keys = self.cand_row[owner] * self.stride + values
+        return np.bincount(owner, weights=np.isin(keys, row_keys), minlength=len(entries)), sizes
+
+
+def token_ratios(batch: _Batch) -> np.ndarray:
+    """Jaccard percentage of every candidate's tokens against its row's sheet tokens."""
+    owner, values, sheet_sizes = batch.sheet_tokens.expand(np.arange(batch.rows))
+    inter, kra_sizes = batch.hits(batch.cite_tokens, batch.cand_cite, owner * batch.stride + values)
+
+    sheet_sizes = sheet_sizes[batch.cand_row]
+    union       = (sheet_sizes + kra_sizes) - inter
+
+    ratios = np.zeros(len(batch.cand_row))
+    np.divide(inter, union, out=ratios, where=(sheet_sizes > 0) & (kra_sizes > 0))
+    return ratios * 100
+
+
+def reference_scores(batch: _Batch) -> tuple:
+    """(ref_ratio, keyword_ratio) arrays, as Scrapper._reference_scores() per candidate."""
+    sheet  = batch.sheet[batch.cand_row]
+    result = batch.result[batch.cand_result]
+
+    # Case reference: E-number (+ year), else the last number of the ref
+    e_hit    = (sheet[:, 1] >= 0) & (sheet[:, 1] == result[:, 0])
+    yr_hit   = sheet[:, 2] == result[:, 1]
+    last_hit = sheet[:, 3] == result[:, 2]
+    ref = np.where(e_hit, np.where(yr_hit, 100, 80), np.where(last_hit, 60, 0))
+
+    # Keyword: its E-number among the result's runs, its year among the result's windows
+    owner, runs, _ = batch.result_runs.expand(batch.cand_result)
+    wanted = sheet[owner, 5]
+    match  = (runs // RUN_LENGTH == wanted // RUN_LENGTH) & (runs % RUN_LENGTH >= wanted % RUN_LENGTH) & (wanted >= 0)
+    has_e  = np.bincount(owner, weights=match, minlength=len(batch.cand_row)) > 0
+
+    years     = batch.sheet[:, 6]
+    with_year = np.flatnonzero(years >= 0)
+    year_hits, _ = batch.hits(batch.result_years, batch.cand_result, with_year * batch.stride + years[with_year])
+    has_yr = year_hits > 0
+
+    keyword = np.where(sheet[:, 4] == 1, np.where(has_e & has_yr, 100, np.where(has_e | has_yr, 50, 0)), 0)
+    return ref, keyword
+
+
+def tfidf_ratios(batch: _Batch, idf: Idf | None = None) -> np.ndarray:
+    """Char 3-gram TF-IDF cosine of every candidate; without a fitted idf, the batch's sheet texts are the corpus."""
+    index = NgramIndex(batch.sheet_texts + batch.cite_texts, idf=idf or Idf(batch.sheet_texts))
+    sheet = index.ids(batch.sheet_texts)
+    cites = index.ids(batch.cite_texts)
+    return index.cosine(sheet[batch.cand_row], cites[batch.cand_cite])
+
+
+def score_batch(items: list, scrapper, backend: str = DEFAULT, strategy: str = "ratio", idf: Idf | None = None) -> list:
+    """
+    Scrapper.score() over a whole batch. Returns, per item, (best match index into its
+    'matches' or None, confidence) — the caller turns these into reconciled rows.
+    strategy="tfidf" swaps the string ratio for the TF-IDF cosine under `idf`;
+    everything else, weights included, is unchanged.
+    """
+    rows  = len(items)
+    batch = _Batch(items, scrapper)
+    cand_row   = batch.cand_row
+    candidates = len(cand_row)
+    if not candidates:
+        return [(None, 0.0)] * rows
+
+    token        = token_ratios(batch)
+    ref, keyword = reference_scores(batch)
+
+    def weighted(string):
+        # score()'s weighted sum, term for term
+        return token * W_TOKEN + string * 100 * W_STRING + ref * W_REF + keyword * W_KEYWORD
+
+    # Bounds on each candidate's final score, with the string ratio at 0 and at 1
+    overrides = np.maximum(ref, keyword)
+    floor     = np.maximum(weighted(0.0), overrides)
+    ceiling   = np.maximum(weighted(1.0), overrides)
+
+    def strings(picked: np.ndarray) -> np.ndarray:
+        return _string_ratios(
+            backend,
+            [batch.sheet_texts[r] for r in cand_row[picked].tolist()],
+            [batch.cite_texts[c] for c in batch.cand_cite[picked].tolist()],
+        )
+
+    if strategy == "tfidf":
+        # Every cosine comes out of one sparse pass; nothing to prune
+        string = tfidf_ratios(batch, idf)
+        live   = np.ones(candidates, dtype=bool)
+    else:
+        # Probe each row's highest-ceiling candidate exactly; its final score is a floor
+        # for the row that the weighted bounds alone can't give
+        order  = np.lexsort((-ceiling, cand_row))
+        probes = order[np.flatnonzero(np.r_[True, cand_row[order][1:] != cand_row[order][:-1]])]
+
+        string = np.zeros(candidates)
+        string[probes] = strings(probes)
+        row_floor = np.full(rows, -np.inf)
+        np.maximum.at(row_floor, cand_row, floor)
+        np.maximum.at(row_floor, cand_row[probes], np.maximum(weighted(string)[probes], overrides[probes]))
+
+        # A candidate can only be its row's best if its ceiling reaches the row's floor
+        live = ceiling >= row_floor[cand_row]
+        rest = np.flatnonzero(live)
+        rest = rest[~np.isin(rest, probes)]
+        string[rest] = strings(rest)
+
+    combined = weighted(string)
+    final    = np.where(live, np.maximum(combined, overrides), -np.inf)
+
+    # Per-row best, first candidate on ties (score() only replaces on a strict improvement)
+    best = np.full(rows, -np.inf)
+    np.maximum.at(best, cand_row, final)
+    first = np.flatnonzero(final == best[cand_row])
+    winner_rows, at = np.unique(cand_row[first], return_index=True)
+    winners = dict(zip(winner_rows.tolist(), first[at].tolist()))
+
+    # max(weighted, ref, keyword) in score() keeps the integer override when it wins outright
+    results = []
+    for r in range(rows):
+        c = winners.get(r)
+        if c is None or best[r] <= 0:
+            results.append((None, 0.0))
+        elif overrides[c] > combined[c]:
+            results.append((int(batch.cand_index[c]), int(overrides[c])))
+        else:
+            results.append((int(batch.cand_index[c]), round(float(combined[c]), 2)))
+    return results
@@ -0,0 +1,178 @@
+# modules/cache.py
+# On-disk cache of parsed iLaw search results.
+# Entries use the same pickled {timestamp, data} layout as the legacy HTML blobs (kept as
+# fixtures in benchmarks/pages/), but `data` holds the parsed match list so repeat hits skip the HTTP call AND the HTML parse.
+
+import hashlib
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+
+from utils import errhandler
+from .planner import canonical_keyword
+
+
+class SearchCache:
+    """
+    Keyword + dataType keyed cache with a TTL and an LRU byte cap.
+    Recency is tracked through file mtimes, so it survives restarts.
+    """
+
+    def __init__(
+        self,
+        directory: str = ".search_cache",
+        ttl: float = 7 * 24 * 3600,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.directory = Path(directory)
+        self.ttl       = ttl
+        self.max_bytes = max_bytes
+
+        self.hits      = 0
+        self.misses    = 0
+        self.writes    = 0
+        self.evictions = 0
+
+        self._lock  = threading.Lock()
+        self._index = None   # {path: size}, loaded lazily
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Keys
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def normalize(keyword) -> str:
+        """'  e017   of 2026 ' → 'E17 OF 2026' (same canonical form the planner dedupes on)"""
+        return canonical_keyword(keyword)
+
+    def _path(self, keyword, data_type: str) -> Path:
+        raw    = f"{data_type}:{self.normalize(keyword)}"
+        digest = hashlib.md5(raw.encode()).hexdigest()
+        return self.directory / f"{digest}.cache"
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Read / write
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def get(self, keyword, data_type: str = "litigation_data"):
+        """Returns the cached match list, or None on a miss / expired entry."""
+        path = self._path(keyword, data_type)
+        try:
+            with open(path, "rb") as fh:
+                blob = pickle.load(fh)
+        except FileNotFoundError:
+            return self._miss()
+        except Exception:
+            # Corrupt or foreign blob — drop it and refetch
+            self._remove(path)
+            return self._miss()
+
+        data = blob.get("data") if isinstance(blob, dict) else None
+        if not isinstance(data, list):
+            return self._miss()
+
+        if self.ttl and time.time() - blob.get("timestamp", 0) > self.ttl:
+            self._remove(path)
+            return self._miss()
+
+        try:
+            os.utime(path)   # LRU touch
+        except OSError:
+            pass
+
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def set(self, keyword, data_type: str = "litigation_data", matches: list | None = None) -> None:
+        path = self._path(keyword, data_type)
+        blob = pickle.dumps({"timestamp": time.time(), "data": list(matches or [])})
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp, "wb") as fh:
+                fh.write(blob)
+            os.replace(tmp, path)
+        except Exception as e:
+            errhandler(e, log="set", path="cache")
+            return
+
+        with self._lock:
+            index = self._load_index()
+            index[path] = len(blob)
+            self.writes += 1
+            self._evict(index)
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in list(self._load_index()):
+                self._unlink(path)
+            self._index = {}
+
+    def stats(self) -> dict:
+        with self._lock:
+            index  = self._load_index()
+            lookups = self.hits + self.misses
+            return {
+                "hits":      self.hits,
+                "misses":    self.misses,
+                "hit_rate":  round(self.hits / lookups * 100, 1) if lookups else 0.0,
+                "writes":    self.writes,
+                "evictions": self.evictions,
+                "entries":   len(index),
+                "bytes":     sum(index.values()),
+            }
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Internals
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _miss(self):
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _remove(self, path: Path) -> None:
+        with self._lock:
+            self._load_index().pop(path, None)
+            self._unlink(path)
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def _load_index(self) -> dict:
+        if self._index is None:
+            self._index = {}
+            if self.directory.exists():
+                for p in self.directory.glob("*.cache"):
+                    try:
+                        self._index[p] = p.stat().st_size
+                    except OSError:
+                        continue
+        return self._index
+
+    def _evict(self, index: dict) -> None:
+        """Drops least-recently-used entries until the cache fits under max_bytes."""
+        total = sum(index.values())
+        if not self.max_bytes or total <= self.max_bytes:
+            return
+
+        def mtime(p):
+            try:
+                return p.stat().st_mtime
+            except OSError:
+                return 0
+
+        for path in sorted(index, key=mtime):
+            if total <= self.max_bytes:
+                break
+            total -= index.pop(path)
+            self._unlink(path)
+            self.evictions += 1
@@ -0,0 +1,136 @@
+# modules/columnar.py
+# Parquet / Feather / Arrow IPC input and output through pyarrow (a dependency of its own
+# and of streamlit). It is imported on first use, so CSV / XLSX runs never load it.
+# Case registers kept as Parquet elsewhere load without an XLSX round trip: reads are
+# memory-mapped and projected to the columns asked for, so a wide register costs only
+# the case number and citation columns. Reconciled rows go back out as a typed table
+# that analytics can load zero-copy.
+
+import io
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+
+SUFFIXES = (".parquet", ".feather", ".arrow")   # .feather / .arrow: Arrow IPC files
+FORMATS  = {"parquet": ".parquet", "feather": ".feather"}
+
+
+def is_columnar(path) -> bool:
+    return Path(path).suffix.lower() in SUFFIXES
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Reading
+# ─────────────────────────────────────────────────────────────────────────────
+
+def columns(path) -> list:
+    """Column names, from the file's schema alone."""
+    return _schema(path).names
+
+
+def resolve(path, wanted: list) -> dict:
+    """{wanted name: column name in the file}, headers compared stripped (as Validator does)."""
+    names  = {str(n).strip(): n for n in reversed(columns(path))}
+    picked = {}
+    for w in wanted:
+        if str(w).strip() not in names:
+            raise KeyError(w)
+        picked[w] = names[str(w).strip()]
+    return picked
+
+
+def read(path, usecols: list | None = None) -> pd.DataFrame:
+    """The whole table (or just `usecols`), memory-mapped."""
+    path = Path(path)
+    if path.suffix.lower() == ".parquet":
+        import pyarrow.parquet as pq
+        table = pq.read_table(path, columns=usecols, memory_map=True)
+    else:
+        from pyarrow import feather
+        table = feather.read_table(path, columns=usecols, memory_map=True)
+    return table.to_pandas()
+
+
+def head(path, rows: int) -> pd.DataFrame:
+    """The first `rows` rows of every column, without reading the rest."""
+    batch = next(_batches(path, None, rows), None) if rows else None
+    return (batch if batch is not None else _schema(path).empty_table()).to_pandas()
+
+
+def read_chunks(path, usecols: list, chunksize: int) -> Iterator[pd.DataFrame]:
+    """`usecols` in frames of `chunksize` rows, labelled by row position across the file."""
+    start = 0
+    for batch in _batches(path, usecols, chunksize):
+        frame = batch.to_pandas()
+        frame.index = range(start, start + len(frame))
+        start += len(frame)
+        yield frame
+
+
+def _schema(path):
+    path = Path(path)
+    if path.suffix.lower() == ".parquet":
+        import pyarrow.parquet as pq
+        return pq.read_schema(path, memory_map=True)
+    import pyarrow as pa
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_file(source).schema
+
+
+def _batches(path, usecols: list | None, size: int):
+    path = Path(path)
+    if path.suffix.lower() == ".parquet":
+        import pyarrow.parquet as pq
+        yield from pq.ParquetFile(path, memory_map=True).iter_batches(batch_size=size, columns=usecols)
+        return
+
+    import pyarrow as pa
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            if usecols is not None:
+                batch = batch.select(usecols)
+            # IPC batches are as large as the writer made them; slices are zero-copy
+            for offset in range(0, batch.num_rows, size):
+                yield batch.slice(offset, size)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Writing
+# ─────────────────────────────────────────────────────────────────────────────
+
+def results_frame(data: list) -> pd.DataFrame:
+    """Reconciled rows as typed columns (Status matches the UI's CSV, for the dashboard)."""
+    return pd.DataFrame({
+        'Row':           pd.array([d.get('excel_row') for d in data], dtype="Int64"),
+        'Case No.':      [str(d.get('original_case', '')) for d in data],
+        'Citation':      [str(d.get('case_name', '')) for d in data],
+        'Status':        [d.get('status', '') for d in data],
+        'Confidence':    pd.array([d.get('confidence_raw') for d in data], dtype="Float64"),
+        'KRA Match':     [d.get('best_match_kra_citation', 'N/A') for d in data],
+        'KRA Ref':       [d.get('best_match_kra_ref', 'N/A') for d in data],
+        'KRA Assignee':  [d.get('best_match_kra_assignee', 'N/A') for d in data],
+        'Matches Found': pd.array([d.get('matches_found') for d in data], dtype="Int64"),
+    })
+
+
+def write(frame: pd.DataFrame, target, fmt: str = "parquet") -> None:
+    """Writes `frame` to a path or binary buffer as Parquet or Feather (Arrow IPC)."""
+    import pyarrow as pa
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        pq.write_table(table, target)
+    elif fmt == "feather":
+        from pyarrow import feather
+        feather.write_feather(table, target)
+    else:
+        raise ValueError(f"Unknown format: {fmt} (expected one of {', '.join(FORMATS)})")
+
+
+def to_bytes(frame: pd.DataFrame, fmt: str = "parquet") -> bytes:
+    buffer = io.BytesIO()
+    write(frame, buffer, fmt)
+    return buffer.getvalue()
@@ -0,0 +1,50 @@
+# modules/excel.py
+# Read-only XLSX loading. pandas' default openpyxl engine builds a Python cell object for
+# every value; the Rust calamine engine (python-calamine, in the "fast" extra; pandas 2.2+)
+# parses the same sheet into the same frame several times faster. It is used whenever it
+# is installed, and a workbook calamine cannot parse is read again with openpyxl.
+# Writing (Scrapper.report() annotates and saves the uploaded workbook) and the read-only
+# streaming reads (Validator.probe / read_chunks) stay on openpyxl.
+
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+ENGINES = ("auto", "calamine", "openpyxl")
+
+
+@lru_cache(maxsize=1)
+def available() -> bool:
+    """python-calamine is importable and this pandas knows the engine."""
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return False
+    major, minor = (int(p) for p in pd.__version__.split(".")[:2])
+    return (major, minor) >= (2, 2)
+
+
+def default_engine() -> str:
+    """The engine read_excel() tries first."""
+    return "calamine" if available() else "openpyxl"
+
+
+def read_excel(path, engine: str = "auto", **kwargs) -> pd.DataFrame:
+    """
+    pd.read_excel(path, **kwargs) through calamine when available, else openpyxl.
+    engine="calamine" / "openpyxl" forces one engine, without fallback.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine} (expected one of {', '.join(ENGINES)})")
+    if engine != "auto":
+        return pd.read_excel(path, engine=engine, **kwargs)
+
+    if available():
+        from python_calamine import CalamineError
+        try:
+            return pd.read_excel(path, engine="calamine", **kwargs)
+        except CalamineError as e:
+            # Only calamine's own parse errors: a missing column etc. fails the same way in openpyxl
+            print(f"⚠️ calamine could not read {Path(path).name} ({e}); falling back to openpyxl")
+    return pd.read_excel(path, engine="openpyxl", **kwargs)
@@ -0,0 +1,70 @@
+# modules/features.py
+# Candidate features, extracted once per distinct KRA result.
+# SearchPlan fans one search out to every row with that keyword, so the same match
+# dicts come back for many rows. Each distinct (kra_ref, kra_citation) pair is turned
+# into one record — cleaned citation, tokens, text, court, parsed references — and
+# scoring reads those instead of re-deriving them per row.
+
+from typing import NamedTuple
+
+from helpers import normalize, parse_case
+
+
+class CandidateFeatures(NamedTuple):
+    citation:  str         # kra_citation, upper-cased
+    ref:       str         # kra_ref, upper-cased
+    tokens:    frozenset   # clean_citation()
+    text:      str         # clean_citation_text()
+    court:     str         # get_court_type()
+    reference: tuple       # (CaseRef of citation + ref, CaseRef of ref alone)
+
+
+class FeatureStore:
+    """
+    (kra_ref, kra_citation) keyed CandidateFeatures for one run.
+    Pass the same store to Scrapper and EnhancedReconciler to share it; it empties
+    itself once `limit` distinct candidates are held.
+    """
+
+    def __init__(self, limit: int = 200_000):
+        self.limit  = limit
+        self.hits   = 0
+        self.misses = 0
+        self._features = {}
+
+    def get(self, match: dict) -> CandidateFeatures:
+        key = (match.get('kra_ref', ''), match.get('kra_citation', ''))
+        features = self._features.get(key)
+        if features is not None:
+            self.hits += 1
+            return features
+
+        self.misses += 1
+        if len(self._features) >= self.limit:
+            self._features.clear()
+        features = self._features[key] = extract(*key)
+        return features
+
+    def clear(self) -> None:
+        self._features.clear()
+
+    def stats(self) -> dict:
+        return {"candidates": len(self._features), "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+
+def extract(kra_ref, kra_citation) -> CandidateFeatures:
+    """The features of one candidate, uncached."""
+    citation = str(kra_citation).upper()
+    ref      = str(kra_ref).upper()
+    norm     = normalize(citation)
+    return CandidateFeatures(
+        citation=citation,
+        ref=ref,
+        tokens=norm.tokens,
+        text=norm.text,
+        court=norm.court,
+        reference=(parse_case(citation + ' ' + ref), parse_case(ref)),
+    )
@@ -0,0 +1,150 @@
+# modules/journal.py
+# Append-only JSONL checkpoint journal for long extraction runs.
+# Line 1 is the run header (settings + the Scanner records); every completed
+# fetch is appended as it lands, keyed by excel_row, so a crashed or abandoned
+# run can be resumed without re-searching rows that already finished.
+
+import json
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from utils import errhandler
+
+
+class RunJournal:
+    def __init__(self, run_id: str, directory: str = "runs"):
+        self.run_id    = run_id
+        self.path      = Path(directory) / f"{run_id}.jsonl"
+        self.meta      = {}
+        self.items     = []
+        self.completed = {}   # excel_row → extract() result
+        self.finished  = False
+
+        self._lock = threading.Lock()
+        self._fh   = None
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Lifecycle
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def create(cls, items: list, directory: str = "runs", **meta) -> "RunJournal":
+        run_id  = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        journal = cls(run_id, directory)
+        journal.items = list(items)
+        journal.meta  = {**meta, "created": datetime.now().isoformat(timespec="seconds"), "total": len(items)}
+
+        journal.path.parent.mkdir(parents=True, exist_ok=True)
+        journal._write({"type": "run", "run_id": run_id, "meta": journal.meta, "items": journal.items})
+        print(f"📝 Journaling run {run_id} → {journal.path}")
+        return journal
+
+    @classmethod
+    def open(cls, run_id: str, directory: str = "runs") -> "RunJournal | None":
+        """
+        Loads a journal for resuming. A last line torn by a crash mid-write is cut off
+        the file (or only terminated, when just its newline was lost), so the resumed
+        run's first entry starts on a line of its own.
+        """
+        journal = cls(run_id, directory)
+        if not journal.path.exists():
+            print(f"❌ No journal found for run {run_id}")
+            return None
+
+        torn, unterminated = 0, False
+        with open(journal.path, encoding="utf-8") as fh:
+            for line in fh:
+                unterminated = not line.endswith("\n")
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    torn = len(line.encode("utf-8")) if unterminated else 0
+                    continue
+                kind = entry.get("type")
+                if kind == "run":
+                    journal.meta  = entry.get("meta", {})
+                    journal.items = entry.get("items", [])
+                elif kind == "result":
+                    journal.completed[entry["excel_row"]] = entry["result"]
+                elif kind == "done":
+                    journal.finished = True
+
+        try:
+            if torn:
+                with open(journal.path, "r+b") as fh:
+                    fh.truncate(journal.path.stat().st_size - torn)
+            elif unterminated:
+                with open(journal.path, "a", encoding="utf-8") as fh:
+                    fh.write("\n")
+        except OSError as e:
+            errhandler(e, log="open", path="journal")
+
+        print(f"📖 Resuming run {run_id}: {len(journal.completed)}/{len(journal.items)} records already searched")
+        return journal
+
+    def record(self, result: dict) -> None:
+        """Appends one completed search (not a failed one). Safe to call from the fetch thread."""
+        with self._lock:
+            self.completed[result.get("excel_row")] = result
+        self._write({"type": "result", "excel_row": result.get("excel_row"), "result": result})
+
+    def finish(self) -> None:
+        self._write({"type": "done"})
+        self.finished = True
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh:
+                self._fh.close()
+                self._fh = None
+
+    def pending(self) -> list:
+        """Records that still need a search."""
+        return [item for item in self.items if item.get("excel_row") not in self.completed]
+
+    def _write(self, entry: dict) -> None:
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            try:
+                if self._fh is None:
+                    self._fh = open(self.path, "a", encoding="utf-8")
+                self._fh.write(line)
+                self._fh.flush()
+            except OSError as e:
+                errhandler(e, log="write", path="journal")
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Discovery
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def list_runs(directory: str = "runs", unfinished_only: bool = True) -> list:
+        """Newest first: [{'run_id', 'meta', 'done', 'finished'}]."""
+        runs = []
+        rdir = Path(directory)
+        if not rdir.exists():
+            return runs
+
+        for path in sorted(rdir.glob("*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True):
+            meta, done, finished = {}, 0, False
+            try:
+                with open(path, encoding="utf-8") as fh:
+                    for i, line in enumerate(fh):
+                        if i == 0:
+                            try:
+                                meta = json.loads(line).get("meta", {})
+                            except json.JSONDecodeError:
+                                break
+                        elif line.startswith('{"type": "result"'):
+                            done += 1
+                        elif line.startswith('{"type": "done"'):
+                            finished = True
+            except OSError:
+                continue
+            if unfinished_only and finished:
+                continue
+            runs.append({"run_id": path.stem, "meta": meta, "done": done, "finished": finished})
+        return runs
@@ -0,0 +1,136 @@
+# modules/parallel.py
+# Process-pool scoring for large batches.
+# Scoring is pure-Python string work, so threads can't help; rows are sharded into
+# chunks across worker processes and the results come back in input order,
+# identical to scoring in-process. Small batches never pay the pool start-up cost.
+
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from helpers import normalize
+from helpers.normalize import CACHE_SIZE
+from utils import errhandler
+
+from .similarity import DEFAULT
+
+# Below this many (row × candidate) comparisons scoring stays in-process
+PARALLEL_THRESHOLD = 20_000
+
+# Chunks per worker: enough to even out rows with very different result counts
+CHUNKS_PER_WORKER = 4
+
+_worker = None   # per-process Scrapper / EnhancedReconciler, built by _init_worker
+
+
+def workload(items: list, key: str = 'matches') -> int:
+    return sum(len(item.get(key) or []) for item in items)
+
+
+def _chunks(items: list, workers: int) -> list:
+    size = max(1, -(-len(items) // (workers * CHUNKS_PER_WORKER)))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _shared_citations(items: list, limit: int = CACHE_SIZE) -> list:
+    """KRA citations that recur across rows — the ones worth normalizing up front in every worker."""
+    counts = Counter(
+        str(m.get('kra_citation', '')).upper()
+        for item in items for m in (item.get('matches') or [])
+    )
+    return [text for text, n in counts.most_common(limit) if n > 1]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Worker side
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _init_worker(kind: str, backend: str, warm: list, scoring: str = "ratio", idf=None) -> None:
+    global _worker
+    # Per-row progress prints from every process would just interleave
+    sys.stdout = open(os.devnull, "w")
+
+    if kind in ("score", "score_batch"):
+        from .scrapper import Scrapper
+        _worker = Scrapper(similarity_backend=backend, scoring=scoring)
+        _worker.idf = idf   # the parent's per-run "tfidf" corpus
+    else:
+        from .reconciler import EnhancedReconciler
+        _worker = EnhancedReconciler(similarity_backend=backend)
+
+    for text in warm:
+        normalize(text)
+
+
+def _score_chunk(chunk: list) -> list:
+    return [_worker.score(item) for item in chunk]
+
+
+def _score_batch_chunk(chunk: list) -> list:
+    return _worker.score_batch(chunk)
+
+
+def _reconcile_chunk(chunk: list) -> list:
+    # 'matches' is the parent's own list; don't pickle it back (see reconcile_parallel)
+    rows = [_worker._reconcile_row(sheet_item, kra_item) for sheet_item, kra_item in chunk]
+    for row in rows:
+        row.pop('matches', None)
+    return rows
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Driver side
+# ─────────────────────────────────────────────────────────────────────────────
+
+def resolve_workers(workers: int | None) -> int:
+    cpus = os.process_cpu_count() if hasattr(os, "process_cpu_count") else os.cpu_count()
+    return max(1, workers or cpus or 1)
+
+
+def should_parallelize(items: list, workers: int | None) -> bool:
+    """Worth a pool only with more than one worker and enough comparisons to amortise it."""
+    return resolve_workers(workers) > 1 and workload(items) >= PARALLEL_THRESHOLD
+
+
+def run_parallel(
+    kind: str, chunks_of: list, backend: str, workers: int, warm: list, scoring: str = "ratio", idf=None,
+) -> list | None:
+    """
+    Maps chunks over a fresh pool and flattens the results in order.
+    Returns None if the pool can't be used, so callers can fall back to in-process.
+    """
+    chunks = _chunks(chunks_of, workers)
+    fn     = {"score": _score_chunk, "score_batch": _score_batch_chunk, "reconcile": _reconcile_chunk}[kind]
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=(kind, backend, warm, scoring, idf),
+        ) as pool:
+            return [row for rows in pool.map(fn, chunks) for row in rows]
+    except Exception as e:
+        errhandler(e, log="run_parallel", path="parallel")
+        print(f"⚠️ Parallel scoring unavailable ({type(e).__name__}) — scoring in-process")
+        return None
+
+
+def score_parallel(
+    items: list, backend: str = DEFAULT, workers: int | None = None, batch: bool = False, scoring: str = "ratio", idf=None,
+) -> list | None:
+    """Scrapper.score() (or score_batch() per chunk) over every item, sharded across processes."""
+    workers = resolve_workers(workers)
+    print(f"🧵 Scoring {len(items)} records across {workers} processes ({workload(items)} candidates)")
+    return run_parallel("score_batch" if batch else "score", items, backend, workers, _shared_citations(items), scoring, idf)
+
+
+def reconcile_parallel(pairs: list, backend: str = DEFAULT, workers: int | None = None) -> list | None:
+    """EnhancedReconciler._reconcile_row() over (sheet_item, kra_item) pairs, sharded across processes."""
+    workers = resolve_workers(workers)
+    kra     = [k for _, k in pairs if k]
+    print(f"🧵 Reconciling {len(pairs)} records across {workers} processes ({workload(kra)} candidates)")
+    rows = run_parallel("reconcile", pairs, backend, workers, _shared_citations(kra))
+    if rows is not None:
+        for row, (_, kra_item) in zip(rows, pairs):
+            row['matches'] = kra_item.get('matches', []) if kra_item else []
+    return rows
@@ -0,0 +1,200 @@
+# modules/parsers.py
+# Pluggable backends for turning an iLaw result table into match dicts.
+# Every backend must produce exactly what the original full-BeautifulSoup parse did;
+# `python -m benchmarks.parsers` checks that and times them against each other.
+
+import re
+from functools import lru_cache
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+_TABLE_TAG = re.compile(r'<table[\s>]', re.IGNORECASE)
+_TABLE_TAGS = re.compile(r'<(/?)(table|thead|tbody|tfoot|tr|td|th)\b[^>]*>', re.IGNORECASE)
+_SECTIONS = {'table', 'thead', 'tbody', 'tfoot'}
+
+
+def clean_text(text) -> str:
+    if not text:
+        return ""
+    text = ' '.join(str(text).split())
+    return text.encode('ascii', 'ignore').decode().strip()
+
+
+def _joined_text(strings) -> str:
+    """Same as BeautifulSoup's get_text(strip=True): strip each string, drop empties, join."""
+    return "".join(t for t in (s.strip() for s in strings) if t)
+
+
+def _has_class(value, name: str) -> bool:
+    return bool(value) and name in value.split()
+
+
+def _as_table(html_string: str) -> str:
+    """HTML5 tree builders drop <tr>/<td> outside a table; bare row fragments get wrapped."""
+    return html_string if _TABLE_TAG.search(html_string) else f"<table>{html_string}</table>"
+
+
+def _well_formed(html_string: str) -> bool:
+    """
+    Every table tag explicitly closed and properly nested (cells in rows, rows in a
+    table, or all rows bare when there is no table at all). html.parser keeps
+    malformed markup as written while the HTML5 builders of lxml / selectolax repair
+    it, so only input passing this check gives them the same rows as the soup reference.
+    """
+    bare  = not _TABLE_TAG.search(html_string)
+    stack = []
+    for m in _TABLE_TAGS.finditer(html_string):
+        closing, tag = m.group(1), m.group(2).lower()
+        top = stack[-1] if stack else None
+        if closing:
+            if top != tag:
+                return False
+            stack.pop()
+            continue
+        if tag in ('td', 'th'):
+            ok = top == 'tr'
+        elif tag == 'tr':
+            ok = top in _SECTIONS or (top is None and bare)
+        elif tag == 'table':
+            ok = top in (None, 'td', 'th')
+        else:
+            ok = top == 'table'
+        if not ok:
+            return False
+        stack.append(tag)
+    return not stack
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Backends — each yields (citation, internal_ref, assignee) per result row
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _soup_rows(soup):
+    for row in soup.find_all('tr'):
+        cols = row.find_all('td')
+        if len(cols) < 3:
+            continue
+
+        # Citation — prefer tooltip title if present
+        span = cols[1].find('span', class_='tooltipTable')
+        if span and span.get('tooltiptitle'):
+            citation = span.get('tooltiptitle')
+        else:
+            citation = cols[1].get_text(strip=True)
+
+        internal_ref = cols[2].get_text(strip=True)
+        assignee     = cols[3].get_text(strip=True) if len(cols) > 3 else ''
+        yield citation, internal_ref, assignee
+
+
+def _rows_soup(html_string: str):
+    """Reference implementation: full html.parser tree."""
+    return _soup_rows(BeautifulSoup(html_string, 'html.parser'))
+
+
+def _rows_strainer(html_string: str):
+    """html.parser, but only <tr> subtrees are ever built."""
+    return _soup_rows(BeautifulSoup(html_string, 'html.parser', parse_only=SoupStrainer('tr')))
+
+
+def _rows_lxml(html_string: str):
+    import lxml.html
+
+    root = lxml.html.fragment_fromstring(_as_table(html_string), create_parent="div")
+    for row in root.iter('tr'):
+        cols = list(row.iter('td'))
+        if len(cols) < 3:
+            continue
+
+        span = next(
+            (e for e in cols[1].iter('span') if _has_class(e.get('class'), 'tooltipTable')),
+            None,
+        )
+        if span is not None and span.get('tooltiptitle'):
+            citation = span.get('tooltiptitle')
+        else:
+            citation = _joined_text(cols[1].itertext())
+
+        internal_ref = _joined_text(cols[2].itertext())
+        assignee     = _joined_text(cols[3].itertext()) if len(cols) > 3 else ''
+        yield citation, internal_ref, assignee
+
+
+def _rows_selectolax(html_string: str):
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(_as_table(html_string))
+    for row in tree.css('tr'):
+        cols = row.css('td')
+        if len(cols) < 3:
+            continue
+
+        span = next(
+            (e for e in cols[1].css('span') if _has_class(e.attributes.get('class'), 'tooltipTable')),
+            None,
+        )
+        if span is not None and span.attributes.get('tooltiptitle'):
+            citation = span.attributes.get('tooltiptitle')
+        else:
+            citation = cols[1].text(deep=True, separator='', strip=True)
+
+        internal_ref = cols[2].text(deep=True, separator='', strip=True)
+        assignee     = cols[3].text(deep=True, separator='', strip=True) if len(cols) > 3 else ''
+        yield citation, internal_ref, assignee
+
+
+BACKENDS = {
+    "selectolax": _rows_selectolax,
+    "lxml":       _rows_lxml,
+    "strainer":   _rows_strainer,
+    "soup":       _rows_soup,
+}
+
+_AUTO_ORDER = ["selectolax", "lxml", "strainer"]
+
+# Backends that repair markup HTML5-style; malformed tables go to "soup" instead
+_HTML5 = {"selectolax", "lxml"}
+
+
+@lru_cache(maxsize=None)
+def backend_available(name: str) -> bool:
+    try:
+        if name == "selectolax":
+            import selectolax.lexbor  # noqa: F401
+        elif name == "lxml":
+            import lxml.html  # noqa: F401
+        return name in BACKENDS
+    except ImportError:
+        return False
+
+
+def available_backends() -> list:
+    return [name for name in BACKENDS if backend_available(name)]
+
+
+def resolve_backend(name: str = "auto") -> str:
+    """'auto' picks the fastest installed backend; unknown/missing names fall back to it."""
+    if name != "auto" and backend_available(name):
+        return name
+    return next(n for n in _AUTO_ORDER if backend_available(n))
+
+
+def parse_results(html_string: str, backend: str = "auto") -> list:
+    """Parse KRA iLaw HTML result table into a list of match dicts."""
+    if not html_string:
+        return []
+
+    name = resolve_backend(backend)
+    if name in _HTML5 and not _well_formed(html_string):
+        name = "soup"
+
+    matches = []
+    for citation, internal_ref, assignee in BACKENDS[name](html_string):
+        entry = {
+            "kra_citation": clean_text(citation),
+            "kra_ref":      clean_text(internal_ref).upper(),
+            "kra_assignee": clean_text(assignee).upper(),
+        }
+        if entry["kra_citation"] or entry["kra_ref"]:
+            matches.append(entry)
+    return matches
@@ -0,0 +1,65 @@
+# modules/planner.py
+# Planning stage between Scanner and the fetcher.
+# Rows that resolve to the same iLaw keyword (amendments, duplicated entries, multiple
+# parties) are collapsed into one search; the parsed matches are fanned back out per row.
+
+import re
+
+_E_NUMBER = re.compile(r'\bE0*(\d+)\b', re.IGNORECASE)
+
+
+def canonical_keyword(keyword) -> str:
+    """
+    'E017 of 2026' / 'e17  OF 2026' → 'E17 OF 2026'
+    Leading zeros are dropped from the E-number; case and spacing are normalized.
+    """
+    text = " ".join(str(keyword or "").upper().split())
+    return _E_NUMBER.sub(r'E\1', text)
+
+
+class SearchPlan:
+    """
+    Groups Scanner records by canonical keyword.
+    `requests` holds one representative record per distinct search, in first-seen order.
+    """
+
+    def __init__(self, items: list):
+        self.items    = items
+        self.requests = []
+        self.groups   = []   # parallel to requests: indices into items
+
+        seen = {}
+        for i, item in enumerate(items):
+            key = canonical_keyword(item.get('keyword', ''))
+            if key not in seen:
+                seen[key] = len(self.requests)
+                self.requests.append(item)
+                self.groups.append([])
+            self.groups[seen[key]].append(i)
+
+    @property
+    def duplicates(self) -> int:
+        return len(self.items) - len(self.requests)
+
+    def fan_out_one(self, request_idx: int, result: dict) -> list:
+        """Returns [(item_index, result)] for every row that shares this search."""
+        out = []
+        for i in self.groups[request_idx]:
+            item = self.items[i]
+            out.append((i, {
+                **result,
+                "excel_row":      item.get('excel_row'),
+                "original_case":  item.get('case_number', ''),
+                "case_name":      item.get('citation', ''),
+                "search_keyword": item.get('keyword', ''),
+                "matches":        list(result.get('matches', [])),
+            }))
+        return out
+
+    def fan_out(self, results: list) -> list:
+        """Expands per-request results back to one result per original item, in item order."""
+        expanded = [None] * len(self.items)
+        for r_idx, result in enumerate(results):
+            for i, row_result in self.fan_out_one(r_idx, result):
+                expanded[i] = row_result
+        return expanded
@@ -1,15 +1,22 @@
 
 import re
-from difflib import SequenceMatcher
 from typing import List, Dict, Optional, Tuple
-from helpers import clean_citation, clean_citation_text, get_court_type
+from helpers import normalize
+from .features import FeatureStore
+from .parallel import reconcile_parallel, should_parallelize
+from .planner import canonical_keyword
+from .similarity import DEFAULT, get_bounded_ratio, get_ratio
 
 class EnhancedReconciler:
     """
     Advanced reconciliation with multiple matching strategies
     """
     
-    def __init__(self):
+    def __init__(self, similarity_backend: str = DEFAULT, features: Optional[FeatureStore] = None):
+        self.similarity_backend = similarity_backend
+        self.features = features if features is not None else FeatureStore()   # see modules.features
+        self.ratio = get_ratio(similarity_backend)   # see modules.similarity
+        self.bounded_ratio = get_bounded_ratio(similarity_backend)
         self.match_thresholds = {
             'exact': 1.0,
             'high': 0.85,
@@ -17,50 +24,81 @@ class EnhancedReconciler:
             'low': 0.50
         }
     
-    def reconcile(self, sheet_data: List[Dict], kra_data: List[Dict]) -> List[Dict]:
+    def reconcile(self, sheet_data: List[Dict], kra_data: List[Dict], workers: Optional[int] = None) -> List[Dict]:
         """
         Perform enhanced reconciliation with multiple strategies
+        Large batches (see modules.parallel.PARALLEL_THRESHOLD) are scored across
+        `workers` processes (default: all cores); workers=1 forces in-process.
         """
-        results = []
+        index = self._index(kra_data)
+        pairs = [
+            (sheet_item, self._lookup(index, sheet_item.get('case_number', 'Unknown'), sheet_item.get('excel_row')))
+            for sheet_item in sheet_data
+        ]
         
-        for sheet_item in sheet_data:
-            sheet_citation = str(sheet_item.get('citation', '')).upper()
-            sheet_case = sheet_item.get('case_number', 'Unknown')
-            
-            # Get all available matches from KRA data
-            matches = []
-            for kra_item in kra_data:
-                if kra_item.get('original_case') == sheet_case:
-                    matches = kra_item.get('matches', [])
-                    break
-            
-            # Apply multiple matching strategies
-            best_match, confidence, strategy = self._find_best_match(
-                sheet_citation, sheet_case, matches
-            )
-            
-            # Determine status based on confidence
-            status = self._determine_status(confidence)
-            
-            result = {
-                'excel_row': sheet_item.get('excel_row'),
-                'original_case': sheet_case,
-                'case_name': sheet_citation,
-                'search_keyword': sheet_item.get('keyword', ''),
-                'matches_found': len(matches),
-                'status': status,
-                'confidence_score': f"{confidence:.1f}%",
-                'confidence_raw': confidence,
-                'matching_strategy': strategy,
-                'best_match_kra_ref': best_match.get('kra_ref', 'N/A') if best_match else 'N/A',
-                'best_match_kra_citation': best_match.get('kra_citation', 'N/A') if best_match else 'N/A',
-                'best_match_kra_assignee': best_match.get('kra_assignee', 'N/A') if best_match else 'N/A',
-                'matches': matches
-            }
-            
-            results.append(result)
+        if should_parallelize([k for _, k in pairs if k], workers):
+            results = reconcile_parallel(pairs, self.similarity_backend, workers)
+            if results is not None:
+                return results
         
-        return results
+        return [self._reconcile_row(sheet_item, kra_item) for sheet_item, kra_item in pairs]
+    
+    def _reconcile_row(self, sheet_item: Dict, kra_item: Optional[Dict]) -> Dict:
+        sheet_citation = str(sheet_item.get('citation', '')).upper()
+        sheet_case = sheet_item.get('case_number', 'Unknown')
+        
+        # Get all available matches from KRA data
+        matches = kra_item.get('matches', []) if kra_item else []
+        
+        # Apply multiple matching strategies
+        best_match, confidence, strategy = self._find_best_match(
+            sheet_citation, sheet_case, matches
+        )
+        
+        # Determine status based on confidence
+        status = self._determine_status(confidence)
+        
+        return {
+            'excel_row': sheet_item.get('excel_row'),
+            'original_case': sheet_case,
+            'case_name': sheet_citation,
+            'search_keyword': sheet_item.get('keyword', ''),
+            'matches_found': len(matches),
+            'status': status,
+            'confidence_score': f"{confidence:.1f}%",
+            'confidence_raw': confidence,
+            'matching_strategy': strategy,
+            'best_match_kra_ref': best_match.get('kra_ref', 'N/A') if best_match else 'N/A',
+            'best_match_kra_citation': best_match.get('kra_citation', 'N/A') if best_match else 'N/A',
+            'best_match_kra_assignee': best_match.get('kra_assignee', 'N/A') if best_match else 'N/A',
+            'matches': matches
+        }
+    
+    @staticmethod
+    def _index(kra_data: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Groups KRA results by normalized case number, once per reconcile() call.
+        Duplicate case numbers keep every entry, in kra_data order.
+        """
+        index = {}
+        for kra_item in kra_data:
+            index.setdefault(canonical_keyword(kra_item.get('original_case')), []).append(kra_item)
+        return index
+    
+    @staticmethod
+    def _lookup(index: Dict[str, List[Dict]], sheet_case, excel_row=None) -> Optional[Dict]:
+        """
+        O(1) replacement for scanning kra_data per sheet row. When a case number
+        appears on several rows, the entry fetched for this row wins; otherwise the first.
+        """
+        candidates = index.get(canonical_keyword(sheet_case))
+        if not candidates:
+            return None
+        if excel_row is not None and len(candidates) > 1:
+            for kra_item in candidates:
+                if kra_item.get('excel_row') == excel_row:
+                    return kra_item
+        return candidates[0]
     
     def _find_best_match(self, sheet_citation: str, sheet_case: str, matches: List[Dict]) -> Tuple[Optional[Dict], float, str]:
         """
@@ -73,16 +111,19 @@ class EnhancedReconciler:
         best_confidence = 0.0
         best_strategy = ""
         
+        # Sheet side is the same for every match; KRA side comes from the shared cache
+        sheet_norm = normalize(sheet_citation)
+        sheet_court = normalize(sheet_case).court
+        
         for match in matches:
-            kra_citation = str(match.get('kra_citation', '')).upper()
+            kra = self.features.get(match)
             
             # Strategy 1: Exact match (100%)
-            if sheet_citation == kra_citation:
+            if sheet_citation == kra.citation:
                 return match, 100.0, "exact_match"
             
             # Strategy 2: Court type filtering + fuzzy matching
-            sheet_court = get_court_type(sheet_case)
-            kra_court = get_court_type(kra_citation)
+            kra_court = kra.court
             
             # Filter by court type if both are identifiable
             if sheet_court != 'NA' and kra_court != 'NA':
@@ -90,8 +131,8 @@ class EnhancedReconciler:
                     continue
             
             # Strategy 3: Token-based matching (ignoring order)
-            sheet_tokens = clean_citation(sheet_citation)
-            kra_tokens = clean_citation(kra_citation)
+            sheet_tokens = sheet_norm.tokens
+            kra_tokens = kra.tokens
             
             if sheet_tokens and kra_tokens:
                 token_ratio = self._calculate_token_match(sheet_tokens, kra_tokens)
@@ -102,13 +143,14 @@ class EnhancedReconciler:
                     best_strategy = "token_match"
             
             # Strategy 4: String-based matching (preserving order)
-            sheet_string = clean_citation_text(sheet_citation)
-            kra_string = clean_citation_text(kra_citation)
+            sheet_string = sheet_norm.text
+            kra_string = kra.text
             
-            string_ratio = SequenceMatcher(None, sheet_string, kra_string).ratio() * 100
+            # Only worth the full comparison if it could beat the best so far
+            string_ratio = self.bounded_ratio(sheet_string, kra_string, best_confidence / 100 - 1e-9)
             
-            if string_ratio > best_confidence:
-                best_confidence = string_ratio
+            if string_ratio is not None and string_ratio * 100 > best_confidence:
+                best_confidence = string_ratio * 100
                 best_match = match
                 best_strategy = "string_match"
         
@@ -124,20 +166,17 @@ class EnhancedReconciler:
         matched_count = 0
         
         for s_token in sheet_tokens:
-            best_match_ratio = 0.0
+            # Check for exact match first
+            if s_token in kra_tokens:
+                matched_count += 1
+                continue
+            
+            # Fuzzy match for similar tokens: the first one over the threshold settles it,
+            # and the bounded ratio rejects most pairs on length / character counts alone
             for k_token in kra_tokens:
-                # Check for exact match first
-                if s_token == k_token:
-                    best_match_ratio = 1.0
+                if self.bounded_ratio(s_token, k_token, 0.85) is not None:  # Threshold for token match
+                    matched_count += 1
                     break
-                
-                # Fuzzy match for similar tokens
-                ratio = SequenceMatcher(None, s_token, k_token).ratio()
-                if ratio > best_match_ratio:
-                    best_match_ratio = ratio
-            
-            if best_match_ratio >= 0.85:  # Threshold for token match
-                matched_count += 1
         
         return (matched_count / len(sheet_tokens)) * 100
     
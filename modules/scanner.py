@@ -4,8 +4,37 @@
 
 import pandas as pd
 import re
+from helpers import cell_text, parse_case
 from utils import errhandler
 
+# Whole-cell keyword forms, tried in one match (they can't overlap):
+#   E017 of 2026 · E017/2026 · E017 2026  →  e, y
+#   E017                                  →  alone
+#   1403/2026                             →  n, ny
+_KEYWORD_FORMS = re.compile(
+    r'(?P<e>E\d+)(?:\s+of\s+|[/\-_]|\s+)(?P<y>\d{4})'
+    r'|(?P<alone>E\d+)'
+    r'|(?P<n>\d+)[/\-_\s]+(?P<ny>\d{4})',
+    re.IGNORECASE,
+)
+_EMBEDDED = re.compile(r'/(E\d+)/(\d{4})', re.IGNORECASE)
+_DIGITS   = re.compile(r'\d+')
+_YEAR_RUN = re.compile(r'^(19|20)\d{2}$')
+
+# Column forms of the same cascade, for Series.str.extract (see _keywords()):
+# whole-cell forms anchored at both ends, then CaseRef's first E-number / year
+_CELL_FORMS  = re.compile(rf'\A(?:{_KEYWORD_FORMS.pattern})\Z', re.IGNORECASE)
+_FIRST_E     = re.compile(r'E(\d+)', re.IGNORECASE)
+_FIRST_YEAR  = re.compile(r'(?<!\w)((?:19|20)\d{2})(?!\w)')
+
+
+def _extract(values: pd.Series, pattern):
+    # Series.str.extract as plain objects: with pyarrow installed, pandas types the
+    # groups as Arrow strings, or as Arrow nulls when nothing matched, and the two
+    # can't be concatenated. One group comes back as a Series, several as a frame.
+    groups = values.astype(object).str.extract(pattern, expand=pattern.groups > 1)
+    return groups.astype(object)
+
 
 class Scanner:
     def __init__(self, case_num_column, citation_column):
@@ -41,47 +70,30 @@ class Scanner:
         """
         s = case_num.strip()
 
-        # ── Already correct: E017 of 2026 ────────────────────────────────────
-        m = re.match(r'^(E\d+)\s+of\s+(\d{4})$', s, re.IGNORECASE)
+        # ── Whole-cell forms: E017 of 2026 · E017/2026 · E017 2026 · E017 · 1403/2026
+        m = _KEYWORD_FORMS.fullmatch(s)
+        if m and m.group('e'):
+            return f"{m.group('e').upper()} of {m.group('y')}"
+        if m and m.group('alone'):
+            # E{num} alone — pull year from citation
+            year = parse_case(citation).year
+            return f"{m.group('alone').upper()} of {year}" if year else m.group('alone').upper()
         if m:
-            return f"{m.group(1).upper()} of {m.group(2)}"
+            return f"E{m.group('n')} of {m.group('ny')}"
 
         # ── Pattern: anything/E{num}/{year}  e.g. HCCOMMITA/E017/2026 ────────
-        m = re.search(r'/(E\d+)/(\d{4})', s, re.IGNORECASE)
-        if m:
-            return f"{m.group(1).upper()} of {m.group(2)}"
-
-        # ── Pattern: E{num}/{year}  e.g. E017/2026 ───────────────────────────
-        m = re.match(r'^(E\d+)[/\-_](\d{4})$', s, re.IGNORECASE)
+        m = _EMBEDDED.search(s)
         if m:
             return f"{m.group(1).upper()} of {m.group(2)}"
 
-        # ── Pattern: E{num} {year}  e.g. E017 2026 ───────────────────────────
-        m = re.match(r'^(E\d+)\s+(\d{4})$', s, re.IGNORECASE)
-        if m:
-            return f"{m.group(1).upper()} of {m.group(2)}"
-
-        # ── Pattern: E{num} alone — pull year from citation ──────────────────
-        m = re.match(r'^(E\d+)$', s, re.IGNORECASE)
-        if m:
-            yr = re.search(r'\b(20\d{2}|19\d{2})\b', citation)
-            year = yr.group(0) if yr else ""
-            return f"{m.group(1).upper()} of {year}" if year else m.group(1).upper()
-
-        # ── Pattern: plain number/year  e.g. 1403/2026 ───────────────────────
-        m = re.match(r'^(\d+)[/\-_\s]+(\d{4})$', s)
-        if m:
-            return f"E{m.group(1)} of {m.group(2)}"
-
-        # ── Fallback: extract any E+digits and any 4-digit year in the string ─
-        e_match  = re.search(r'E(\d+)', s, re.IGNORECASE)
-        yr_match = re.search(r'\b(20\d{2}|19\d{2})\b', s)
-        if e_match and yr_match:
-            return f"E{e_match.group(1)} of {yr_match.group(1)}"
+        # ── Fallback: any E+digits and any 4-digit year in the string ────────
+        ref = parse_case(s)
+        if ref.e_flag and ref.year:
+            return f"E{ref.e_digits} of {ref.year}"
 
         # ── Fallback: any digits + year ───────────────────────────────────────
-        nums  = re.findall(r'\d+', s)
-        years  = [n for n in nums if re.match(r'^(19|20)\d{2}$', n)]
+        nums   = _DIGITS.findall(s)
+        years  = [n for n in nums if _YEAR_RUN.match(n)]
         non_yr = [n for n in nums if n not in years]
         if non_yr and years:
             return f"E{non_yr[-1]} of {years[-1]}"
@@ -94,43 +106,155 @@ class Scanner:
         """
         Extract records from the uploaded file.
         Keyword is always formatted as "E{number} of {year}" for eJuris.
+        Text sheets are read a column at a time (see _extract_columns()); a sheet with
+        no text column at all goes row by row, as iterrows() would retype its cells.
         """
         if sheet is None:
             print("❌ No sheet provided")
             return None
 
-        extracted_data = []
-
         try:
-            for idx, row in sheet.iterrows():
-                case_num_raw = row.get(self.case_num_column, "")
-                citation_raw = row.get(self.citation_column, "")
-
-                case_num = "" if pd.isna(case_num_raw) else str(case_num_raw).strip()
-                citation = "" if pd.isna(citation_raw) else str(citation_raw).strip()
+            if self._columnar(sheet):
+                extracted_data = self._extract_columns(sheet)
+            else:
+                extracted_data = self._extract_rows(sheet)
 
-                if not case_num and not citation:
-                    continue
+            self.file_data = extracted_data
+            print(f"✅ Sheet data extraction was successful. Extracted {len(extracted_data)} records.")
+            return extracted_data
 
-                keyword = self.build_ejuris_keyword(case_num, citation)
+        except KeyError as e:
+            errhandler(f"Column mismatch: {e}", log="file_extractor", path="scanner")
+            return []
+        except Exception as e:
+            errhandler(f"Unexpected error: {e}", log="file_extractor", path="scanner")
+            return []
 
-                record = {
-                    "excel_row":   idx + 2,
-                    "case_number": case_num.upper(),
-                    "citation":    re.sub(r'\s+', ' ', citation).upper(),
-                    "keyword":     keyword,
-                }
+    def stream_extractor(self, chunks) -> list:
+        """
+        file_extractor() over a sheet that arrives in pieces (see
+        Validator.read_chunks()); only one chunk is held at a time.
+        """
+        extracted_data = []
 
-                extracted_data.append(record)
-                print(f"Row {idx+2}: Case: {case_num}, Citation: {citation[:30]}..., Keyword: {keyword}")
+        try:
+            for chunk in chunks:
+                if self._columnar(chunk):
+                    extracted_data.extend(self._extract_columns(chunk))
+                else:
+                    extracted_data.extend(self._extract_rows(chunk))
 
             self.file_data = extracted_data
             print(f"✅ Sheet data extraction was successful. Extracted {len(extracted_data)} records.")
             return extracted_data
 
         except KeyError as e:
-            errhandler(f"Column mismatch: {e}", log="file_extractor", path="scanner")
+            errhandler(f"Column mismatch: {e}", log="stream_extractor", path="scanner")
             return []
         except Exception as e:
-            errhandler(f"Unexpected error: {e}", log="file_extractor", path="scanner")
-            return []
\ No newline at end of file
+            errhandler(f"Unexpected error: {e}", log="stream_extractor", path="scanner")
+            return []
+
+    @staticmethod
+    def _columnar(sheet) -> bool:
+        # iterrows() hands out each row at the frame's common dtype, which is object
+        # (cells exactly as stored) as soon as one column holds text
+        return not sheet.columns.has_duplicates and any(
+            pd.api.types.is_object_dtype(t) or pd.api.types.is_string_dtype(t) for t in sheet.dtypes
+        )
+
+    def _extract_columns(self, sheet) -> list:
+        case_num = self._column(sheet, self.case_num_column)
+        citation = self._column(sheet, self.citation_column)
+
+        keep = ((case_num != "") | (citation != "")).to_numpy()
+        case_num, citation = case_num[keep], citation[keep]
+
+        rows     = (sheet.index[keep] + 2).tolist()
+        keywords = self._keywords(case_num, citation)
+        cases    = case_num.str.upper().tolist()
+        cleaned  = citation.str.replace(r'\s+', ' ', regex=True).str.upper().tolist()
+
+        print(f"📄 {len(rows)} of {len(sheet)} rows carry a case number or citation")
+        return [
+            {"excel_row": row, "case_number": case, "citation": cite, "keyword": keyword}
+            for row, case, cite, keyword in zip(rows, cases, cleaned, keywords)
+        ]
+
+    @staticmethod
+    def _column(sheet, column) -> pd.Series:
+        """Stripped cell text, "" for blanks — cell_text() of what row.get(column, "") gave per row."""
+        if column not in sheet.columns:
+            return pd.Series("", index=sheet.index, dtype=object)
+        return sheet[column].astype(object).map(cell_text)
+
+    @classmethod
+    def _keywords(cls, case_num: pd.Series, citation: pd.Series) -> list:
+        """
+        build_ejuris_keyword() over whole columns: each step of its cascade fills the
+        rows still open. Steps that go through CaseRef's integers only take ASCII rows;
+        whatever is left (bare digit runs, unparseable cells) goes through
+        build_ejuris_keyword() itself.
+        """
+        case_num = case_num.reset_index(drop=True)
+        citation = citation.reset_index(drop=True)
+        keyword  = pd.Series(None, index=case_num.index, dtype=object)
+
+        # ── Whole-cell forms: E017 of 2026 · E017/2026 · E017 2026 · E017 · 1403/2026
+        forms = _extract(case_num, _CELL_FORMS)
+        hit   = forms['e'].notna()
+        keyword[hit] = forms['e'][hit].str.upper() + " of " + forms['y'][hit]
+
+        hit = forms['n'].notna()
+        keyword[hit] = "E" + forms['n'][hit] + " of " + forms['ny'][hit]
+
+        # E{num} alone — year from the citation
+        hit  = forms['alone'].notna() & citation.map(str.isascii)
+        year = _extract(citation[hit], _FIRST_YEAR)
+        e    = forms['alone'][hit].str.upper()
+        keyword[hit] = (e + " of " + year).where(year.notna(), e)
+
+        # ── Pattern: anything/E{num}/{year}  e.g. HCCOMMITA/E017/2026 ────────
+        rest     = forms.isna().all(axis=1)
+        embedded = _extract(case_num[rest], _EMBEDDED)
+        hit      = embedded[0].notna()
+        keyword.loc[hit.index[hit]] = embedded[0][hit].str.upper() + " of " + embedded[1][hit]
+
+        # ── Fallback: any E+digits and any 4-digit year in the string ────────
+        rest &= keyword.isna() & case_num.map(str.isascii)
+        e     = _extract(case_num[rest], _FIRST_E)
+        year  = _extract(case_num[rest], _FIRST_YEAR)
+        hit   = e.notna() & year.notna()
+        keyword.loc[hit.index[hit]] = "E" + e[hit] + " of " + year[hit]
+
+        # ── Rest: digits + year, or the raw value ────────────────────────────
+        rest = keyword.isna()
+        keyword[rest] = [cls.build_ejuris_keyword(c, t) for c, t in zip(case_num[rest], citation[rest])]
+        return keyword.tolist()
+
+    def _extract_rows(self, sheet) -> list:
+        extracted_data = []
+
+        for idx, row in sheet.iterrows():
+            case_num_raw = row.get(self.case_num_column, "")
+            citation_raw = row.get(self.citation_column, "")
+
+            case_num = cell_text(case_num_raw)
+            citation = cell_text(citation_raw)
+
+            if not case_num and not citation:
+                continue
+
+            keyword = self.build_ejuris_keyword(case_num, citation)
+
+            record = {
+                "excel_row":   idx + 2,
+                "case_number": case_num.upper(),
+                "citation":    re.sub(r'\s+', ' ', citation).upper(),
+                "keyword":     keyword,
+            }
+
+            extracted_data.append(record)
+            print(f"Row {idx+2}: Case: {case_num}, Citation: {citation[:30]}..., Keyword: {keyword}")
+
+        return extracted_data
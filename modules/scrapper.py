@@ -2,26 +2,51 @@
 import requests
 from bs4 import BeautifulSoup
 from utils import errhandler, syshandler
-from helpers import clean_citation, clean_citation_text, get_court_type
+from helpers import normalize, parse_case
+from .batch import STRATEGIES, score_batch, worth_batching
+from . import columnar
+from .cache import SearchCache
+from .features import FeatureStore, extract
+from .journal import RunJournal
+from .parallel import score_parallel, should_parallelize
+from .parsers import clean_text, parse_results
+from .planner import SearchPlan
+from .session import SessionManager, SessionStore
+from .similarity import DEFAULT, get_bounded_ratio, get_ratio
+from .tfidf import Idf
+from .throttle import RateController
 
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 import urllib.parse
-from difflib import SequenceMatcher
 from datetime import datetime
 import openpyxl
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
+import aiohttp
+import asyncio
 import json
+import queue
+import threading
 import time
-import re
 import traceback
 
+# stream() scores whatever has landed, up to this many rows, in one score_many() call
+STREAM_WINDOW = 1_000
+
 
 class Scrapper:
     """
     KRA iLaw scrapper with fixed authentication and improved matching.
     """
 
+    AJAX_HEADERS = {
+        "X-Requested-With": "XMLHttpRequest",
+        "Content-Type":     "application/x-www-form-urlencoded",
+        "Referer":          "https://ilaw.kra.go.ke/ilaw/search/universal",
+    }
+    PROBE_KEYWORD = "E0 of 1900"   # cheap search used to validate a saved session
+    SESSION_REPLAYS = 2   # re-logins one search may ride out before it is counted as failed
+
     def __init__(
         self,
         session=None,
@@ -31,6 +56,13 @@ class Scrapper:
         data: list | None = None,
         username: str = "",
         password: str = "",
+        cache: SearchCache | None = None,
+        throttle: RateController | None = None,
+        session_store: SessionStore | None = None,
+        parser_backend: str = "auto",
+        similarity_backend: str = DEFAULT,
+        scoring: str = "ratio",
+        features: FeatureStore | None = None,
     ):
         self.session      = session or requests.Session()
         self.auth_url     = auth_url or "https://ilaw.kra.go.ke/ilaw/users/login"
@@ -40,6 +72,18 @@ class Scrapper:
         self.password     = password
         self.authenticated = False
         self.results      = []
+        self.sessions     = SessionManager(self)
+        self.session_store = session_store if session_store is not None else SessionStore()
+        self.auth_method  = None   # winning _try_auth_method_N, remembered across runs
+        self.login_fields = None   # {'username_field', 'password_field'} that worked
+        self.parser_backend = parser_backend   # see modules.parsers.BACKENDS
+        self.similarity_backend = similarity_backend   # see modules.similarity.BACKENDS
+        self.scoring      = scoring if scoring in STRATEGIES else "ratio"   # see modules.batch.STRATEGIES
+        self.idf          = None   # "tfidf" idf for the current run, see fit_idf()
+        self.features     = features if features is not None else FeatureStore()   # see modules.features
+        self.cache        = cache if cache is not None else SearchCache()
+        self.throttle     = throttle or RateController()
+        self.failed_searches = 0   # searches in the last extract() that errored instead of answering
 
         self.session.headers.update({
             "User-Agent":      "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
@@ -54,19 +98,108 @@ class Scrapper:
     # Authentication
     # ─────────────────────────────────────────────────────────────────────────
 
-    def authenticator(self) -> bool:
+    def authenticator(self, reuse: bool = True) -> bool:
+        """
+        Logs in to iLaw. With reuse=True a saved, unexpired session is validated
+        with one search request first; otherwise the last winning method goes first.
+        """
         print(f"\n🔐 Authenticating to KRA iLaw with username: {self.username}")
 
-        if self._try_auth_method_1():
-            return True
-        if self._try_auth_method_2():
-            return True
-        if self._try_auth_method_3():
+        record = self.session_store.load(self.username, self.password) if self.session_store else None
+        if record:
+            self.auth_method  = record.get("method")
+            self.login_fields = record.get("fields") or None
+
+        if reuse and SessionStore.is_fresh(record) and self._resume_session(record):
             return True
 
+        methods = {
+            1: self._try_auth_method_1,
+            2: self._try_auth_method_2,
+            3: self._try_auth_method_3,
+        }
+        for n in sorted(methods, key=lambda n: n != self.auth_method):
+            if methods[n]():
+                self.auth_method = n
+                self._save_session()
+                return True
+
         print("❌ All authentication methods failed")
         return False
 
+    def _resume_session(self, record: dict) -> bool:
+        """Loads saved cookies and checks them with a single cheap search."""
+        self.session.cookies.clear()
+        SessionStore.restore_cookies(record, self.session.cookies)
+        try:
+            response = self.session.post(
+                f"{self.url}{urllib.parse.quote(self.PROBE_KEYWORD)}",
+                data={"dataType": "litigation_data"}, headers=self.AJAX_HEADERS, timeout=15
+            )
+            alive = response.status_code == 200 and not self.sessions.is_expired(
+                response.status_code, response.url, response.text
+            )
+        except requests.RequestException:
+            alive = False
+
+        if alive:
+            print("♻️ Reusing saved iLaw session")
+            self.authenticated = True
+            return True
+
+        print("⌛ Saved session has expired — logging in again")
+        self.session.cookies.clear()
+        return False
+
+    def _save_session(self) -> None:
+        if self.session_store:
+            self.session_store.save(
+                self.username, self.password,
+                self.auth_method, self.login_fields, self.session.cookies
+            )
+
+    def _login_fields(self, soup) -> dict:
+        """Remembered field names from the last good login, with fresh hidden/CSRF values."""
+        if not self.login_fields:
+            return self._detect_login_fields(soup)
+
+        form = next((f for f in soup.find_all('form') if f.find('input', {'type': 'password'})), soup)
+        hidden = {
+            inp.get('name'): inp.get('value', '')
+            for inp in form.find_all('input', {'type': 'hidden'}) if inp.get('name')
+        }
+        return {**self.login_fields, 'hidden': hidden}
+
+    def _submit_login(self, headers: dict) -> tuple:
+        """
+        GETs the login form and POSTs the credentials under the remembered field names.
+        If those are rejected, iLaw may have renamed the form: they are forgotten and the
+        login is retried once with freshly detected names.
+        Returns: (login page response, auth response, fields used)
+        """
+        while True:
+            login_page = self.session.get(self.auth_url, timeout=15)
+            soup       = BeautifulSoup(login_page.text, 'html.parser')
+            remembered = bool(self.login_fields)
+            fields     = self._login_fields(soup)
+
+            payload = {
+                fields['username_field']: self.username,
+                fields['password_field']: self.password,
+            }
+            # Add hidden fields (CSRF tokens etc.)
+            payload.update(fields['hidden'])
+
+            response = self.session.post(
+                self.auth_url, data=payload, headers=headers,
+                allow_redirects=True, timeout=30
+            )
+            if not remembered or self._is_logged_in(response):
+                return login_page, response, fields
+
+            print("⚠️ Remembered login fields were rejected — detecting the form again")
+            self.login_fields = None
+
     def _detect_login_fields(self, soup) -> dict:
         """
         Detect the actual username and password field names from the login form.
@@ -179,19 +312,6 @@ class Scrapper:
         """Primary: detect fields from live page, POST with correct field names."""
         try:
             print("🔄 Trying Method 1: Smart field detection...")
-            login_page = self.session.get(self.auth_url, timeout=15)
-            print(f"📥 Login page status: {login_page.status_code}")
-
-            soup   = BeautifulSoup(login_page.text, 'html.parser')
-            fields = self._detect_login_fields(soup)
-
-            payload = {
-                fields['username_field']: self.username,
-                fields['password_field']: self.password,
-            }
-            # Add hidden fields (CSRF tokens etc.)
-            payload.update(fields['hidden'])
-
             headers = {
                 'Content-Type': 'application/x-www-form-urlencoded',
                 'Origin':       'https://ilaw.kra.go.ke',
@@ -202,16 +322,15 @@ class Scrapper:
                 'Sec-Fetch-User': '?1',
             }
 
-            response = self.session.post(
-                self.auth_url, data=payload, headers=headers,
-                allow_redirects=True, timeout=30
-            )
+            login_page, response, fields = self._submit_login(headers)
+            print(f"📥 Login page status: {login_page.status_code}")
             print(f"📥 Auth response status: {response.status_code}")
             print(f"📥 Final URL: {response.url}")
 
             if self._is_logged_in(response):
                 print("✅ Method 1 successful")
                 self.authenticated = True
+                self.login_fields  = {k: fields[k] for k in ('username_field', 'password_field')}
                 return True
 
             print("❌ Method 1 failed")
@@ -231,15 +350,6 @@ class Scrapper:
 
             # Visit homepage to pick up cookies
             self.session.get("https://ilaw.kra.go.ke", timeout=10)
-            login_page = self.session.get(self.auth_url, timeout=15)
-            soup   = BeautifulSoup(login_page.text, 'html.parser')
-            fields = self._detect_login_fields(soup)
-
-            payload = {
-                fields['username_field']: self.username,
-                fields['password_field']: self.password,
-            }
-            payload.update(fields['hidden'])
 
             headers = {
                 'Content-Type': 'application/x-www-form-urlencoded',
@@ -247,14 +357,12 @@ class Scrapper:
                 'Referer':      self.auth_url,
             }
 
-            response = self.session.post(
-                self.auth_url, data=payload, headers=headers,
-                allow_redirects=True, timeout=30
-            )
+            _, response, fields = self._submit_login(headers)
 
             if self._is_logged_in(response):
                 print("✅ Method 2 successful")
                 self.authenticated = True
+                self.login_fields  = {k: fields[k] for k in ('username_field', 'password_field')}
                 return True
 
             print("❌ Method 2 failed")
@@ -303,6 +411,7 @@ class Scrapper:
                     if self._is_logged_in(response):
                         print(f"✅ Method 3 successful (user='{uname}', pass='{pname}')")
                         self.authenticated = True
+                        self.login_fields  = {'username_field': uname, 'password_field': pname}
                         return True
 
             print("❌ Method 3 failed")
@@ -315,7 +424,7 @@ class Scrapper:
     # Extractor
     # ─────────────────────────────────────────────────────────────────────────
 
-    def extractor(self) -> Optional[List[Dict[str, Any]]]:
+    def extractor(self, concurrency: int | None = None) -> Optional[List[Dict[str, Any]]]:
         if not self.authenticated:
             print("❌ Not authenticated. Please login first.")
             return None
@@ -323,99 +432,260 @@ class Scrapper:
             print("⚠️ No data to process")
             return []
 
-        final_results = []
-        print(f"⌛ Starting extraction for {len(self.data)} records...")
+        return self.extract(self.data, concurrency=concurrency)
 
-        ajax_headers = {
-            "X-Requested-With": "XMLHttpRequest",
-            "Content-Type":     "application/x-www-form-urlencoded",
-            "Referer":          "https://ilaw.kra.go.ke/ilaw/search/universal",
-        }
-        payload = {"dataType": "litigation_data"}
+    def extract(
+        self,
+        items: list,
+        concurrency: int | None = None,
+        on_result=None,
+        keep_results: bool = True,
+        stop: threading.Event | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Blocking wrapper around extract_async() for the CLI and Streamlit."""
+        return asyncio.run(
+            self.extract_async(items, concurrency=concurrency, on_result=on_result, keep_results=keep_results, stop=stop)
+        )
 
-        for i, item in enumerate(self.data):
-            if i > 0 and i % 10 == 0:
-                time.sleep(2)   # polite rate limiting
+    def stream(
+        self,
+        items: list,
+        concurrency: int | None = None,
+        journal: RunJournal | None = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch → parse → score as a pipeline: yields one reconciled row (see score())
+        per item as soon as its search lands, in completion order.
+        The event loop runs in a background thread, so scoring here overlaps network
+        wait, and each raw match list is dropped once its row has been scored.
+        Results that land while earlier ones are being scored queue up, and are
+        scored together (up to STREAM_WINDOW at a time) through score_many(), so
+        bursts of cache hits and replayed rows take the batch / process-pool paths.
+        With a journal, rows it already holds are replayed without a search and every
+        new search outcome is appended to it as it lands (see RunJournal). Searches that
+        failed (timeouts, dropped connections, exhausted retries) are yielded as
+        NOT FOUND but not journaled, and the run is left open so a resume retries them.
+        Closing the generator (or an exception in the consuming loop) stops the
+        background fetch: no new searches are sent once it is dropped.
+        """
+        if self.scoring == "tfidf":
+            self.fit_idf(item.get('citation', '') for item in items)
+        if journal:
+            replayed = list(journal.completed.values())
+            for start in range(0, len(replayed), STREAM_WINDOW):
+                yield from self.score_many(replayed[start:start + STREAM_WINDOW])
+            items = journal.pending()
+        if not items:
+            if journal and not journal.finished:
+                journal.finish()
+            return
+
+        done  = object()
+        inbox = queue.Queue()
+        stop  = threading.Event()
+
+        def on_result(_i, result):
+            if journal and 'error' not in result:
+                journal.record(result)
+            inbox.put(result)
+
+        def produce():
+            try:
+                self.extract(items, concurrency=concurrency, keep_results=False, on_result=on_result, stop=stop)
+                if journal and not self.sessions.failed and not stop.is_set() and not self.failed_searches:
+                    journal.finish()
+            except Exception as e:
+                errhandler(e, log="stream", path="scrapper")
+                inbox.put(e)
+            finally:
+                if journal:
+                    journal.close()
+                inbox.put(done)
 
-            keyword    = item['keyword']
-            safe_kw    = urllib.parse.quote(keyword)
-            query_url  = f"{self.url}{safe_kw}"
+        threading.Thread(target=produce, name="ilaw-fetch", daemon=True).start()
 
-            print(f"\n{'='*50}")
-            print(f"🔎 Record {i+1}/{len(self.data)}")
-            print(f"📋 Case:    {item.get('case_number', 'N/A')}")
-            print(f"🔑 Keyword: {keyword}")
+        try:
+            finished = False
+            while not finished:
+                # Block for the next result, then take whatever else has landed meanwhile
+                window = [inbox.get()]
+                while len(window) < STREAM_WINDOW:
+                    try:
+                        window.append(inbox.get_nowait())
+                    except queue.Empty:
+                        break
+
+                results = []
+                for result in window:
+                    if result is done:
+                        finished = True
+                    elif isinstance(result, Exception):
+                        yield from self.score_many(results)
+                        raise result
+                    else:
+                        results.append(result)
+                if results:
+                    yield from self.score_many(results)
+        finally:
+            stop.set()
 
-            try:
-                response = self.session.post(
-                    query_url, data=payload, headers=ajax_headers, timeout=30
-                )
+    # ─────────────────────────────────────────────────────────────────────────
+    # Async extraction engine
+    # ─────────────────────────────────────────────────────────────────────────
+
+    async def extract_async(
+        self,
+        items: list,
+        concurrency: int | None = None,
+        on_result=None,
+        keep_results: bool = True,
+        stop: threading.Event | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search iLaw for every item over one pooled aiohttp session.
+        `concurrency` is a hard ceiling on in-flight requests; below it the shared
+        RateController adapts the window and request rate to how iLaw is coping.
+        Rows sharing a keyword are searched once (see SearchPlan) and fanned back out.
+        Results keep the input order; on_result(index, result) fires as each lands.
+        With keep_results=False nothing is retained and [] is returned (see stream()).
+        Once `stop` is set no further searches start; those in flight still land.
+        A search that errors comes back as an empty result carrying an 'error' key
+        (see _empty_result()); self.failed_searches counts them.
+        """
+        if not items:
+            return []
+
+        plan = SearchPlan(items)
+        if plan.duplicates:
+            print(f"🧮 {len(plan.requests)} unique searches for {len(items)} records ({plan.duplicates} duplicates collapsed)")
+
+        ceiling = max(1, concurrency or self.throttle.max_window)
+        print(f"⌛ Starting extraction for {len(items)} records (up to {ceiling} concurrent)...")
+
+        results   = [None] * len(items)
+        semaphore = asyncio.Semaphore(ceiling)
+        done      = 0
+        self.failed_searches = 0
+        self.sessions.reset()
+
+        async def worker(r_idx, item):
+            nonlocal done
+            async with semaphore:
+                if stop is not None and stop.is_set():
+                    return
+                try:
+                    result = await self._fetch_async(http, item)
+                except Exception as e:
+                    errhandler(f"Error processing record {r_idx+1}: {e}", log="extract_async", path="scrapper")
+                    result = self._empty_result(item, type(e).__name__)
+            if result is None:
+                return   # session lost and re-login failed: leave these rows unsearched
+            if 'error' in result:
+                self.failed_searches += 1
+            for i, row_result in plan.fan_out_one(r_idx, result):
+                if keep_results:
+                    results[i] = row_result
+                done += 1
+                if on_result:
+                    on_result(i, row_result)
+            print(f"🔎 [{done}/{len(items)}] {item.get('keyword', '')} → {result['matches_found']} matches")
+
+        connector = aiohttp.TCPConnector(limit=ceiling)
+        timeout   = aiohttp.ClientTimeout(total=30)
+        with self.throttle.capped(ceiling):
+            async with aiohttp.ClientSession(
+                headers=dict(self.session.headers),
+                cookies=self._cookie_dict(),
+                connector=connector,
+                timeout=timeout,
+            ) as http:
+                await asyncio.gather(*(worker(r, item) for r, item in enumerate(plan.requests)))
+
+        results = [r for r in results if r is not None]
+        if self.sessions.failed:
+            print(f"\n❌ Session lost — only {done}/{len(items)} records were searched")
+        elif stop is not None and stop.is_set():
+            print(f"\n⏹ Stopped — {done}/{len(items)} records were searched")
+        if self.failed_searches:
+            print(f"\n⚠️ {self.failed_searches} searches failed (timeouts / server errors) and were returned as NOT FOUND")
 
-                if response.status_code != 200:
-                    print(f"⚠️ HTTP {response.status_code} — trying re-auth...")
-                    if self.authenticator():
-                        response = self.session.post(
-                            query_url, data=payload, headers=ajax_headers, timeout=30
-                        )
-                    if response.status_code != 200:
-                        final_results.append(self._empty_result(item))
-                        continue
+        print(f"\n{'='*50}")
+        print(f"✅ Extraction complete. Processed {done} records")
+        if self.cache:
+            cs = self.cache.stats()
+            print(f"💾 Cache: {cs['hits']} hits / {cs['misses']} misses ({cs['hit_rate']}%)")
+        ts = self.throttle.snapshot()
+        print(f"🚦 Rate controller: window {ts['window']}, {ts['rate']} req/s, p95 {ts['p95_ms']} ms")
+        return results
+
+    async def _fetch_async(self, http, item: dict) -> dict:
+        keyword = item['keyword']
+        payload = {"dataType": "litigation_data"}
+
+        cached = self.cache.get(keyword, payload["dataType"]) if self.cache else None
+        if cached is not None:
+            return self._build_result(item, cached)
 
+        query_url = f"{self.url}{urllib.parse.quote(keyword)}"
+
+        # One retry for a 429 / 5xx; each session expiry gets its own replay, since a busy
+        # run can see the next expiry land before a replayed search is answered
+        json_data = None
+        for attempt in range(1 + self.SESSION_REPLAYS):
+            await self.sessions.wait_ready()
+            if self.sessions.failed:
+                return None
+            generation = self.sessions.generation
+
+            await self.throttle.acquire()
+            started = time.monotonic()
+            try:
+                async with http.post(query_url, data=payload, headers=self.AJAX_HEADERS) as resp:
+                    status = resp.status
+                    url    = str(resp.url)
+                    text   = await resp.text()
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                self.throttle.release(None, None)
+                print(f"⏰ {type(e).__name__} for '{keyword}' — skipping")
+                return self._empty_result(item, type(e).__name__)
+            except BaseException:
+                self.throttle.abandon()
+                raise
+            self.throttle.release(time.monotonic() - started, status)
+
+            if self.sessions.is_expired(status, url, text):
+                if attempt < self.SESSION_REPLAYS and await self.sessions.reauthenticate_async(generation):
+                    http.cookie_jar.update_cookies(self._cookie_dict())
+                    continue   # replay on the renewed session
+                return None if self.sessions.failed else self._empty_result(item, "session expired")
+
+            if status == 200:
                 try:
-                    json_data = response.json()
+                    json_data = json.loads(text) if text.strip() else {}
+                    break
                 except json.JSONDecodeError:
-                    # Probably redirected to login page
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    if soup.find('input', {'type': 'password'}):
-                        print("⚠️ Session expired — re-authenticating...")
-                        if self.authenticator():
-                            response = self.session.post(
-                                query_url, data=payload, headers=ajax_headers, timeout=30
-                            )
-                            try:
-                                json_data = response.json()
-                            except Exception:
-                                final_results.append(self._empty_result(item))
-                                continue
-                        else:
-                            break
-                    else:
-                        final_results.append(self._empty_result(item))
-                        continue
+                    return self._empty_result(item, "invalid JSON")
 
-                html_string = json_data.get('html', '')
-                if not html_string:
-                    print("⚠️ No HTML in response — no results for this keyword")
-                    final_results.append(self._empty_result(item))
-                    continue
+            # 429 / 5xx: the rate controller has already backed off — retry once
+            if attempt == 0 and (status == 429 or status >= 500):
+                continue
+            print(f"⚠️ HTTP {status} for '{keyword}'")
+            return self._empty_result(item, f"HTTP {status}")
 
-                found_matches = self._parse_results(html_string)
-
-                result_entry = {
-                    "excel_row":      item.get('excel_row'),
-                    "original_case":  item['case_number'],
-                    "case_name":      item['citation'],
-                    "search_keyword": keyword,
-                    "matches_found":  len(found_matches),
-                    "matches":        found_matches,
-                }
-                final_results.append(result_entry)
-                print(f"📊 Found {len(found_matches)} matches")
-
-            except requests.exceptions.Timeout:
-                print(f"⏰ Timeout for record {i+1} — skipping")
-                final_results.append(self._empty_result(item))
-            except Exception as e:
-                errhandler(f"Error processing record {i+1}: {e}", log="extractor", path="scrapper")
-                print(f"❌ Error: {e}")
-                traceback.print_exc()
-                final_results.append(self._empty_result(item))
+        if json_data is None:
+            return self._empty_result(item, "no response")
 
-        print(f"\n{'='*50}")
-        print(f"✅ Extraction complete. Processed {len(final_results)} records")
-        return final_results
+        html_string = json_data.get('html', '') if isinstance(json_data, dict) else ''
+        found_matches = self._parse_results(html_string) if html_string else []
+        if self.cache:
+            self.cache.set(keyword, payload["dataType"], found_matches)
+        return self._build_result(item, found_matches)
+
+    def _cookie_dict(self) -> dict:
+        return {c.name: c.value for c in self.session.cookies}
 
-    def _empty_result(self, item: dict) -> dict:
+    def _empty_result(self, item: dict, error: str) -> dict:
+        """A search that failed: scored as NOT FOUND, but never cached or journaled."""
         return {
             "excel_row":      item.get('excel_row'),
             "original_case":  item.get('case_number', ''),
@@ -423,132 +693,216 @@ class Scrapper:
             "search_keyword": item.get('keyword', ''),
             "matches_found":  0,
             "matches":        [],
+            "error":          error,
+        }
+
+    def _build_result(self, item: dict, matches: list) -> dict:
+        return {
+            "excel_row":      item.get('excel_row'),
+            "original_case":  item['case_number'],
+            "case_name":      item['citation'],
+            "search_keyword": item['keyword'],
+            "matches_found":  len(matches),
+            "matches":        matches,
         }
 
     def _parse_results(self, html_string: str) -> list:
         """Parse KRA iLaw HTML result table into a list of match dicts."""
-        soup    = BeautifulSoup(html_string, 'html.parser')
-        matches = []
-        for row in soup.find_all('tr'):
-            cols = row.find_all('td')
-            if len(cols) < 3:
-                continue
-
-            # Citation — prefer tooltip title if present
-            span = cols[1].find('span', class_='tooltipTable') if len(cols) > 1 else None
-            if span and span.get('tooltiptitle'):
-                citation = span.get('tooltiptitle')
-            else:
-                citation = cols[1].get_text(strip=True) if len(cols) > 1 else ''
-
-            internal_ref = cols[2].get_text(strip=True) if len(cols) > 2 else ''
-            assignee     = cols[3].get_text(strip=True) if len(cols) > 3 else ''
-
-            entry = {
-                "kra_citation": self._clean_text(citation),
-                "kra_ref":      self._clean_text(internal_ref).upper(),
-                "kra_assignee": self._clean_text(assignee).upper(),
-            }
-            if entry["kra_citation"] or entry["kra_ref"]:
-                matches.append(entry)
-                print(f"  ✅ Match: {entry['kra_citation'][:60]}")
+        matches = parse_results(html_string, self.parser_backend)
+        for entry in matches:
+            print(f"  ✅ Match: {entry['kra_citation'][:60]}")
         return matches
 
     # ─────────────────────────────────────────────────────────────────────────
     # Comparator
     # ─────────────────────────────────────────────────────────────────────────
 
-    def comparator(self, extracted_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def comparator(
+        self,
+        extracted_data: List[Dict[str, Any]],
+        workers: int | None = None,
+        batch: bool | None = None,
+    ) -> List[Dict[str, Any]]:
         """
         Score each extracted result against the original file data.
         Uses case-number E-code matching, party name fuzzy matching, and
         keyword (E017 of 2026) direct matching as primary signal.
+        Large batches (see modules.parallel.PARALLEL_THRESHOLD) are scored across
+        `workers` processes (default: all cores); workers=1 forces in-process.
+        batch=True scores the batch (or each chunk) with score_batch(), False walks score()
+        per row; None picks score_batch() when results recur enough to pay for it.
+        The "tfidf" scoring strategy is batch-only, so it always takes score_batch(),
+        with its idf fitted on these rows' citations (see fit_idf()).
         """
         if not extracted_data:
             print("⚠️ No extracted data to compare")
             return []
 
+        if self.scoring == "tfidf":
+            self.fit_idf(item.get('case_name', '') for item in extracted_data)
+
         print(f"\n⚖️  Comparing {len(extracted_data)} records...")
-        reconciled_data = []
+        reconciled_data = self.score_many(extracted_data, workers=workers, batch=batch)
+        self.print_summary(reconciled_data)
+        return reconciled_data
 
-        for item in extracted_data:
-            sheet_citation = str(item.get('case_name', '')).upper()
-            sheet_case     = str(item.get('original_case', '')).upper()
-            search_keyword = str(item.get('search_keyword', '')).upper()
+    def score_many(
+        self,
+        items: List[Dict[str, Any]],
+        workers: int | None = None,
+        batch: bool | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        score() over a list of extracted results, in order, by the cheapest route for
+        its size: a process pool for large lists, score_batch() when results recur,
+        per-row score() otherwise (see comparator() for workers / batch).
+        """
+        if self.scoring == "tfidf":
+            batch = True
+        elif batch is None:
+            batch = worth_batching(items)
+
+        rows = None
+        if should_parallelize(items, workers):
+            rows = score_parallel(items, self.similarity_backend, workers, batch, self.scoring, self.idf)
+        if rows is None and batch:
+            rows = self.score_batch(items)
+        if rows is None:
+            rows = [self.score(item) for item in items]
+        return rows
+
+    def fit_idf(self, citations) -> None:
+        """
+        Fits the "tfidf" strategy's idf once for a run, on the sheet citations of all
+        its rows, so a row's verdict is the same whichever rows it is scored with.
+        stream() and comparator() call it; without it each batch is its own corpus.
+        """
+        self.idf = Idf(normalize(str(c).upper()).text for c in citations)
 
-            print(f"\n{'='*50}")
-            print(f"🏁 [{sheet_case}] {sheet_citation[:80]}")
+    def score(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Scores one extracted result (as produced by extract()) into a reconciled row."""
+        if self.scoring == "tfidf":
+            return self.score_batch([item])[0]
 
-            sheet_tokens = clean_citation(sheet_citation)
-            sheet_string = clean_citation_text(sheet_citation)
-            sheet_court  = get_court_type(sheet_case)
+        sheet_citation = str(item.get('case_name', '')).upper()
+        sheet_case     = str(item.get('original_case', '')).upper()
+        search_keyword = str(item.get('search_keyword', '')).upper()
 
-            matches    = item.get('matches', [])
-            best_match = {}
-            confidence = 0.0
-            status     = "NOT FOUND"
+        print(f"\n{'='*50}")
+        print(f"🏁 [{sheet_case}] {sheet_citation[:80]}")
 
-            if matches:
-                best_ratio = 0.0
+        sheet_norm   = normalize(sheet_citation)
+        sheet_tokens = sheet_norm.tokens
+        sheet_string = sheet_norm.text
+        sheet_court  = normalize(sheet_case).court
 
-                for match in matches:
-                    kra_citation = str(match.get('kra_citation', '')).upper()
-                    kra_ref      = str(match.get('kra_ref', '')).upper()
-                    kra_court    = get_court_type(kra_citation)
+        matches    = item.get('matches', [])
+        best_match = {}
+        confidence = 0.0
+        status     = "NOT FOUND"
 
-                    # Skip cross-court matches (only when both courts are identifiable)
-                    if sheet_court != 'NA' and kra_court != 'NA' and sheet_court != kra_court:
-                        continue
+        if matches:
+            best_ratio = 0.0
 
-                    scores = self._calculate_similarity_scores(
-                        sheet_tokens, sheet_string, sheet_case,
-                        kra_citation, kra_ref, search_keyword
-                    )
+            sheet_ref = self._sheet_reference(sheet_case, search_keyword)
+            bounded   = get_bounded_ratio(self.similarity_backend)
 
-                    # Weighted final score
-                    weighted = (
-                        scores['token_ratio']   * 0.30 +
-                        scores['string_ratio']  * 0.30 +
-                        scores['ref_ratio']     * 0.25 +
-                        scores['keyword_ratio'] * 0.15
-                    )
-                    final = max(
-                        weighted,
-                        scores['ref_ratio'],      # exact case-number match overrides
-                        scores['keyword_ratio'],  # exact keyword hit overrides
-                    )
+            # Cascade: cheapest signals first, the string comparison last and only when
+            # it could still lift this candidate past the best so far
+            for match in matches:
+                kra       = self.features.get(match)
+                kra_court = kra.court
 
-                    if final > best_ratio:
-                        best_ratio = final
-                        best_match = match
+                # Skip cross-court matches (only when both courts are identifiable)
+                if sheet_court != 'NA' and kra_court != 'NA' and sheet_court != kra_court:
+                    continue
 
-                confidence = round(best_ratio, 2)
+                ref_ratio, keyword_ratio = self._reference_scores(sheet_ref, kra.reference)
+                token_ratio = self._token_ratio(sheet_tokens, kra.tokens)
 
-                if confidence >= 80:
-                    status = "VERIFIED MATCH"
-                elif confidence >= 60:
-                    status = "REVIEW REQUIRED"
-                elif confidence >= 30:
-                    status = "MISMATCH"
+                # Lowest string ratio (0..1) at which the weighted score would beat best_ratio
+                if max(ref_ratio, keyword_ratio) > best_ratio:
+                    cutoff = 0.0
                 else:
-                    status = "NOT FOUND"
+                    cutoff = (best_ratio - token_ratio * 0.30 - ref_ratio * 0.25 - keyword_ratio * 0.15) / 30 - 1e-9
+                if cutoff > 1:
+                    continue
+                string_ratio = bounded(sheet_string, kra.text, cutoff)
+                if string_ratio is None:
+                    continue
 
-                print(f"📊 Best match: {status} ({confidence}%)")
+                # Weighted final score
+                weighted = (
+                    token_ratio         * 0.30 +
+                    string_ratio * 100  * 0.30 +
+                    ref_ratio           * 0.25 +
+                    keyword_ratio       * 0.15
+                )
+                final = max(
+                    weighted,
+                    ref_ratio,       # exact case-number match overrides
+                    keyword_ratio,   # exact keyword hit overrides
+                )
 
-            reconciled_data.append({
-                'excel_row':               item.get('excel_row'),
-                'original_case':           item.get('original_case', ''),
-                'case_name':               item.get('case_name', ''),
-                'status':                  status,
-                'confidence_score':        f"{confidence}%",
-                'confidence_raw':          confidence,
-                'best_match_kra_ref':      best_match.get('kra_ref', 'N/A') if best_match else 'N/A',
-                'best_match_kra_citation': best_match.get('kra_citation', 'N/A') if best_match else 'N/A',
-                'best_match_kra_assignee': best_match.get('kra_assignee', 'N/A') if best_match else 'N/A',
-                'matches_found':           len(matches),
-            })
+                if final > best_ratio:
+                    best_ratio = final
+                    best_match = match
 
-        # Summary
+                # E-number + year (or keyword) hit: 100 can't be beaten
+                if best_ratio >= 100:
+                    break
+
+            confidence = round(best_ratio, 2)
+            status     = self._status(confidence)
+            print(f"📊 Best match: {status} ({confidence}%)")
+
+        return self._scored_row(item, status, confidence, best_match)
+
+    def score_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        score() over a whole batch, with token overlap, the weighted combination and
+        the best-candidate pick done as array math (see modules.batch). Same rows as
+        calling score() per item.
+        """
+        rows = []
+        for item, (best, confidence) in zip(items, score_batch(items, self, self.similarity_backend, self.scoring, self.idf)):
+            matches    = item.get('matches') or []
+            status     = self._status(confidence) if matches else "NOT FOUND"
+            best_match = matches[best] if best is not None else {}
+
+            print(f"\n{'='*50}")
+            print(f"🏁 [{str(item.get('original_case', '')).upper()}] {str(item.get('case_name', '')).upper()[:80]}")
+            if matches:
+                print(f"📊 Best match: {status} ({confidence}%)")
+            rows.append(self._scored_row(item, status, confidence, best_match))
+        return rows
+
+    @staticmethod
+    def _status(confidence: float) -> str:
+        if confidence >= 80:
+            return "VERIFIED MATCH"
+        elif confidence >= 60:
+            return "REVIEW REQUIRED"
+        elif confidence >= 30:
+            return "MISMATCH"
+        return "NOT FOUND"
+
+    @staticmethod
+    def _scored_row(item: Dict[str, Any], status: str, confidence: float, best_match: dict) -> Dict[str, Any]:
+        return {
+            'excel_row':               item.get('excel_row'),
+            'original_case':           item.get('original_case', ''),
+            'case_name':               item.get('case_name', ''),
+            'status':                  status,
+            'confidence_score':        f"{confidence}%",
+            'confidence_raw':          confidence,
+            'best_match_kra_ref':      best_match.get('kra_ref', 'N/A') if best_match else 'N/A',
+            'best_match_kra_citation': best_match.get('kra_citation', 'N/A') if best_match else 'N/A',
+            'best_match_kra_assignee': best_match.get('kra_assignee', 'N/A') if best_match else 'N/A',
+            'matches_found':           len(item.get('matches') or []),
+        }
+
+    def print_summary(self, reconciled_data: list) -> None:
         counts = {}
         for r in reconciled_data:
             counts[r['status']] = counts.get(r['status'], 0) + 1
@@ -557,7 +911,6 @@ class Scrapper:
         print("✅ Comparison complete. Summary:")
         for s, c in counts.items():
             print(f"   {s}: {c}/{total} ({round(c/total*100,1)}%)")
-        return reconciled_data
 
     def _calculate_similarity_scores(
         self,
@@ -565,62 +918,67 @@ class Scrapper:
         kra_citation, kra_ref,
         search_keyword=""
     ) -> dict:
-        scores = {}
+        """All four signals for one candidate, without the cascade (see score())."""
+        kra = extract(kra_ref, kra_citation)
+        ref_ratio, keyword_ratio = self._reference_scores(self._sheet_reference(sheet_case, search_keyword), kra.reference)
+        return {
+            'token_ratio':   self._token_ratio(sheet_tokens, kra.tokens),
+            'string_ratio':  get_ratio(self.similarity_backend)(sheet_string, kra.text) * 100,
+            'ref_ratio':     ref_ratio,
+            'keyword_ratio': keyword_ratio,
+        }
 
-        # Token overlap (party names, court names)
-        kra_tokens = clean_citation(kra_citation)
+    @staticmethod
+    def _token_ratio(sheet_tokens, kra_tokens) -> float:
+        """Token overlap (party names, court names) as a Jaccard percentage."""
         if sheet_tokens and kra_tokens:
-            inter = sheet_tokens.intersection(kra_tokens)
-            union = sheet_tokens.union(kra_tokens)
-            scores['token_ratio'] = (len(inter) / len(union)) * 100 if union else 0
-        else:
-            scores['token_ratio'] = 0
+            union = sheet_tokens | kra_tokens
+            return (len(sheet_tokens & kra_tokens) / len(union)) * 100 if union else 0
+        return 0
 
-        # Fuzzy string match
-        kra_string = clean_citation_text(kra_citation)
-        scores['string_ratio'] = SequenceMatcher(None, sheet_string, kra_string).ratio() * 100
+    @staticmethod
+    def _sheet_reference(sheet_case: str, search_keyword: str = "") -> tuple:
+        """
+        Sheet-side halves of the reference / keyword checks, parsed once per row:
+        (sheet CaseRef, keyword CaseRef — None unless it has both an E-number and a year)
+        """
+        keyword = parse_case(search_keyword) if search_keyword else None
+        if keyword is not None and not (keyword.e_flag and keyword.year):
+            keyword = None
+        return parse_case(sheet_case), keyword
+
+    @staticmethod
+    def _reference_scores(sheet_ref: tuple, candidate_ref: tuple) -> tuple:
+        """(ref_ratio, keyword_ratio) for one candidate, _sheet_reference() against CandidateFeatures.reference."""
+        sheet, keyword = sheet_ref
+        kra, kra_ref   = candidate_ref
 
         # Case reference number match
-        # Extracts E-code (e.g. E017) and year from both sides and compares
-        scores['ref_ratio'] = 0
-        e_sheet = re.search(r'E(\d+)', sheet_case, re.IGNORECASE)
-        e_kra   = re.search(r'E(\d+)', kra_citation + ' ' + kra_ref, re.IGNORECASE)
-        yr_sheet = re.search(r'\b(20\d{2}|19\d{2})\b', sheet_case)
-        yr_kra   = re.search(r'\b(20\d{2}|19\d{2})\b', kra_citation + ' ' + kra_ref)
-
-        if e_sheet and e_kra and e_sheet.group(1) == e_kra.group(1):
-            scores['ref_ratio'] = 80   # E-number matches
-            if yr_sheet and yr_kra and yr_sheet.group(0) == yr_kra.group(0):
-                scores['ref_ratio'] = 100  # E-number + year both match
-        elif sheet_case and kra_ref:
+        # Compares E-code (e.g. E017) and year from both sides
+        ref_ratio = 0
+        if sheet.e_flag and kra.e_flag and sheet.number == kra.number and sheet.width == kra.width:
+            ref_ratio = 80   # E-number matches
+            if sheet.year is not None and sheet.year == kra.year:
+                ref_ratio = 100  # E-number + year both match
+        elif sheet.last is not None and sheet.last == kra_ref.last:
             # Fallback: last number in case vs last number in ref
-            sn = re.findall(r'\d+', sheet_case)
-            kn = re.findall(r'\d+', kra_ref)
-            if sn and kn and sn[-1] == kn[-1]:
-                scores['ref_ratio'] = 60
+            ref_ratio = 60
 
         # Keyword match — does the kra_citation contain our search keyword?
         # e.g. search_keyword="E017 of 2026" and kra_citation contains "E017" and "2026"
-        scores['keyword_ratio'] = 0
-        if search_keyword:
-            kw_e  = re.search(r'E(\d+)', search_keyword, re.IGNORECASE)
-            kw_yr = re.search(r'\b(20\d{2}|19\d{2})\b', search_keyword)
-            kra_text = (kra_citation + ' ' + kra_ref).upper()
-            if kw_e and kw_yr:
-                has_e  = bool(re.search(rf'E0*{kw_e.group(1)}\b', kra_text, re.IGNORECASE))
-                has_yr = kw_yr.group(0) in kra_text
-                if has_e and has_yr:
-                    scores['keyword_ratio'] = 100
-                elif has_e or has_yr:
-                    scores['keyword_ratio'] = 50
-
-        return scores
+        keyword_ratio = 0
+        if keyword is not None:
+            has_e  = kra.has_e(keyword.number, keyword.width)
+            has_yr = keyword.year in kra.years
+            if has_e and has_yr:
+                keyword_ratio = 100
+            elif has_e or has_yr:
+                keyword_ratio = 50
+
+        return ref_ratio, keyword_ratio
 
     def _clean_text(self, text) -> str:
-        if not text:
-            return ""
-        text = ' '.join(str(text).split())
-        return text.encode('ascii', 'ignore').decode().strip()
+        return clean_text(text)
 
     # ─────────────────────────────────────────────────────────────────────────
     # Reporter
@@ -712,6 +1070,32 @@ class Scrapper:
             traceback.print_exc()
             return False
 
+    def export(self, data: list | None = None, file_path: str = "", fmt: str = "parquet") -> Path | None:
+        """
+        Reconciled rows as a typed Parquet / Feather table in reports/, next to
+        report()'s workbook (see modules.columnar). Returns the saved path.
+        """
+        if not data:
+            print("⚠️ No reconciled data to export")
+            return None
+        if fmt not in columnar.FORMATS:
+            print(f"❌ Unsupported export format: {fmt}")
+            return None
+
+        try:
+            ts  = datetime.now().strftime("%d-%m-%Y_%H-%M-%S")
+            sd  = Path("reports")
+            sd.mkdir(parents=True, exist_ok=True)
+            out = sd / f"{Path(file_path).stem or 'reconciliation'}_RECONCILED_{ts}{columnar.FORMATS[fmt]}"
+            columnar.write(columnar.results_frame(data), out, fmt)
+            print(f"✅ Results exported to: {out.resolve()}")
+            return out
+
+        except Exception as e:
+            errhandler(e, log="export", path="scrapper")
+            print(f"❌ Export error: {e}")
+            return None
+
     def generate_pdf_report(self, data: list, file_path: str):
         """Generates a formatted landscape PDF report omitting redundant columns."""
         from reportlab.lib import colors
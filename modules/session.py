@@ -0,0 +1,200 @@
+# modules/session.py
+# Session-expiry detection and single-flight re-authentication for Scrapper.
+# When iLaw drops the session mid-run, exactly one worker logs in again;
+# every other worker waits for that login and then replays its request.
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from utils import errhandler
+
+
+class SessionManager:
+    """
+    `generation` counts successful logins. A worker remembers the generation its
+    request went out under; if it has moved on by the time the expiry is seen,
+    someone else already renewed the session and the worker only needs to replay.
+    """
+
+    def __init__(self, scrapper):
+        self.scrapper   = scrapper
+        self.generation = 0
+        self.relogins   = 0
+        self.failed     = False
+
+        self._lock = threading.Lock()
+        self._task = None
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Detection
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def is_expired(self, status: int, url: str, text: str) -> bool:
+        """
+        True when an AJAX search response is really the login page:
+        401/403, a redirect onto the login URL, a password input, or a non-JSON body.
+        """
+        if status in (401, 403):
+            return True
+        login_path = urllib.parse.urlparse(self.scrapper.auth_url).path
+        if login_path and login_path in urllib.parse.urlparse(str(url)).path:
+            return True
+        if status != 200:
+            return False
+
+        # The search endpoint only ever answers with JSON; an HTML page (password
+        # form or not) means we were bounced off the authenticated area.
+        body = (text or "").lstrip()
+        return bool(body) and body[0] not in "{["
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Renewal
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def reauthenticate(self, generation: int) -> bool:
+        """Thread-safe: the first caller for `generation` logs in, the rest reuse its outcome."""
+        with self._lock:
+            if self.failed:
+                return False
+            if generation != self.generation:
+                return True
+
+            print("🔐 Session expired — re-authenticating once for all workers...")
+            if not self.scrapper.authenticator(reuse=False):
+                self.failed = True
+                print("❌ Re-authentication failed — remaining records will not be searched")
+                return False
+
+            self.generation += 1
+            self.relogins   += 1
+            return True
+
+    async def reauthenticate_async(self, generation: int) -> bool:
+        """Async single-flight: concurrent callers share one login task."""
+        if self.failed:
+            return False
+        if generation != self.generation:
+            return True
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(asyncio.to_thread(self.reauthenticate, generation))
+        return await asyncio.shield(self._task)
+
+    async def wait_ready(self) -> None:
+        """Holds new requests back while a re-login is in progress."""
+        task = self._task
+        if task is not None and not task.done():
+            try:
+                await asyncio.shield(task)
+            except Exception:
+                pass
+
+    def reset(self) -> None:
+        """Called at the start of a run so a previous failure doesn't poison it."""
+        self.failed = False
+        self._task  = None
+
+
+class SessionStore:
+    """
+    Encrypted on-disk record of a user's last good iLaw login: the winning auth
+    method, the form field names it used and the cookie jar with its expiry.
+    The key is derived from the user's password, so the file is useless without it.
+    """
+
+    SALT_BYTES = 16
+    ITERATIONS = 200_000
+
+    def __init__(self, directory: str = "sessions", max_age: float = 8 * 3600):
+        self.directory = Path(directory)
+        self.max_age   = max_age
+
+    def _path(self, username: str) -> Path:
+        digest = hashlib.sha256(str(username).strip().lower().encode()).hexdigest()[:32]
+        return self.directory / f"{digest}.session"
+
+    def _fernet(self, password: str, salt: bytes) -> Fernet:
+        raw = hashlib.pbkdf2_hmac("sha256", str(password).encode(), salt, self.ITERATIONS)
+        return Fernet(base64.urlsafe_b64encode(raw))
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Read / write
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def load(self, username: str, password: str) -> dict | None:
+        """Returns the decrypted record, or None if missing / unreadable / wrong password."""
+        path = self._path(username)
+        try:
+            blob = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            errhandler(e, log="load", path="session_store")
+            return None
+
+        salt, token = blob[:self.SALT_BYTES], blob[self.SALT_BYTES:]
+        try:
+            return json.loads(self._fernet(password, salt).decrypt(token))
+        except (InvalidToken, ValueError):
+            return None
+
+    def save(self, username: str, password: str, method: int | None, fields: dict | None, cookie_jar) -> None:
+        now     = time.time()
+        cookies = [
+            {
+                "name":    c.name,
+                "value":   c.value,
+                "domain":  c.domain,
+                "path":    c.path,
+                "expires": c.expires,
+                "secure":  c.secure,
+            }
+            for c in cookie_jar
+        ]
+        expiries = [c["expires"] for c in cookies if c["expires"]]
+        record = {
+            "method":  method,
+            "fields":  fields or {},
+            "cookies": cookies,
+            "saved":   now,
+            "expires": min(expiries + [now + self.max_age]),
+        }
+
+        salt = os.urandom(self.SALT_BYTES)
+        blob = salt + self._fernet(password, salt).encrypt(json.dumps(record).encode())
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(username)
+            tmp  = path.with_suffix(".tmp")
+            tmp.write_bytes(blob)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, path)
+        except OSError as e:
+            errhandler(e, log="save", path="session_store")
+
+    def clear(self, username: str) -> None:
+        try:
+            self._path(username).unlink()
+        except OSError:
+            pass
+
+    @staticmethod
+    def is_fresh(record: dict | None) -> bool:
+        return bool(record and record.get("cookies") and record.get("expires", 0) > time.time())
+
+    @staticmethod
+    def restore_cookies(record: dict, cookie_jar) -> None:
+        for c in record.get("cookies", []):
+            cookie_jar.set(
+                c["name"], c["value"],
+                domain=c.get("domain") or "", path=c.get("path") or "/",
+                expires=c.get("expires"), secure=c.get("secure", False),
+            )
@@ -0,0 +1,102 @@
+# modules/tfidf.py
+# Character n-gram TF-IDF vectors for citation text, scored in batch.
+#
+# Citations drift from iLaw in ways that cost SequenceMatcher dearly but leave most
+# 3-grams intact: misspellings ("COMMISIONER"), mashed or split words ("STARRENTALS"),
+# reordered parties. Each distinct text is vectorized once (sublinear tf × smoothed
+# idf, L2-normalized, stored sparse), and any number of (a, b) pairs are scored
+# together as sparse dot products — the cosine, 0..1.
+# The idf is fitted once (Idf) on a fixed corpus — a run's sheet citations, see
+# Scrapper.fit_idf() — so a pair's cosine doesn't depend on what else is scored with it.
+
+import math
+from collections import Counter
+
+import numpy as np
+
+NGRAM = 3
+
+
+def ngrams(text: str, n: int = NGRAM) -> Counter:
+    """Character n-grams of each word, padded so word starts and ends count too."""
+    grams = Counter()
+    for word in text.split():
+        padded = f" {word} "
+        grams.update(padded[i:i + n] for i in range(max(1, len(padded) - n + 1)))
+    return grams
+
+
+class Idf:
+    """Smoothed idf over a corpus of texts, as if one extra document held every gram."""
+
+    def __init__(self, texts, n: int = NGRAM):
+        self.n  = n
+        self.df = Counter()
+        docs = set(texts)
+        for text in docs:
+            self.df.update(ngrams(text, n).keys())
+        self.docs = len(docs)
+
+    def weights(self, grams: list) -> np.ndarray:
+        """idf of each gram; grams the corpus never saw weigh as the rarest."""
+        df = np.fromiter((self.df.get(g, 0) for g in grams), dtype=np.float64, count=len(grams))
+        return np.log((1 + self.docs) / (1 + df)) + 1
+
+
+class NgramIndex:
+    """
+    TF-IDF vectors for a fixed set of texts, stored as one sorted sparse array of
+    (doc * grams + gram) keys and weights. Without an `idf`, it is fitted on `texts`.
+    """
+
+    def __init__(self, texts: list, n: int = NGRAM, idf: Idf | None = None):
+        self.docs  = {}
+        gram_ids   = {}
+        doc_rows, gram_cols, tf = [], [], []
+
+        for text in texts:
+            if text in self.docs:
+                continue
+            d = self.docs[text] = len(self.docs)
+            for gram, count in ngrams(text, n).items():
+                doc_rows.append(d)
+                gram_cols.append(gram_ids.setdefault(gram, len(gram_ids)))
+                tf.append(1.0 + math.log(count))
+
+        self.grams = max(1, len(gram_ids))
+        docs  = np.asarray(doc_rows, dtype=np.int64)
+        grams = np.asarray(gram_cols, dtype=np.int64)
+
+        idf = (idf or Idf(self.docs, n)).weights(list(gram_ids))
+        weights = np.asarray(tf, dtype=np.float64) * idf[grams]
+
+        norms = np.sqrt(np.bincount(docs, weights=weights ** 2, minlength=len(self.docs)))
+        weights /= np.where(norms[docs] > 0, norms[docs], 1)
+
+        # Sorted by key, so each doc's grams are one contiguous slice
+        keys  = docs * self.grams + grams
+        order = np.argsort(keys, kind="stable")
+        self.keys, self.weights = keys[order], weights[order]
+        self.doc_start = np.searchsorted(self.keys, np.arange(len(self.docs) + 1) * self.grams)
+
+    def ids(self, texts: list) -> np.ndarray:
+        return np.fromiter((self.docs[t] for t in texts), dtype=np.int64, count=len(texts))
+
+    def cosine(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Cosine similarity of docs a[i] and b[i], for every i."""
+        if not len(a):
+            return np.zeros(0)
+
+        # Every gram of every b doc, looked up in its paired a doc
+        sizes  = self.doc_start[b + 1] - self.doc_start[b]
+        owner  = np.repeat(np.arange(len(b)), sizes)
+        offset = np.arange(len(owner)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        at     = self.doc_start[b][owner] + offset
+
+        wanted = a[owner] * self.grams + self.keys[at] % self.grams
+        found  = np.minimum(np.searchsorted(self.keys, wanted), len(self.keys) - 1)
+        shared = self.keys[found] == wanted
+        dots   = np.bincount(owner, weights=np.where(shared, self.weights[at] * self.weights[found], 0.0), minlength=len(b))
+        # Summation order follows gram ids, which depend on the other texts indexed;
+        # rounding off the last bits keeps a pair's cosine independent of them
+        return np.clip(np.round(dots, 12), 0.0, 1.0)
@@ -0,0 +1,218 @@
+# modules/throttle.py
+# Adaptive AIMD rate controller shared by the Scrapper fetch paths.
+# Healthy responses grow the window (max in-flight) and the request rate additively;
+# when 429 / 5xx / timeouts exceed the tolerated share of recent requests both are cut
+# multiplicatively. An isolated error only counts against that share.
+# Each run starts at the caller's concurrency ceiling and the rate that goes with it.
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class RateController:
+    """
+    State is guarded by a threading lock rather than asyncio primitives so one
+    controller can outlive the event loop of any single extract() call.
+
+    The request rate is sized per window slot: `slot_rate` req/s for each slot, so
+    the ceiling, the rate it starts at and each additive step move together.
+    window / rate default to that ceiling; pass them to start lower.
+    """
+
+    def __init__(
+        self,
+        window: int | None = None,
+        rate: float | None = None,
+        min_window: int = 1,
+        max_window: int = 64,
+        min_rate: float = 0.5,
+        slot_rate: float = 10.0,
+        window_step: int = 1,
+        backoff: float = 0.5,
+        target_p95: float = 2.0,
+        min_success: float = 0.95,
+        sample_size: int = 50,
+        min_samples: int = 10,
+        recovery: float = 60.0,
+    ):
+        self.min_window  = min_window
+        self.max_window  = max_window
+        self.min_rate    = min_rate
+        self.slot_rate   = slot_rate
+        self.window      = min(window or max_window, max_window)
+        self.rate        = min(rate or self.max_rate, self.max_rate)
+        self.window_step = window_step
+        self.backoff     = backoff
+        self.target_p95  = target_p95
+        self.min_success = min_success
+        self.min_samples = min_samples
+        self.recovery    = recovery
+
+        self.in_flight  = 0
+        self.increases  = 0
+        self.decreases  = 0
+
+        self._samples       = deque(maxlen=sample_size)   # (latency or None, healthy)
+        self._since_change  = 0
+        self._since_cut     = 0
+        self._next_start    = 0.0
+        self._last_decrease = None
+        self._lock          = threading.Lock()
+        self._waiters       = []   # (loop, future) of acquire() calls waiting for a free slot
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Admission
+    # ─────────────────────────────────────────────────────────────────────────
+
+    async def acquire(self) -> None:
+        """Waits until a window slot is free and the next rate slot has arrived."""
+        loop = asyncio.get_running_loop()
+        while True:
+            waiter = None
+            with self._lock:
+                now = time.monotonic()
+                if self.in_flight < self.window and now >= self._next_start:
+                    self.in_flight  += 1
+                    self._next_start = max(now, self._next_start) + 1.0 / self.rate
+                    return
+                if self.in_flight >= self.window:
+                    # Parked until release() / abandon() frees a slot or the window grows
+                    waiter = loop.create_future()
+                    self._waiters.append((loop, waiter))
+                else:
+                    wait = self._next_start - now
+            if waiter is not None:
+                await waiter
+            else:
+                await asyncio.sleep(wait)
+
+    def release(self, latency: float | None, status: int | None) -> None:
+        """
+        Frees the slot and feeds the outcome back into the controller.
+        status=None means the request timed out or the connection failed.
+        """
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._wake()
+
+            congested = status is None or status == 429 or status >= 500
+            self._samples.append((latency, status == 200))
+            self._since_change += 1
+            self._since_cut    += 1
+            if congested:
+                if self._congested():
+                    self._decrease()
+            elif self._since_change >= self.window and self._healthy():
+                self._increase()
+
+    def abandon(self) -> None:
+        """Frees the slot of a cancelled request without recording an outcome."""
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._wake()
+
+    @property
+    def max_rate(self) -> float:
+        return self.max_window * self.slot_rate
+
+    @contextmanager
+    def capped(self, ceiling: int):
+        """
+        Caps the window at `ceiling` for one run; the previous max_window comes back after.
+        The run starts at the ceiling unless the controller backed off within the last
+        `recovery` seconds, in which case it keeps what it learned.
+        """
+        with self._lock:
+            previous        = self.max_window
+            self.max_window = ceiling
+            recent = self._last_decrease is not None and time.monotonic() - self._last_decrease < self.recovery
+            if recent:
+                self.window = min(self.window, ceiling)
+                self.rate   = min(self.rate, self.max_rate)
+            else:
+                self.window = ceiling
+                self.rate   = self.max_rate
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self.max_window = previous
+
+    def _wake(self) -> None:
+        # Every parked acquire() re-checks the window; the futures may belong to
+        # another thread's event loop, hence call_soon_threadsafe
+        waiters, self._waiters = self._waiters, []
+        for loop, waiter in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._resolve, waiter)
+
+    @staticmethod
+    def _resolve(waiter) -> None:
+        if not waiter.done():
+            waiter.set_result(None)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # AIMD
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _healthy(self) -> bool:
+        if len(self._samples) < min(self.min_samples, self._samples.maxlen):
+            return False
+        p95, ok_rate = self._stats()
+        return p95 <= self.target_p95 and ok_rate >= self.min_success
+
+    def _congested(self) -> bool:
+        # Judged on the outcomes since the last cut only: the ones before it were
+        # already acted on, and they would otherwise cut again on every cool-down
+        recent = min(self._since_cut, len(self._samples))
+        if recent < min(self.min_samples, self._samples.maxlen):
+            return False
+        errors = sum(1 for i in range(1, recent + 1) if not self._samples[-i][1])
+        return errors / recent > 1 - self.min_success
+
+    def _increase(self) -> None:
+        self.window = min(self.max_window, self.window + self.window_step)
+        self.rate   = min(self.max_rate, self.rate + self.window_step * self.slot_rate)
+        self._since_change = 0
+        self.increases += 1
+        self._wake()
+
+    def _decrease(self) -> None:
+        # Requests already in flight when we backed off report the same congestion;
+        # only cut once per cool-down so a burst of 503s doesn't collapse to the floor.
+        now = time.monotonic()
+        p95, _ = self._stats()
+        if self._last_decrease is not None and now - self._last_decrease < max(1.0, p95):
+            return
+        self.window = max(self.min_window, int(self.window * self.backoff))
+        self.rate   = max(self.min_rate, self.rate * self.backoff)
+        self._since_change  = 0
+        self._since_cut     = 0
+        self._last_decrease = now
+        self.decreases += 1
+
+    def _stats(self) -> tuple:
+        if not self._samples:
+            return 0.0, 1.0
+        # Timeouts and dropped connections have no latency; they count as failures only
+        latencies = sorted(lat for lat, _ in self._samples if lat is not None)
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else 0.0
+        ok_rate = sum(1 for _, ok in self._samples if ok) / len(self._samples)
+        return p95, ok_rate
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            p95, ok_rate = self._stats()
+            return {
+                "window":       self.window,
+                "max_window":   self.max_window,
+                "rate":         round(self.rate, 2),
+                "in_flight":    self.in_flight,
+                "p95_ms":       round(p95 * 1000),
+                "success_rate": round(ok_rate * 100, 1),
+                "increases":    self.increases,
+                "decreases":    self.decreases,
+            }
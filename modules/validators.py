@@ -2,9 +2,25 @@
 
 import pandas as pd
 from pathlib import Path
+from typing import Iterator
+
+import openpyxl
 
 from utils import errhandler
-from helpers import find_column
+from helpers import cell_text, find_column
+from . import columnar, excel
+
+# Streaming mode (see Validator.read_chunks()): rows per chunk, and the file size from
+# which pipeline() streams the mapped columns instead of parsing the whole sheet
+CHUNK_ROWS   = 50_000
+STREAM_BYTES = 20 * 1024 * 1024
+
+# Data rows read by Validator.probe() for column checks and previews
+PREVIEW_ROWS = 8
+
+# Header names check_annotations() falls back to (see helpers.find_column)
+CASE_NUMBER_COLUMNS = ['Case Number', 'Case No', 'Case #', 'case_number', 'case no', 'case number']
+CITATION_COLUMNS    = ['Citation', 'Cit', 'Reference', 'citation', 'case name', 'case_name']
 
 class Validator:
     def __init__(
@@ -38,12 +54,26 @@ class Validator:
         print("✅ The provided file path exists")
         return True
 
-    def create_sheet(self):
+    def create_sheet(self, mapped: bool = False):
+        """
+        The whole sheet; with mapped=True only the case number and citation columns
+        are parsed (once check_annotations() has confirmed them).
+        """
+        usecols = None
+        if mapped:
+            wanted  = {str(self.case_num_column).strip(), str(self.citation_column).strip()}
+            usecols = lambda h: str(h).strip() in wanted
+
+        suffix = self.file_path.suffix.lower()
         try:
-            if self.file_path.suffix == ".xlsx":
-                sheet = pd.read_excel(self.file_path)
-            elif self.file_path.suffix == ".csv":
-                sheet = pd.read_csv(self.file_path)
+            if suffix == ".xlsx":
+                sheet = excel.read_excel(self.file_path, usecols=usecols)
+            elif suffix == ".csv":
+                sheet = pd.read_csv(self.file_path, usecols=usecols)
+            elif columnar.is_columnar(self.file_path):
+                # Memory-mapped, and projected onto the mapped columns when asked
+                names = columnar.resolve(self.file_path, [self.case_num_column, self.citation_column]) if mapped else {}
+                sheet = columnar.read(self.file_path, list(dict.fromkeys(names.values())) or None)
             else:
                 print(f"❌ Unsupported file format: {self.file_path.suffix}")
                 return None
@@ -56,14 +86,109 @@ class Validator:
             print(f"✅ A sheet has been parsed for the uploaded {self.file_path.suffix.upper()} document")
             return sheet
 
+    def probe(self, rows: int = PREVIEW_ROWS):
+        """
+        The header and first `rows` data rows only: enough to resolve columns
+        (check_annotations()) and show a preview, without parsing the rest of the file.
+        """
+        suffix = self.file_path.suffix.lower()
+        try:
+            if suffix == ".xlsx":
+                book = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+                try:
+                    cells  = self._worksheet(book).iter_rows(max_row=rows + 1, values_only=True)
+                    header = next(cells, ())
+                    data   = [list(r) for r in cells]
+                finally:
+                    book.close()
+                columns = self._columns(header)
+                return pd.DataFrame([(r + [None] * len(columns))[:len(columns)] for r in data], columns=columns)
+            if suffix == ".csv":
+                return pd.read_csv(self.file_path, nrows=rows)
+            if columnar.is_columnar(self.file_path):
+                return columnar.head(self.file_path, rows)
+            print(f"❌ Unsupported file format: {self.file_path.suffix}")
+            return None
+
+        except Exception as e:
+            errhandler(e, log="probe", path="validator")
+            return None
+
+    def read_chunks(self, chunksize: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+        """
+        Streaming mode: the case number and citation columns only, in frames of
+        `chunksize` rows (as text for CSV / XLSX; Arrow files keep their column types).
+        Row labels run on across chunks (0 = first data row), as they would in the
+        full sheet, so Scanner's excel_row numbers come out the same.
+        Memory stays at one chunk whatever the file size.
+        """
+        # Frame column → header text it is read from (headers compare stripped, as in check_annotations)
+        keys   = {c: str(c).strip() for c in (self.case_num_column, self.citation_column)}
+        suffix = self.file_path.suffix.lower()
+
+        if suffix == ".csv":
+            wanted = set(keys.values())
+            for chunk in pd.read_csv(self.file_path, usecols=lambda h: str(h).strip() in wanted, dtype=str, chunksize=chunksize):
+                chunk.columns = [str(h).strip() for h in chunk.columns]
+                yield pd.DataFrame({c: chunk[k] for c, k in keys.items()})
+            return
+        if columnar.is_columnar(self.file_path):
+            names = columnar.resolve(self.file_path, list(keys))
+            for chunk in columnar.read_chunks(self.file_path, list(dict.fromkeys(names.values())), chunksize):
+                yield pd.DataFrame({c: chunk[n] for c, n in names.items()})
+            return
+        if suffix != ".xlsx":
+            raise ValueError(f"Unsupported file format: {self.file_path.suffix}")
+
+        book = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            rows   = self._worksheet(book).iter_rows(values_only=True)
+            header = [str(v).strip() for v in self._columns(next(rows, ()))]
+            for k in keys.values():
+                if k not in header:
+                    raise KeyError(k)
+            picks  = [header.index(k) for k in keys.values()]
+
+            start, chunk = 0, []
+            for row in rows:
+                chunk.append([self._text(row[i]) if i < len(row) else None for i in picks])
+                if len(chunk) == chunksize:
+                    yield pd.DataFrame(chunk, columns=list(keys), index=range(start, start + len(chunk)), dtype=object)
+                    start, chunk = start + len(chunk), []
+            if chunk:
+                yield pd.DataFrame(chunk, columns=list(keys), index=range(start, start + len(chunk)), dtype=object)
+        finally:
+            book.close()
+
+    @staticmethod
+    def _worksheet(book):
+        # The first sheet, as pd.read_excel reads by default; read-only dimensions can
+        # be stale, so let openpyxl find the real extent
+        sheet = book.worksheets[0]
+        sheet.reset_dimensions()
+        return sheet
+
+    @staticmethod
+    def _columns(header):
+        # Blank header cells get pandas' "Unnamed: i" names, in the preview and when streaming
+        return [f"Unnamed: {i}" if v is None else v for i, v in enumerate(header)]
+
+    @staticmethod
+    def _text(value):
+        # As Scanner would render the cell from a pd.read_excel() frame (see cell_text)
+        return None if value is None else cell_text(value)
+
     def check_annotations(
         self,
         sheet = None
     ) -> bool:
         """
         Function to check if file has relevant keywords
+        Only the header is looked at; without a sheet it is probed from the file.
         """
 
+        if sheet is None:
+            sheet = self.probe(rows=0)
         if sheet is None:
             return None
 
@@ -71,7 +196,7 @@ class Validator:
         sheet_columns = [str(col).strip() for col in sheet.columns]
 
         if self.case_num_column not in sheet_columns:
-            found = find_column(sheet, ['Case Number', 'Case No', 'Case #', 'case_number', 'case no', 'case number'])
+            found = find_column(sheet, CASE_NUMBER_COLUMNS)
             if found:
                 print(f"⚠️ User column '{self.case_num_column}' not found. Auto-detected '{found}'.")
                 self.case_num_column = found
@@ -81,7 +206,7 @@ class Validator:
                 return False
 
         if self.citation_column not in sheet_columns:
-            found = find_column(sheet, ['Citation', 'Cit', 'Reference', 'citation', 'case name', 'case_name'])
+            found = find_column(sheet, CITATION_COLUMNS)
             if found:
                 print(f"⚠️ User column '{self.citation_column}' not found. Auto-detected '{found}'.")
                 self.citation_column = found
@@ -4,6 +4,8 @@ import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
 
+from modules import columnar, excel
+
 def get_historical_stats():
     """Reads all saved reports to aggregate historical all-time data."""
     rdir = Path("reports")
@@ -15,10 +17,12 @@ def get_historical_stats():
     for file in rdir.iterdir():
         try:
             # We only read the 'Status' column to keep the dashboard lightning fast
-            if file.suffix == '.xlsx':
-                df = pd.read_excel(file, usecols=['Status'])
-            elif file.suffix == '.csv':
+            if file.suffix.lower() == '.xlsx':
+                df = excel.read_excel(file, usecols=['Status'])
+            elif file.suffix.lower() == '.csv':
                 df = pd.read_csv(file, usecols=['Status'])
+            elif columnar.is_columnar(file):
+                df = columnar.read(file, usecols=['Status'])
             else:
                 continue
 
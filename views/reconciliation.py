@@ -1,69 +1,25 @@
 import os
 import tempfile
 import traceback
-import concurrent.futures
 from pathlib import Path
 from datetime import datetime
-import urllib.parse
-import json
 
 import streamlit as st
 import pandas as pd
 
-from modules import Scanner
+from modules import RunJournal, Scanner, Validator, columnar
+from modules.validators import CASE_NUMBER_COLUMNS, CITATION_COLUMNS
+from helpers import find_column
 from utils import errhandler
 from assets.ui import step_bar
 
 
-def parallel_extract(scrapper, file_data, workers=8):
-    import json as _json
+def parallel_extract(scrapper, file_data, workers=8, on_result=None):
+    return scrapper.extract(file_data, concurrency=workers, on_result=on_result)
 
-    ajax_hdrs = {
-        "X-Requested-With": "XMLHttpRequest",
-        "Content-Type": "application/x-www-form-urlencoded",
-        "Referer": "https://ilaw.kra.go.ke/ilaw/search/universal",
-    }
-    payload = {"dataType": "litigation_data"}
 
-    def fetch_one(item):
-        try:
-            resp = scrapper.session.post(
-                f"{scrapper.url}{urllib.parse.quote(item['keyword'])}",
-                data=payload,
-                headers=ajax_hdrs,
-                timeout=30,
-            )
-            if resp.status_code != 200:
-                return scrapper._empty_result(item)
-            try:
-                jd = resp.json()
-            except _json.JSONDecodeError:
-                return scrapper._empty_result(item)
-            html = jd.get('html', '')
-            if not html:
-                return {**scrapper._empty_result(item), 'matches': [], 'matches_found': 0}
-            matches = scrapper._parse_results(html)
-            return {
-                "excel_row": item.get('excel_row'),
-                "original_case": item['case_number'],
-                "case_name": item['citation'],
-                "search_keyword": item['keyword'],
-                "matches_found": len(matches),
-                "matches": matches,
-            }
-        except Exception:
-            return scrapper._empty_result(item)
-
-    results = [None] * len(file_data)
-    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
-        futures = {pool.submit(fetch_one, item): i for i, item in enumerate(file_data)}
-        for fut in concurrent.futures.as_completed(futures):
-            idx = futures[fut]
-            try:
-                results[idx] = fut.result()
-            except Exception:
-                results[idx] = scrapper._empty_result(file_data[idx])
-    return results
+def stream_reconcile(scrapper, file_data, workers=8, journal=None):
+    yield from scrapper.stream(file_data, concurrency=workers, journal=journal)
 
 
 def reconciliation_page():
@@ -74,20 +30,21 @@ def reconciliation_page():
     if current == 1:
         st.markdown("<div class='card'>", unsafe_allow_html=True)
         st.markdown("<h2>Upload Case File</h2>", unsafe_allow_html=True)
-        st.markdown("<p style='color:#8a9099;font-size:.88rem;'>Upload your Excel or CSV containing case numbers and citations.</p>", unsafe_allow_html=True)
-        uploaded = st.file_uploader("File", type=['csv', 'xlsx'], label_visibility="hidden")
+        st.markdown("<p style='color:#8a9099;font-size:.88rem;'>Upload your Excel, CSV or Parquet / Feather file containing case numbers and citations.</p>", unsafe_allow_html=True)
+        uploaded = st.file_uploader("File", type=['csv', 'xlsx', 'parquet', 'feather', 'arrow'], label_visibility="hidden")
         if uploaded:
             with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded.name).suffix) as tmp:
                 tmp.write(uploaded.getvalue())
                 st.session_state.temp_file_path = tmp.name
-            try:
-                df = pd.read_csv(uploaded) if uploaded.name.endswith('.csv') else pd.read_excel(uploaded)
+            # Header + a few preview rows only; step 3 streams the mapped columns from the saved file
+            df = Validator(st.session_state.temp_file_path).probe()
+            if df is not None:
                 st.session_state.uploaded_df = df
                 st.session_state.uploaded_file_name = uploaded.name
-                st.success(f"Loaded **{uploaded.name}** \u2014 {len(df):,} rows \u00d7 {len(df.columns)} columns")
-                st.dataframe(df.head(8), use_container_width=True, height=260)
-            except Exception as e:
-                st.error(f"Error reading file: {e}")
+                st.success(f"Loaded **{uploaded.name}** \u2014 {len(df.columns)} columns")
+                st.dataframe(df, use_container_width=True, height=260)
+            else:
+                st.error("Error reading file: it could not be parsed as CSV, XLSX, Parquet or Feather.")
         _, cc, _ = st.columns([2, 1, 2])
         with cc:
             st.markdown('<div class="btn-primary">', unsafe_allow_html=True)
@@ -97,16 +54,36 @@ def reconciliation_page():
             st.markdown('</div>', unsafe_allow_html=True)
         st.markdown("</div>", unsafe_allow_html=True)
 
+        unfinished = RunJournal.list_runs()
+        if unfinished:
+            st.markdown("<div class='card'>", unsafe_allow_html=True)
+            st.markdown("<h2>Interrupted Runs</h2>", unsafe_allow_html=True)
+            st.markdown("<p style='color:#8a9099;font-size:.88rem;'>Pick up where a previous run stopped — rows already searched are not sent to iLaw again.</p>", unsafe_allow_html=True)
+            labels = {
+                f"{r['meta'].get('file_name') or r['run_id']} · {r['done']}/{r['meta'].get('total', '?')} searched · {r['meta'].get('created', '')}": r['run_id']
+                for r in unfinished
+            }
+            choice = st.selectbox("Run", list(labels), label_visibility="collapsed")
+            if st.button("↻ Resume Run", use_container_width=True):
+                st.session_state.resume_run_id = labels[choice]
+                st.session_state.reconciled_data = None
+                st.session_state.step = 3
+                st.rerun()
+            st.markdown("</div>", unsafe_allow_html=True)
+
     elif current == 2:
         st.markdown("<div class='card'>", unsafe_allow_html=True)
         st.markdown("<h2>Column Mapping</h2>", unsafe_allow_html=True)
         df = st.session_state.uploaded_df
         cols = df.columns.tolist()
+        # Preselect the columns check_annotations() would auto-detect
+        guess = [find_column(df, names) for names in (CASE_NUMBER_COLUMNS, CITATION_COLUMNS)]
+        index = [cols.index(g) + 1 if g is not None else 0 for g in guess]
         c1, c2 = st.columns(2)
         with c1:
-            cn_col = st.selectbox("Case Number Column", ['-- select --'] + cols)
+            cn_col = st.selectbox("Case Number Column", ['-- select --'] + cols, index=index[0])
         with c2:
-            cit_col = st.selectbox("Citation Column", ['-- select --'] + cols)
+            cit_col = st.selectbox("Citation Column", ['-- select --'] + cols, index=index[1])
         bc1, _, bc3 = st.columns([1, 1, 1])
         with bc1:
             if st.button("\u2190 Back", use_container_width=True):
@@ -143,24 +120,63 @@ def reconciliation_page():
             try:
                 msg.markdown("<span style='color:#c8a84b'>⧡ Extracting records from file…</span>", unsafe_allow_html=True)
                 pb.progress(5)
-                scanner = Scanner(case_num_column=st.session_state.case_num_col, citation_column=st.session_state.citation_col)
-                file_data = scanner.file_extractor(sheet=st.session_state.uploaded_df)
+                resume_id = st.session_state.pop('resume_run_id', None)
+                journal = RunJournal.open(resume_id) if resume_id else None
+                if journal:
+                    # Resumed runs carry their own records; the original upload may be gone
+                    file_data = journal.items
+                    if os.path.exists(journal.meta.get('file_path', '')):
+                        st.session_state.temp_file_path = journal.meta['file_path']
+                elif os.path.exists(st.session_state.get('temp_file_path') or ''):
+                    # Stream just the two mapped columns from the saved upload
+                    validate = Validator(st.session_state.temp_file_path, st.session_state.case_num_col, st.session_state.citation_col)
+                    scanner = Scanner(case_num_column=validate.case_num_column, citation_column=validate.citation_column)
+                    file_data = scanner.stream_extractor(validate.read_chunks())
+                else:
+                    # uploaded_df is only the step 1 preview; the full sheet lives in the saved upload
+                    file_data = None
                 if not file_data:
-                    st.error("No data extracted.")
+                    st.error("No data extracted." if file_data is not None else "The uploaded file is no longer available. Please upload it again.")
                     st.markdown("</div>", unsafe_allow_html=True)
                     return
+                if journal is None:
+                    journal = RunJournal.create(
+                        file_data,
+                        file_path=st.session_state.get('temp_file_path', ''),
+                        file_name=st.session_state.get('uploaded_file_name', ''),
+                    )
                 sub.markdown(f"<span style='color:#8a9099;font-size:.85rem;'>→ {len(file_data)} records</span>", unsafe_allow_html=True)
 
                 pb.progress(15)
-                msg.markdown(f"<span style='color:#c8a84b'>⧡ Searching KRA iLaw ({workers} parallel workers)…</span>", unsafe_allow_html=True)
+                msg.markdown(f"<span style='color:#c8a84b'>⧡ Searching & scoring against KRA iLaw (up to {workers} concurrent requests)…</span>", unsafe_allow_html=True)
                 st.session_state.scrapper.data = file_data
-                extracted = parallel_extract(st.session_state.scrapper, file_data, workers=workers)
+                st.session_state.scrapper.scoring = st.session_state.get('scoring', 'ratio')
+                throttle = st.session_state.scrapper.throttle
+                cache = st.session_state.scrapper.cache
+                hits_before = cache.hits if cache else 0
+
+                # Each row is scored as soon as its search returns
+                reconciled = []
+                counts = {}
+                for row in stream_reconcile(st.session_state.scrapper, file_data, workers=workers, journal=journal):
+                    reconciled.append(row)
+                    counts[row['status']] = counts.get(row['status'], 0) + 1
+                    pb.progress(15 + int(80 * len(reconciled) / len(file_data)))
+                    ts = throttle.snapshot()
+                    cache_note = f" · {cache.hits - hits_before} from cache" if cache else ""
+                    sub.markdown(
+                        f"<span style='color:#8a9099;font-size:.85rem;'>→ {len(reconciled)}/{len(file_data)} reconciled{cache_note} · "
+                        f"{counts.get('VERIFIED MATCH', 0)} verified · window {ts['window']} · {ts['rate']} req/s · p95 {ts['p95_ms']} ms</span>",
+                        unsafe_allow_html=True,
+                    )
 
-                pb.progress(72)
-                sub.markdown(f"<span style='color:#8a9099;font-size:.85rem;'>→ {len(extracted)} records searched</span>", unsafe_allow_html=True)
+                if st.session_state.scrapper.sessions.failed:
+                    st.warning(f"KRA iLaw session expired and could not be renewed — only {len(reconciled)} of {len(file_data)} records were searched. Sign in again and resume run {journal.run_id} to process the rest.")
+                elif st.session_state.scrapper.failed_searches:
+                    st.warning(f"{st.session_state.scrapper.failed_searches} searches failed (timeouts or server errors) and show as NOT FOUND. Resume run {journal.run_id} to retry them.")
 
-                msg.markdown("<span style='color:#c8a84b'>⧡ Comparing & scoring…</span>", unsafe_allow_html=True)
-                reconciled = st.session_state.scrapper.comparator(extracted_data=extracted)
+                reconciled.sort(key=lambda r: r.get('excel_row') or 0)
+                st.session_state.scrapper.print_summary(reconciled)
 
                 # Saving the data
                 st.session_state.reconciled_data = reconciled
@@ -230,7 +246,7 @@ def reconciliation_page():
 
         st.dataframe(df_res.style.apply(color_status, subset=['Status'], axis=0), use_container_width=True, height=420)
 
-        ec1, ec2, ec3 = st.columns(3)
+        ec1, ec2, ec4, ec3 = st.columns(4)
         with ec1:
             st.markdown('<div class="btn-primary">', unsafe_allow_html=True)
             if st.button("⬇ Download PDF Report", use_container_width=True):
@@ -258,6 +274,13 @@ def reconciliation_page():
                 file_name=f"reconciliation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv", use_container_width=True,
             )
+        with ec4:
+            # Full, typed rows (not the truncated table above) for analytics tools
+            st.download_button(
+                "⬇ Export Parquet", columnar.to_bytes(columnar.results_frame(data)),
+                file_name=f"reconciliation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet",
+                mime="application/vnd.apache.parquet", use_container_width=True,
+            )
         with ec3:
             if st.button("⊕ New Reconciliation", use_container_width=True):
                 st.session_state.step = 1
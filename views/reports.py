@@ -8,7 +8,7 @@ def reports_page():
     st.markdown("<h1>Reports</h1>", unsafe_allow_html=True)
     rdir = Path("reports")
     rdir.mkdir(exist_ok=True)
-    files = sorted(list(rdir.glob("*.xlsx")) + list(rdir.glob("*.csv")), key=lambda f: f.stat().st_mtime, reverse=True)
+    files = sorted((f for f in rdir.iterdir() if f.suffix.lower() in ('.xlsx', '.csv', '.parquet', '.feather')), key=lambda f: f.stat().st_mtime, reverse=True)
     if not files:
         st.markdown("<div class='card'><p style='color:#8a9099;text-align:center;padding:3rem 0;'>No reports yet. Complete a reconciliation first.</p></div>", unsafe_allow_html=True)
         return
@@ -19,7 +19,10 @@ def reports_page():
         sel = st.selectbox("Report", [f.name for f in files], label_visibility="hidden")
     with rc2:
         rp = rdir / sel
-        mime = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet" if sel.endswith('.xlsx') else "text/csv"
+        mime = {
+            '.xlsx': "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            '.csv':  "text/csv",
+        }.get(rp.suffix.lower(), "application/octet-stream")
         with open(rp, 'rb') as fh:
             st.download_button("\u2b07 Download", fh.read(), file_name=sel, mime=mime, use_container_width=True)
     if st.button("\U0001f5d1 Clear All Reports", use_container_width=True):
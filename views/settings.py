@@ -4,9 +4,17 @@ from bs4 import BeautifulSoup
 import streamlit as st
 import pandas as pd
 
+from modules.batch import STRATEGIES
 from modules.scrapper import Scrapper
 
 
+def _rate_summary(scrapper) -> str:
+    if not scrapper:
+        return "\u2014"
+    ts = scrapper.throttle.snapshot()
+    return f"{ts['window']} in flight \u00b7 {ts['rate']} req/s"
+
+
 def settings_page():
     st.markdown("<h1>Settings</h1>", unsafe_allow_html=True)
     sc1, sc2 = st.columns(2)
@@ -103,11 +111,26 @@ def settings_page():
 
         st.markdown("<div class='card'>", unsafe_allow_html=True)
         st.markdown("<h3>\u26a1 Processing Speed</h3>", unsafe_allow_html=True)
-        st.markdown("<p style='color:#8a9099;font-size:.83rem;'>More workers = faster processing. Keep below 15 to avoid rate-limiting KRA servers.</p>", unsafe_allow_html=True)
-        w = st.slider("Parallel Workers", 1, 20, st.session_state.get('workers', 8))
+        st.markdown("<p style='color:#8a9099;font-size:.83rem;'>Upper limit on concurrent requests. Each run starts at it; the rate controller backs off while errors or timeouts pile up and climbs back as KRA iLaw recovers.</p>", unsafe_allow_html=True)
+        w = st.slider("Max Concurrent Requests", 1, 64, st.session_state.get('workers', 8))
         if st.button("Save", use_container_width=True):
             st.session_state.workers = w
-            st.success(f"Set to {w} workers.")
+            st.success(f"Set to {w} concurrent requests.")
+        st.markdown("<p style='color:#8a9099;font-size:.83rem;margin-top:.6rem;'>Scoring strategy. <b>ratio</b> compares each citation on its own; <b>tfidf</b> weights words by how rare they are across the uploaded sheet.</p>", unsafe_allow_html=True)
+        scoring = st.selectbox("Scoring Strategy", STRATEGIES, index=STRATEGIES.index(st.session_state.get('scoring', 'ratio')))
+        if st.button("Save Strategy", use_container_width=True):
+            st.session_state.scoring = scoring
+            st.success(f"Scoring with {scoring}.")
+        # Read again: a successful "Update & Test" above replaces the scrapper
+        cur = st.session_state.scrapper
+        if cur is not None:
+            rc = cur.throttle.snapshot()
+            st.markdown(
+                f"<p style='color:#8a9099;font-size:.8rem;margin-top:.6rem;'>Current window <b>{rc['window']}</b> · "
+                f"<b>{rc['rate']}</b> req/s · p95 {rc['p95_ms']} ms · {rc['success_rate']}% OK · "
+                f"{rc['increases']} increases / {rc['decreases']} backoffs</p>",
+                unsafe_allow_html=True,
+            )
         st.markdown("</div>", unsafe_allow_html=True)
 
     with sc2:
@@ -118,6 +141,32 @@ def settings_page():
         st.checkbox("Include Confidence Score", value=True)
         st.markdown("</div>", unsafe_allow_html=True)
 
+        st.markdown("<div class='card'>", unsafe_allow_html=True)
+        st.markdown("<h3>💾 Search Cache</h3>", unsafe_allow_html=True)
+        cache = st.session_state.scrapper.cache if st.session_state.scrapper else None
+        if cache is None:
+            st.markdown("<p style='color:#8a9099;font-size:.83rem;'>Connect to KRA iLaw to manage the search cache.</p>", unsafe_allow_html=True)
+        else:
+            cs = cache.stats()
+            st.markdown(
+                f"<p style='color:#8a9099;font-size:.83rem;'>{cs['entries']:,} entries · {cs['bytes']/1024/1024:.1f} MB · "
+                f"{cs['hits']:,} hits / {cs['misses']:,} misses ({cs['hit_rate']}%)</p>",
+                unsafe_allow_html=True,
+            )
+            ttl_h = st.number_input("Expiry (hours)", 1, 24 * 90, int(cache.ttl // 3600))
+            cap_mb = st.number_input("Size limit (MB)", 1, 4096, int(cache.max_bytes // (1024 * 1024)))
+            cc1, cc2 = st.columns(2)
+            with cc1:
+                if st.button("Save Cache Settings", use_container_width=True):
+                    cache.ttl = ttl_h * 3600
+                    cache.max_bytes = cap_mb * 1024 * 1024
+                    st.success("Cache settings saved.")
+            with cc2:
+                if st.button("Clear Cache", use_container_width=True):
+                    cache.clear()
+                    st.success("Cache cleared.")
+        st.markdown("</div>", unsafe_allow_html=True)
+
         st.markdown("<div class='card'>", unsafe_allow_html=True)
         st.markdown("<h3>System Info</h3>", unsafe_allow_html=True)
         import streamlit as _st
@@ -128,7 +177,8 @@ def settings_page():
             f"""<table style='width:100%;font-size:.82rem;color:#8a9099;border-collapse:collapse;'>
           <tr><td style='padding:5px 0;color:#dde1e7;'>Version</td><td>2.1.0</td></tr>
           <tr><td style='padding:5px 0;color:#dde1e7;'>KRA Status</td><td style='color:{"#7ec89b" if sc else "#c25f5f"}'>{"\u25cf Connected" if sc else "\u25cf Disconnected"}</td></tr>
-          <tr><td style='padding:5px 0;color:#dde1e7;'>Workers</td><td>{st.session_state.get("workers", 8)}</td></tr>
+          <tr><td style='padding:5px 0;color:#dde1e7;'>Max Concurrency</td><td>{st.session_state.get("workers", 8)}</td></tr>
+          <tr><td style='padding:5px 0;color:#dde1e7;'>Rate Window</td><td>{_rate_summary(st.session_state.scrapper)}</td></tr>
           <tr><td style='padding:5px 0;color:#dde1e7;'>Python</td><td>{sys.version.split()[0]}</td></tr>
           <tr><td style='padding:5px 0;color:#dde1e7;'>Streamlit</td><td>{_st.__version__}</td></tr>
           <tr><td style='padding:5px 0;color:#dde1e7;'>Pandas</td><td>{_pd.__version__}</td></tr>
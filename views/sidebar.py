@@ -52,6 +52,9 @@ def sidebar_nav():
             )
 
             if st.button("Sign Out", use_container_width=True):
+                sc = st.session_state.scrapper
+                if sc and sc.session_store:
+                    sc.session_store.clear(sc.username)
                 if "sid" in st.session_state:
                     store = get_session_store()
                     store.pop(st.session_state["sid"], None)